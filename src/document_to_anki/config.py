@@ -1,8 +1,11 @@
 """Configuration management for Document to Anki CLI application."""
 
+import functools
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -23,7 +26,7 @@ class LanguageValidationError(Exception):
         super().__init__(f"Unsupported language '{language}'. Supported languages: {', '.join(supported_languages)}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LanguageInfo:
     """Language information structure."""
 
@@ -32,6 +35,14 @@ class LanguageInfo:
     prompt_key: str  # Internal key for prompt templates
 
 
+def _build_alias_index(languages: dict[str, dict[str, str]]) -> dict[str, LanguageInfo]:
+    """Map every language alias to a shared LanguageInfo, interned per language code."""
+    interned: dict[str, LanguageInfo] = {}
+    return {
+        key: interned.setdefault(lang_data["code"], LanguageInfo(**lang_data)) for key, lang_data in languages.items()
+    }
+
+
 class LanguageConfig:
     """Handles language configuration and validation."""
 
@@ -46,6 +57,15 @@ class LanguageConfig:
         "de": {"code": "de", "name": "German", "prompt_key": "german"},
     }
 
+    # Flat alias -> LanguageInfo index built once at import so every lookup is a single dict probe
+    _ALIAS_INDEX: dict[str, LanguageInfo] = _build_alias_index(SUPPORTED_LANGUAGES)
+
+    # Immutable class data, so the derived listings are computed once at import
+    _SUPPORTED_LIST: tuple[str, ...] = tuple(
+        sorted({f"{lang_data['name']} ({lang_data['code']})" for lang_data in SUPPORTED_LANGUAGES.values()})
+    )
+    _ALL_KEYS: tuple[str, ...] = tuple(SUPPORTED_LANGUAGES)
+
     DEFAULT_LANGUAGE = "english"
 
     @classmethod
@@ -61,12 +81,15 @@ class LanguageConfig:
         Raises:
             LanguageValidationError: If language is not supported
         """
+        if language in cls._ALIAS_INDEX:
+            return language
+
         if not language:
             return cls.DEFAULT_LANGUAGE
 
         normalized = language.lower().strip()
 
-        if normalized not in cls.SUPPORTED_LANGUAGES:
+        if normalized not in cls._ALIAS_INDEX:
             raise LanguageValidationError(language, cls.get_supported_languages_list())
 
         return normalized
@@ -84,8 +107,7 @@ class LanguageConfig:
         if not language:
             return True  # Empty language defaults to English
 
-        normalized = language.lower().strip()
-        return normalized in cls.SUPPORTED_LANGUAGES
+        return language.lower().strip() in cls._ALIAS_INDEX
 
     @classmethod
     def get_language_name(cls, language: str) -> str:
@@ -100,8 +122,7 @@ class LanguageConfig:
         Raises:
             LanguageValidationError: If language is not supported
         """
-        normalized = cls.normalize_language(language)
-        return cls.SUPPORTED_LANGUAGES[normalized]["name"]
+        return cls.get_language_info(language).name
 
     @classmethod
     def get_language_code(cls, language: str) -> str:
@@ -116,8 +137,7 @@ class LanguageConfig:
         Raises:
             LanguageValidationError: If language is not supported
         """
-        normalized = cls.normalize_language(language)
-        return cls.SUPPORTED_LANGUAGES[normalized]["code"]
+        return cls.get_language_info(language).code
 
     @classmethod
     def get_prompt_key(cls, language: str) -> str:
@@ -132,8 +152,7 @@ class LanguageConfig:
         Raises:
             LanguageValidationError: If language is not supported
         """
-        normalized = cls.normalize_language(language)
-        return cls.SUPPORTED_LANGUAGES[normalized]["prompt_key"]
+        return cls.get_language_info(language).prompt_key
 
     @classmethod
     def get_language_info(cls, language: str) -> LanguageInfo:
@@ -148,9 +167,18 @@ class LanguageConfig:
         Raises:
             LanguageValidationError: If language is not supported
         """
-        normalized = cls.normalize_language(language)
-        lang_data = cls.SUPPORTED_LANGUAGES[normalized]
-        return LanguageInfo(code=lang_data["code"], name=lang_data["name"], prompt_key=lang_data["prompt_key"])
+        # Callers mostly pass an already-normalized key, so probe it before case-folding
+        info = cls._ALIAS_INDEX.get(language)
+        if info is not None:
+            return info
+
+        if not language:
+            return cls._ALIAS_INDEX[cls.DEFAULT_LANGUAGE]
+
+        try:
+            return cls._ALIAS_INDEX[language.lower().strip()]
+        except KeyError:
+            raise LanguageValidationError(language, cls.get_supported_languages_list()) from None
 
     @classmethod
     def get_supported_languages_list(cls) -> list[str]:
@@ -159,14 +187,7 @@ class LanguageConfig:
         Returns:
             List of supported language identifiers
         """
-        # Return unique language names and codes
-        seen = set()
-        languages = []
-        for lang_data in cls.SUPPORTED_LANGUAGES.values():
-            if lang_data["name"] not in seen:
-                languages.append(f"{lang_data['name']} ({lang_data['code']})")
-                seen.add(lang_data["name"])
-        return sorted(languages)
+        return list(cls._SUPPORTED_LIST)
 
     @classmethod
     def get_all_language_keys(cls) -> list[str]:
@@ -175,25 +196,41 @@ class LanguageConfig:
         Returns:
             List of all supported language keys
         """
-        return list(cls.SUPPORTED_LANGUAGES.keys())
+        return list(cls._ALL_KEYS)
+
+
+def _index_models_by_key(models: Mapping[str, str]) -> dict[str, tuple[str, ...]]:
+    """Map every API key to the models that require it, keeping the models' declaration order."""
+    return {
+        key: tuple(model for model, model_key in models.items() if model_key == key)
+        for key in dict.fromkeys(models.values())
+    }
 
 
 class ModelConfig:
     """Handles LLM model configuration and validation."""
 
-    SUPPORTED_MODELS: dict[str, str] = {
-        "gemini/gemini-2.5-flash": "GEMINI_API_KEY",
-        "gemini/gemini-2.5-pro": "GEMINI_API_KEY",
-        "openai/gpt-4": "OPENAI_API_KEY",
-        "openai/gpt-3.5-turbo": "OPENAI_API_KEY",
-        "openai/gpt-4.1": "OPENAI_API_KEY",
-        "openai/gpt-4.1-mini": "OPENAI_API_KEY",
-        "openai/gpt-4.1-nano": "OPENAI_API_KEY",
-        "openai/gpt-5": "OPENAI_API_KEY",
-        "openai/gpt-5-mini": "OPENAI_API_KEY",
-        "openai/gpt-5-nano": "OPENAI_API_KEY",
-        "openai/gpt-4o": "OPENAI_API_KEY",
-    }
+    SUPPORTED_MODELS: Mapping[str, str] = MappingProxyType(
+        {
+            "gemini/gemini-2.5-flash": "GEMINI_API_KEY",
+            "gemini/gemini-2.5-pro": "GEMINI_API_KEY",
+            "openai/gpt-4": "OPENAI_API_KEY",
+            "openai/gpt-3.5-turbo": "OPENAI_API_KEY",
+            "openai/gpt-4.1": "OPENAI_API_KEY",
+            "openai/gpt-4.1-mini": "OPENAI_API_KEY",
+            "openai/gpt-4.1-nano": "OPENAI_API_KEY",
+            "openai/gpt-5": "OPENAI_API_KEY",
+            "openai/gpt-5-mini": "OPENAI_API_KEY",
+            "openai/gpt-5-nano": "OPENAI_API_KEY",
+            "openai/gpt-4o": "OPENAI_API_KEY",
+        }
+    )
+
+    _API_KEY_FOR_MODEL: dict[str, str] = dict(SUPPORTED_MODELS)
+    _MODELS_BY_KEY: dict[str, tuple[str, ...]] = _index_models_by_key(SUPPORTED_MODELS)
+
+    _SUPPORTED_MODEL_IDS: tuple[str, ...] = tuple(SUPPORTED_MODELS)
+    _SUPPORTED_MODELS_SUFFIX = "Supported models: " + ", ".join(SUPPORTED_MODELS)
 
     DEFAULT_MODEL = "gemini/gemini-2.5-flash"
 
@@ -205,21 +242,21 @@ class ModelConfig:
     @classmethod
     def validate_model_config(cls, model: str) -> bool:
         """Validate that model is supported and API key is available."""
-        if model not in cls.SUPPORTED_MODELS:
+        required_key = cls._API_KEY_FOR_MODEL.get(model)
+        if required_key is None:
             return False
 
-        required_key = cls.SUPPORTED_MODELS[model]
         return os.getenv(required_key) is not None
 
     @classmethod
-    def get_supported_models(cls) -> list[str]:
-        """Return list of supported model identifiers."""
-        return list(cls.SUPPORTED_MODELS.keys())
+    def get_supported_models(cls) -> tuple[str, ...]:
+        """Return the supported model identifiers as a shared immutable tuple."""
+        return cls._SUPPORTED_MODEL_IDS
 
     @classmethod
     def get_required_api_key(cls, model: str) -> str | None:
         """Get the required API key environment variable name for a model."""
-        return cls.SUPPORTED_MODELS.get(model)
+        return cls._API_KEY_FOR_MODEL.get(model)
 
     @classmethod
     def validate_and_get_model(cls) -> str:
@@ -229,19 +266,44 @@ class ModelConfig:
             ConfigurationError: If model is invalid or API key is missing.
         """
         model = cls.get_model_from_env()
+        # Probe only the keys a supported model can require instead of scanning the whole environment
+        available_api_keys = frozenset(key for key in cls._MODELS_BY_KEY if key in os.environ)
+        return cls._resolve(model, available_api_keys)
 
-        if model not in cls.SUPPORTED_MODELS:
-            supported = ", ".join(cls.get_supported_models())
-            raise ConfigurationError(f"Unsupported model '{model}'. Supported models: {supported}")
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolve(model: str, available_api_keys: frozenset[str]) -> str:
+        """Resolve a model against the set of API keys present in the environment.
+
+        The arguments capture every environment input the validation depends on, so a
+        cached result can never go stale; failures raise and are therefore not cached.
+
+        Raises:
+            ConfigurationError: If model is invalid or API key is missing.
+        """
+        required_key = ModelConfig._API_KEY_FOR_MODEL.get(model)
+        if required_key is None:
+            raise ModelConfig._unsupported_model_error(model)
 
-        if not cls.validate_model_config(model):
-            required_key = cls.get_required_api_key(model)
-            raise ConfigurationError(
-                f"Missing API key for model '{model}'. Please set the {required_key} environment variable."
-            )
+        if required_key not in available_api_keys:
+            raise ModelConfig._missing_api_key_error(model, required_key)
 
         return model
 
+    @classmethod
+    def _unsupported_model_error(cls, model: str) -> ConfigurationError:
+        """Build the error for a model that is not in SUPPORTED_MODELS."""
+        return ConfigurationError(f"Unsupported model '{model}'. {cls._SUPPORTED_MODELS_SUFFIX}")
+
+    @classmethod
+    def _missing_api_key_error(cls, model: str, required_key: str) -> ConfigurationError:
+        """Build the error for a supported model whose API key is not set, naming every model sharing the key."""
+        models_for_key = ", ".join(cls._MODELS_BY_KEY[required_key])
+        return ConfigurationError(
+            f"Missing API key for model '{model}'. Please set the {required_key} environment variable "
+            f"(required by: {models_for_key})."
+        )
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -279,6 +341,10 @@ class Settings(BaseSettings):
     llm_max_retries: int = Field(3, alias="LLM_MAX_RETRIES")
     llm_retry_delay: float = Field(1.0, alias="LLM_RETRY_DELAY")
     llm_timeout: int = Field(30, alias="LLM_TIMEOUT")
+    llm_max_concurrency: int = Field(8, alias="LLM_MAX_CONCURRENCY")
+    llm_speculative_retries: bool = Field(False, alias="LLM_SPECULATIVE_RETRIES")
+    llm_response_cache: bool = Field(False, alias="LLM_RESPONSE_CACHE")
+    llm_chunk_batch_size: int = Field(1, alias="LLM_CHUNK_BATCH_SIZE")
 
     # File Processing Settings
     supported_extensions: str = Field(".pdf,.docx,.txt,.md", alias="SUPPORTED_EXTENSIONS")
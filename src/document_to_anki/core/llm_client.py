@@ -7,14 +7,21 @@ including Gemini, OpenAI, and others based on environment configuration.
 """
 
 import asyncio
+import bisect
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import re
+import string
+import threading
 from dataclasses import dataclass
 from typing import Any
 
 from loguru import logger
 
-from ..config import ConfigurationError, LanguageConfig, LanguageInfo, LanguageValidationError, ModelConfig
+from ..config import LanguageConfig, LanguageInfo, LanguageValidationError, ModelConfig
 from .prompt_templates import PromptTemplates
 
 try:
@@ -23,8 +30,205 @@ except ImportError:
     logger.error("litellm is required but not installed. Please install it with: pip install litellm")
     raise
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ORJSON = False
+
+# Decoder for LLM JSON responses: orjson parses in C when installed. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so the malformed-response handling below covers both decoders.
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Backoff sleep, aliased so tests can skip the delays without patching the shared asyncio module
+_sleep = asyncio.sleep
+
+# Response-parsing patterns, compiled once at import instead of on every parsed response
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_CODE_FENCE_OPEN_RE = re.compile(r"```json\s*")
+_CODE_FENCE_CLOSE_RE = re.compile(r"```\s*$")
+_TRAILING_COMMA_OBJECT_RE = re.compile(r",\s*}")
+_TRAILING_COMMA_ARRAY_RE = re.compile(r",\s*]")
+_ADJACENT_OBJECTS_RE = re.compile(r"}\s*{")
+_FALLBACK_JSON_OBJECT_RE = re.compile(
+    r'\{\s*"question"\s*:\s*"([^"]+)"\s*,\s*"answer"\s*:\s*"([^"]+)"\s*,\s*"card_type"\s*:\s*"([^"]+)"\s*\}',
+    re.DOTALL | re.IGNORECASE,
+)
+_FALLBACK_QA_PATTERNS: tuple[re.Pattern[str], ...] = tuple(
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r"Q:\s*(.+?)\s*A:\s*(.+?)(?=Q:|$)",
+        r"Question:\s*(.+?)\s*Answer:\s*(.+?)(?=Question:|$)",
+        r"\d+\.\s*(.+?)\s*-\s*(.+?)(?=\d+\.|$)",
+        r'"question":\s*"([^"]+)"\s*,\s*"answer":\s*"([^"]+)"',
+    )
+)
+
+
+def _compile_language_patterns(*patterns: str) -> tuple[re.Pattern[str], ...]:
+    """Compile one language's keyword patterns for case-insensitive searching."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+# Language validation patterns keyed by LanguageInfo.prompt_key, compiled once at import
+_LANGUAGE_PATTERNS: dict[str, tuple[re.Pattern[str], ...]] = {
+    "english": _compile_language_patterns(
+        # Common articles, prepositions, and conjunctions
+        r"\b(the|and|or|is|are|was|were|have|has|had|will|would|can|could|should|may|might)\b",
+        # Question words
+        r"\b(what|when|where|why|how|who|which)\b",
+        # Demonstratives and pronouns
+        r"\b(this|that|these|those|it|they|them|their|there)\b",
+        # Common verbs
+        r"\b(do|does|did|get|got|make|made|take|took|come|came|go|went)\b",
+        # English-specific patterns
+        r"\b(of|to|in|for|with|by|from|up|about|into|through|during)\b",
+    ),
+    "french": _compile_language_patterns(
+        # Articles and basic words
+        r"\b(le|la|les|un|une|des|et|ou|est|sont|était|étaient|avoir|être)\b",
+        # Question words
+        r"\b(quel|quelle|quels|quelles|qui|que|quoi|où|quand|comment|pourquoi)\b",
+        # Demonstratives and pronouns
+        r"\b(ce|cette|ces|ceux|celles|il|elle|ils|elles|leur|leurs)\b",
+        # Prepositions and conjunctions
+        r"\b(dans|sur|avec|pour|par|de|du|des|à|au|aux|mais|donc|car|si)\b",
+        # French-specific patterns
+        r"\b(très|plus|moins|bien|mal|tout|tous|toute|toutes|même|déjà)\b",
+    ),
+    "italian": _compile_language_patterns(
+        # Articles and basic words
+        r"\b(il|la|lo|gli|le|un|una|e|o|è|sono|era|erano|avere|essere)\b",
+        # Question words
+        r"\b(che|chi|cosa|dove|quando|come|perché|quale|quali|quanto|quanta)\b",
+        # Demonstratives and pronouns
+        r"\b(questo|questa|questi|queste|quello|quella|quelli|quelle|loro)\b",
+        # Prepositions and conjunctions
+        r"\b(in|su|con|per|da|di|del|della|dei|delle|ma|però|anche|già)\b",
+        # Italian-specific patterns
+        r"\b(molto|più|meno|bene|male|tutto|tutti|tutta|tutte|stesso|stessa)\b",
+    ),
+    "german": _compile_language_patterns(
+        # Articles and basic words
+        r"\b(der|die|das|ein|eine|und|oder|ist|sind|war|waren|haben|sein)\b",
+        # Question words
+        r"\b(was|wer|wo|wann|wie|warum|welche|welcher|welches|wieviel)\b",
+        # Demonstratives and pronouns
+        r"\b(dieser|diese|dieses|jener|jene|jenes|sie|ihr|ihre|ihren)\b",
+        # Prepositions and conjunctions
+        r"\b(in|auf|mit|für|von|zu|bei|nach|über|unter|aber|doch|auch|schon)\b",
+        # German-specific patterns
+        r"\b(sehr|mehr|weniger|gut|schlecht|alle|alles|ganz|noch|nicht)\b",
+    ),
+}
+
+# Letters each language's flashcards are written with, keyed like _LANGUAGE_PATTERNS. Letters outside this
+# set (other scripts, or accents foreign to the language) feed the script pre-check of language validation.
+_NATIVE_LETTERS: dict[str, frozenset[str]] = {
+    "english": frozenset(string.ascii_lowercase),
+    "french": frozenset(string.ascii_lowercase + "àâæçéèêëîïôœùûüÿ"),
+    "italian": frozenset(string.ascii_lowercase + "àèéìíîòóùú"),
+    "german": frozenset(string.ascii_lowercase + "äöüß"),
+}
+
+# Share of foreign letters above which flashcards fail validation without running the pattern sweep.
+# Loanwords and names stay far below it; text in another script (Cyrillic, Greek, CJK...) lands far above.
+FOREIGN_LETTER_THRESHOLD = 0.2
+
+
+def _foreign_letter_ratio(sample: tuple[tuple[str, str], ...], prompt_key: str) -> float:
+    """Return the share of letters in the sample's questions and answers that the language does not use."""
+    native = _NATIVE_LETTERS.get(prompt_key)
+    if native is None:
+        return 0.0
+    letters = [char for question, answer in sample for char in f"{question}{answer}".lower() if char.isalpha()]
+    if not letters:
+        return 0.0
+    return sum(char not in native for char in letters) / len(letters)
+
+
+# Fallback cap on concurrent chunk requests when Settings cannot be read
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Maximum number of validated chunk results kept by the LLM_RESPONSE_CACHE (oldest evicted first)
+RESPONSE_CACHE_SIZE = 256
+
+# Heading that introduces the text to process in each language's prompt template
+_TEXT_MARKERS = {
+    "english": "TEXT TO PROCESS:",
+    "french": "TEXTE À TRAITER:",
+    "italian": "TESTO DA ELABORARE:",
+    "german": "ZU VERARBEITENDER TEXT:",
+}
+
+# Instructions for prompts that carry several chunks (LLM_CHUNK_BATCH_SIZE), formatted with the section count
+_BATCH_INSTRUCTIONS = {
+    "english": """BATCHED INPUT:
+The text below contains {count} sections marked ===CHUNK n===. Generate flashcards for each section separately
+and return a JSON array containing exactly {count} arrays, where the n-th array holds the flashcard objects
+for section n. Do not merge sections.""",
+    "french": """ENTRÉE GROUPÉE:
+Le texte ci-dessous contient {count} sections marquées ===CHUNK n===. Générez des flashcards pour chaque section
+séparément et renvoyez un tableau JSON contenant exactement {count} tableaux, le n-ième tableau contenant
+les objets flashcard de la section n. Ne fusionnez pas les sections.""",
+    "italian": """INPUT RAGGRUPPATO:
+Il testo seguente contiene {count} sezioni contrassegnate da ===CHUNK n===. Genera flashcard per ogni sezione
+separatamente e restituisci un array JSON contenente esattamente {count} array, dove l'n-esimo array contiene
+gli oggetti flashcard della sezione n. Non unire le sezioni.""",
+    "german": """GEBÜNDELTE EINGABE:
+Der folgende Text enthält {count} Abschnitte, die mit ===CHUNK n=== markiert sind. Erstellen Sie Karteikarten
+für jeden Abschnitt separat und geben Sie ein JSON-Array mit genau {count} Arrays zurück, wobei das n-te Array
+die Karteikarten-Objekte für Abschnitt n enthält. Fassen Sie die Abschnitte nicht zusammen.""",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_pattern_matches(sample: tuple[tuple[str, str], ...], prompt_key: str) -> tuple[int, ...]:
+    """Return how many of a language's patterns match each (question, answer) pair in the sample.
+
+    Retried and speculative attempts often return identical flashcards, so the regex scan is
+    cached on the card text and repeated validations become a dictionary lookup. The cards are
+    joined into one newline-separated buffer so each pattern runs once over the whole sample;
+    match offsets are mapped back to their card, and a card counts each pattern at most once.
+    """
+    # Lowercase per card before joining: some characters grow when lowercased, which would shift the offsets
+    lines = [f"{question} {answer}".lower() for question, answer in sample]
+    text = "\n".join(lines)
+    line_starts = list(itertools.accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+    counts = [0] * len(lines)
+    for pattern in _LANGUAGE_PATTERNS[prompt_key]:
+        for index in {bisect.bisect_right(line_starts, match.start()) - 1 for match in pattern.finditer(text)}:
+            counts[index] += 1
+    return tuple(counts)
+
+
+@functools.lru_cache(maxsize=64)
+def _split_template(language: str, content_type: str) -> tuple[str, str]:
+    """Return the (prefix, suffix) around the template's {text} placeholder, split once per template.
+
+    Building a prompt is then a plain concatenation instead of a scan of the whole template per chunk.
+    """
+    prefix, _, suffix = PromptTemplates.get_template(language, content_type).partition("{text}")
+    return prefix, suffix
 
-@dataclass
+
+def _new_validation_metrics(validation_method: str = "none") -> dict[str, Any]:
+    """Return a fresh metrics dict for _validate_response_language with every counter zeroed."""
+    return {
+        "success_rate": 0.0,
+        "matches_found": 0,
+        "total_checks": 0,
+        "sample_size": 0,
+        "language_info": None,
+        "validation_method": validation_method,
+        "patterns_used": [],
+        "flashcards_checked": [],
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class FlashcardData:
     """Data structure for flashcard information from LLM response."""
 
@@ -61,14 +265,10 @@ class LLMClient:
         else:
             # Validate provided model
             if not ModelConfig.validate_model_config(model):
-                if model not in ModelConfig.SUPPORTED_MODELS:
-                    supported = ", ".join(ModelConfig.get_supported_models())
-                    raise ConfigurationError(f"Unsupported model '{model}'. Supported models: {supported}")
-                else:
-                    required_key = ModelConfig.get_required_api_key(model)
-                    raise ConfigurationError(
-                        f"Missing API key for model '{model}'. Please set the {required_key} environment variable."
-                    )
+                required_key = ModelConfig.get_required_api_key(model)
+                if required_key is None:
+                    raise ModelConfig._unsupported_model_error(model)
+                raise ModelConfig._missing_api_key_error(model, required_key)
             self.model = model
 
         # Validate and normalize language using LanguageConfig
@@ -85,6 +285,30 @@ class LLMClient:
         self.max_retries = 3
         self.base_delay = 1.0  # Base delay for exponential backoff
 
+        # Maximum number of chunks sent to the LLM concurrently (LLM_MAX_CONCURRENCY), whether
+        # language validation attempts are fired in parallel (LLM_SPECULATIVE_RETRIES), whether
+        # validated chunk results are reused for identical requests (LLM_RESPONSE_CACHE) and how
+        # many chunks share one request (LLM_CHUNK_BATCH_SIZE)
+        try:
+            from ..config import settings
+
+            self.max_concurrency = max(1, settings.llm_max_concurrency)
+            self.speculative_retries = settings.llm_speculative_retries
+            self.response_cache_enabled = settings.llm_response_cache
+            self.chunk_batch_size = max(1, settings.llm_chunk_batch_size)
+        except Exception as e:
+            logger.warning(f"Failed to get LLM concurrency settings from Settings, using defaults: {e}")
+            self.max_concurrency = DEFAULT_MAX_CONCURRENCY
+            self.speculative_retries = False
+            self.response_cache_enabled = False
+            self.chunk_batch_size = 1
+
+        # Validated flashcards keyed by _response_cache_key, insertion-ordered for oldest-first eviction.
+        # This is the only state calls write to; everything else per call lives in locals and return values,
+        # so one client can serve concurrent tasks. The lock covers callers on separate sync-wrapper threads.
+        self._response_cache: dict[str, tuple[FlashcardData, ...]] = {}
+        self._response_cache_lock = threading.Lock()
+
         # Configure litellm
         litellm.set_verbose = False
 
@@ -203,20 +427,13 @@ class LLMClient:
                 f"Supported content types: {', '.join(valid_content_types)}"
             )
 
-        # Get base template
+        # Get base template, already split around its {text} placeholder
         base_content_type = detected_content_type if detected_content_type != "presentation" else "general"
-        template = self.get_prompt_template(language, base_content_type)
+        prefix, suffix = _split_template(language, base_content_type)
 
         # Add presentation-specific instructions if needed
         if detected_content_type == "presentation":
             presentation_instructions = self._get_presentation_instructions(language)
-            # Handle different text markers for different languages
-            text_markers = {
-                "english": "TEXT TO PROCESS:",
-                "french": "TEXTE À TRAITER:",
-                "italian": "TESTO DA ELABORARE:",
-                "german": "ZU VERARBEITENDER TEXT:",
-            }
 
             # Get the appropriate text marker for the language
             try:
@@ -225,11 +442,12 @@ class LLMClient:
             except Exception:
                 lang_key = "english"
 
-            text_marker = text_markers.get(lang_key, "TEXT TO PROCESS:")
+            text_marker = _TEXT_MARKERS.get(lang_key, "TEXT TO PROCESS:")
 
-            template = template.replace(text_marker, f"{presentation_instructions}\n\n{text_marker}")
+            # The text marker sits right before the {text} placeholder, so it is always in the prefix
+            prefix = prefix.replace(text_marker, f"{presentation_instructions}\n\n{text_marker}")
 
-        return template.replace("{text}", text)
+        return f"{prefix}{text}{suffix}"
 
     def _detect_content_type(self, text: str, explicit_content_type: str) -> str:
         """
@@ -375,7 +593,7 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
                 if attempt < self.max_retries - 1:
                     delay = self.base_delay * (2**attempt)  # Exponential backoff
                     logger.info(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
+                    await _sleep(delay)
                 else:
                     logger.error(f"All {self.max_retries} API call attempts failed")
 
@@ -398,43 +616,20 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             cleaned_response = self._clean_json_response(response_text)
 
             # Try to extract JSON from the response
-            json_match = re.search(r"\[.*\]", cleaned_response, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(cleaned_response)
             if json_match:
                 json_str = json_match.group(0)
             else:
                 json_str = cleaned_response
 
             # Parse JSON
-            data = json.loads(json_str)
+            data = _json_loads(json_str)
 
             if not isinstance(data, list):
                 logger.warning("Response is not a JSON array, attempting to wrap it")
                 data = [data] if isinstance(data, dict) else []
 
-            for item in data:
-                if not isinstance(item, dict):
-                    logger.warning(f"Skipping invalid flashcard item: {item}")
-                    continue
-
-                # Validate required fields
-                if not all(key in item for key in ["question", "answer", "card_type"]):
-                    logger.warning(f"Skipping flashcard with missing fields: {item}")
-                    continue
-
-                # Validate card_type
-                if item["card_type"] not in ["qa", "cloze"]:
-                    logger.warning(f"Invalid card_type '{item['card_type']}', defaulting to 'qa'")
-                    item["card_type"] = "qa"
-
-                # Clean up the content
-                question = item["question"].strip()
-                answer = item["answer"].strip()
-                card_type = item["card_type"]
-
-                if question and answer:
-                    flashcards.append(FlashcardData(question=question, answer=answer, card_type=card_type))
-                else:
-                    logger.warning(f"Skipping flashcard with empty question or answer: {item}")
+            flashcards = self._flashcards_from_items(data)
 
             logger.info(f"Successfully parsed {len(flashcards)} flashcards from LLM response")
 
@@ -446,7 +641,7 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             fixed_json = self._attempt_json_fix(response_text)
             if fixed_json:
                 try:
-                    data = json.loads(fixed_json)
+                    data = _json_loads(fixed_json)
                     if isinstance(data, list):
                         for item in data:
                             if isinstance(item, dict) and all(
@@ -474,6 +669,45 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
 
         return flashcards
 
+    def _flashcards_from_items(self, items: list[Any]) -> list[FlashcardData]:
+        """
+        Convert decoded JSON items into flashcards, skipping malformed entries.
+
+        Args:
+            items: Decoded JSON array items, expected to be flashcard objects
+
+        Returns:
+            List of FlashcardData objects for the valid items
+        """
+        flashcards = []
+
+        for item in items:
+            if not isinstance(item, dict):
+                logger.warning(f"Skipping invalid flashcard item: {item}")
+                continue
+
+            # Validate required fields
+            if not all(key in item for key in ["question", "answer", "card_type"]):
+                logger.warning(f"Skipping flashcard with missing fields: {item}")
+                continue
+
+            # Validate card_type
+            if item["card_type"] not in ["qa", "cloze"]:
+                logger.warning(f"Invalid card_type '{item['card_type']}', defaulting to 'qa'")
+                item["card_type"] = "qa"
+
+            # Clean up the content
+            question = item["question"].strip()
+            answer = item["answer"].strip()
+            card_type = item["card_type"]
+
+            if question and answer:
+                flashcards.append(FlashcardData(question=question, answer=answer, card_type=card_type))
+            else:
+                logger.warning(f"Skipping flashcard with empty question or answer: {item}")
+
+        return flashcards
+
     def _clean_json_response(self, response_text: str) -> str:
         """
         Clean up common issues in JSON responses from LLMs.
@@ -495,8 +729,8 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             response_text = response_text[: end_idx + 1]
 
         # Remove markdown code block markers
-        response_text = re.sub(r"```json\s*", "", response_text)
-        response_text = re.sub(r"```\s*$", "", response_text)
+        response_text = _CODE_FENCE_OPEN_RE.sub("", response_text)
+        response_text = _CODE_FENCE_CLOSE_RE.sub("", response_text)
 
         return response_text.strip()
 
@@ -515,11 +749,11 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             cleaned = self._clean_json_response(response_text)
 
             # Try to fix trailing commas
-            fixed = re.sub(r",\s*}", "}", cleaned)
-            fixed = re.sub(r",\s*]", "]", fixed)
+            fixed = _TRAILING_COMMA_OBJECT_RE.sub("}", cleaned)
+            fixed = _TRAILING_COMMA_ARRAY_RE.sub("]", fixed)
 
             # Try to fix missing commas between objects
-            fixed = re.sub(r"}\s*{", "},{", fixed)
+            fixed = _ADJACENT_OBJECTS_RE.sub("},{", fixed)
 
             # Try to fix unescaped quotes in strings
             # This is a simple approach - more sophisticated parsing might be needed
@@ -551,10 +785,7 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
         flashcards = []
 
         # Try to extract individual JSON objects even if the array is malformed
-        json_object_pattern = (
-            r'\{\s*"question"\s*:\s*"([^"]+)"\s*,\s*"answer"\s*:\s*"([^"]+)"\s*,\s*"card_type"\s*:\s*"([^"]+)"\s*\}'
-        )
-        matches = re.findall(json_object_pattern, response_text, re.DOTALL | re.IGNORECASE)
+        matches = _FALLBACK_JSON_OBJECT_RE.findall(response_text)
 
         for question, answer, card_type in matches:
             question = question.strip()
@@ -568,15 +799,8 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             return flashcards
 
         # Try to find question-answer patterns
-        qa_patterns = [
-            r"Q:\s*(.+?)\s*A:\s*(.+?)(?=Q:|$)",
-            r"Question:\s*(.+?)\s*Answer:\s*(.+?)(?=Question:|$)",
-            r"\d+\.\s*(.+?)\s*-\s*(.+?)(?=\d+\.|$)",
-            r'"question":\s*"([^"]+)"\s*,\s*"answer":\s*"([^"]+)"',
-        ]
-
-        for pattern in qa_patterns:
-            matches = re.findall(pattern, response_text, re.DOTALL | re.IGNORECASE)
+        for pattern in _FALLBACK_QA_PATTERNS:
+            matches = pattern.findall(response_text)
             if matches:
                 for question, answer in matches:
                     question = question.strip()
@@ -611,21 +835,11 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             - language_info: LanguageInfo object for the expected language
             - validation_method: String describing validation method used
         """
-        validation_metrics: dict[str, Any] = {
-            "success_rate": 0.0,
-            "matches_found": 0,
-            "total_checks": 0,
-            "sample_size": 0,
-            "language_info": None,
-            "validation_method": "none",
-            "patterns_used": [],
-            "flashcards_checked": [],
-        }
-
         if not flashcards:
-            validation_metrics["validation_method"] = "empty_list"
             logger.debug("Language validation skipped: empty flashcard list")
-            return True, validation_metrics  # Empty list is valid
+            return True, _new_validation_metrics("empty_list")  # Empty list is valid
+
+        validation_metrics = _new_validation_metrics()
 
         # Normalize the expected language using LanguageConfig
         try:
@@ -637,61 +851,9 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             logger.warning(f"Cannot validate unknown language: {expected_language}")
             return True, validation_metrics  # Skip validation for unsupported languages
 
-        # Enhanced language validation patterns with more comprehensive coverage
-        language_patterns = {
-            "english": [
-                # Common articles, prepositions, and conjunctions
-                r"\b(the|and|or|is|are|was|were|have|has|had|will|would|can|could|should|may|might)\b",
-                # Question words
-                r"\b(what|when|where|why|how|who|which)\b",
-                # Demonstratives and pronouns
-                r"\b(this|that|these|those|it|they|them|their|there)\b",
-                # Common verbs
-                r"\b(do|does|did|get|got|make|made|take|took|come|came|go|went)\b",
-                # English-specific patterns
-                r"\b(of|to|in|for|with|by|from|up|about|into|through|during)\b",
-            ],
-            "french": [
-                # Articles and basic words
-                r"\b(le|la|les|un|une|des|et|ou|est|sont|était|étaient|avoir|être)\b",
-                # Question words
-                r"\b(quel|quelle|quels|quelles|qui|que|quoi|où|quand|comment|pourquoi)\b",
-                # Demonstratives and pronouns
-                r"\b(ce|cette|ces|ceux|celles|il|elle|ils|elles|leur|leurs)\b",
-                # Prepositions and conjunctions
-                r"\b(dans|sur|avec|pour|par|de|du|des|à|au|aux|mais|donc|car|si)\b",
-                # French-specific patterns
-                r"\b(très|plus|moins|bien|mal|tout|tous|toute|toutes|même|déjà)\b",
-            ],
-            "italian": [
-                # Articles and basic words
-                r"\b(il|la|lo|gli|le|un|una|e|o|è|sono|era|erano|avere|essere)\b",
-                # Question words
-                r"\b(che|chi|cosa|dove|quando|come|perché|quale|quali|quanto|quanta)\b",
-                # Demonstratives and pronouns
-                r"\b(questo|questa|questi|queste|quello|quella|quelli|quelle|loro)\b",
-                # Prepositions and conjunctions
-                r"\b(in|su|con|per|da|di|del|della|dei|delle|ma|però|anche|già)\b",
-                # Italian-specific patterns
-                r"\b(molto|più|meno|bene|male|tutto|tutti|tutta|tutte|stesso|stessa)\b",
-            ],
-            "german": [
-                # Articles and basic words
-                r"\b(der|die|das|ein|eine|und|oder|ist|sind|war|waren|haben|sein)\b",
-                # Question words
-                r"\b(was|wer|wo|wann|wie|warum|welche|welcher|welches|wieviel)\b",
-                # Demonstratives and pronouns
-                r"\b(dieser|diese|dieses|jener|jene|jenes|sie|ihr|ihre|ihren)\b",
-                # Prepositions and conjunctions
-                r"\b(in|auf|mit|für|von|zu|bei|nach|über|unter|aber|doch|auch|schon)\b",
-                # German-specific patterns
-                r"\b(sehr|mehr|weniger|gut|schlecht|alle|alles|ganz|noch|nicht)\b",
-            ],
-        }
-
         # Use the prompt key for pattern matching
-        patterns = language_patterns.get(language_info.prompt_key, [])
-        validation_metrics["patterns_used"] = patterns
+        patterns = _LANGUAGE_PATTERNS.get(language_info.prompt_key, ())
+        validation_metrics["patterns_used"] = [pattern.pattern for pattern in patterns]
 
         if not patterns:
             validation_metrics["validation_method"] = "no_patterns"
@@ -702,22 +864,26 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
         sample_size = min(5, len(flashcards))
         sample_flashcards = flashcards[:sample_size]
         validation_metrics["sample_size"] = sample_size
-        validation_metrics["validation_method"] = "pattern_matching"
-
-        matches = 0
-        total_checks = 0
-        checked_flashcards = []
+        sample = tuple((flashcard.question, flashcard.answer) for flashcard in sample_flashcards)
 
-        for i, flashcard in enumerate(sample_flashcards):
-            text_to_check = f"{flashcard.question} {flashcard.answer}".lower()
-            flashcard_matches = 0
+        # Flashcards written mostly in another script cannot pass, so skip the pattern sweep
+        foreign_ratio = _foreign_letter_ratio(sample, language_info.prompt_key)
+        if foreign_ratio >= FOREIGN_LETTER_THRESHOLD:
+            validation_metrics["validation_method"] = "script_mismatch"
+            validation_metrics["foreign_letter_ratio"] = foreign_ratio
+            logger.warning(
+                f"Language validation failed for {language_info.name}. "
+                f"{foreign_ratio:.0%} of letters across {sample_size} flashcards are not used in {language_info.name}."
+            )
+            return False, validation_metrics
 
-            for pattern in patterns:
-                if re.search(pattern, text_to_check, re.IGNORECASE):
-                    matches += 1
-                    flashcard_matches += 1
-                total_checks += 1
+        validation_metrics["validation_method"] = "pattern_matching"
+        per_flashcard_matches = _count_pattern_matches(sample, language_info.prompt_key)
+        matches = sum(per_flashcard_matches)
+        total_checks = len(patterns) * sample_size
+        checked_flashcards = []
 
+        for i, (flashcard, flashcard_matches) in enumerate(zip(sample_flashcards, per_flashcard_matches, strict=True)):
             checked_flashcards.append(
                 {
                     "index": i,
@@ -745,7 +911,8 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
                     f"Found {matches}/{total_checks} pattern matches across {sample_size} flashcards."
                 )
                 # Log detailed breakdown for debugging
-                logger.debug(f"Validation details: {validation_metrics}")
+                # Positional args: loguru only renders the metrics dict if debug output is enabled
+                logger.debug("Validation details: {}", validation_metrics)
             else:
                 logger.debug(
                     f"Language validation passed for {language_info.name}. "
@@ -758,8 +925,115 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
         validation_metrics["validation_method"] = "no_checks_performed"
         return True, validation_metrics
 
+    async def _limited_api_call(self, prompt: str, semaphore: asyncio.Semaphore | None) -> str:
+        """Make one API call, holding a slot of the in-flight request limit for its duration when one is given."""
+        async with semaphore or contextlib.nullcontext():
+            return await self._make_api_call_with_retry(prompt)
+
+    async def _speculative_generate(
+        self,
+        text: str,
+        language: str,
+        content_type: str,
+        attempts: int,
+        validation_summary: dict[str, Any],
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> tuple[list[FlashcardData], list[FlashcardData], Exception | None]:
+        """
+        Fire several generation attempts in parallel and keep the first one that passes language validation.
+
+        Trades extra tokens for latency: a validation-heavy chunk waits for the fastest valid
+        response instead of for each failed attempt in turn. Remaining attempts are cancelled
+        as soon as one passes.
+
+        Args:
+            text: The input text to generate flashcards from
+            language: Target language for flashcards
+            content_type: Type of content ("academic", "technical", "general")
+            attempts: Number of parallel attempts to fire
+            validation_summary: Summary dict updated in place with per-attempt validation results
+            semaphore: Limit on in-flight LLM requests; each attempt takes its own slot
+
+        Returns:
+            Tuple of (flashcards, last_flashcards, last_exception) where flashcards is empty unless an
+            attempt passed validation, last_flashcards holds the last attempt that failed validation,
+            and last_exception is the last error raised by an attempt
+        """
+        prompt = self._create_flashcard_prompt(text, language=language, content_type=content_type)
+        tasks = [asyncio.create_task(self._limited_api_call(prompt, semaphore)) for _ in range(attempts)]
+        validation_summary["total_attempts"] = attempts
+
+        last_flashcards: list[FlashcardData] = []
+        last_exception: Exception | None = None
+
+        try:
+            # Attempts are numbered in completion order
+            for attempt, completed in enumerate(asyncio.as_completed(tasks), start=1):
+                try:
+                    flashcards = self._parse_flashcard_response(await completed)
+                except Exception as e:
+                    last_exception = e
+                    logger.error(f"Error during speculative flashcard generation attempt {attempt}: {e}")
+                    validation_summary["validation_results"].append(
+                        {"attempt": attempt, "flashcards_generated": 0, "validation_passed": False, "error": str(e)}
+                    )
+                    continue
+
+                if not flashcards:
+                    logger.warning(f"No flashcards generated on speculative attempt {attempt}")
+                    continue
+
+                is_valid, validation_metrics = self._validate_response_language(flashcards, language)
+                validation_summary["validation_results"].append(
+                    {
+                        "attempt": attempt,
+                        "flashcards_generated": len(flashcards),
+                        "validation_passed": is_valid,
+                        "validation_metrics": validation_metrics,
+                    }
+                )
+
+                if is_valid:
+                    validation_summary["final_validation_passed"] = True
+                    logger.info(
+                        f"Language validation passed on speculative attempt {attempt}/{attempts}. "
+                        f"Generated {len(flashcards)} flashcards in {validation_metrics['language_info'].name}"
+                    )
+                    return flashcards, last_flashcards, last_exception
+
+                logger.warning(
+                    f"Language validation failed on speculative attempt {attempt}/{attempts}. "
+                    f"Expected {language}, success rate: {validation_metrics['success_rate']:.2%}"
+                )
+                last_flashcards = flashcards
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Collect the cancelled attempts so none is left pending or with an unretrieved exception
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [], last_flashcards, last_exception
+
+    def _response_cache_key(self, text: str, language: str, content_type: str) -> str:
+        """Hash the model and every input that determines the prompt for a chunk."""
+        return hashlib.sha256("\0".join((self.model, language, content_type, text)).encode()).hexdigest()
+
+    def _store_validated_flashcards(self, cache_key: str | None, flashcards: list[FlashcardData]) -> None:
+        """Cache flashcards that passed language validation, evicting the oldest entry when full."""
+        if cache_key is None:
+            return
+        with self._response_cache_lock:
+            if cache_key not in self._response_cache and len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+                self._response_cache.pop(next(iter(self._response_cache)))
+            self._response_cache[cache_key] = tuple(flashcards)
+
     async def _generate_flashcards_with_language_validation(
-        self, text: str, language: str, content_type: str = "general", max_validation_retries: int = 2
+        self,
+        text: str,
+        language: str,
+        content_type: str = "general",
+        max_validation_retries: int = 2,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> tuple[list[FlashcardData], dict[str, Any]]:
         """
         Generate flashcards with language validation and retry mechanism.
@@ -769,6 +1043,7 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             language: Target language for flashcards
             content_type: Type of content ("academic", "technical", "general")
             max_validation_retries: Maximum number of retries for language validation failures
+            semaphore: Limit on in-flight LLM requests, acquired separately for every request this chunk makes
 
         Returns:
             Tuple of (flashcards, validation_summary) where validation_summary contains:
@@ -776,81 +1051,104 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             - validation_results: List of validation results for each attempt
             - final_validation_passed: Whether final validation passed
             - fallback_used: Whether fallback behavior was triggered
+            - cache_hit: Whether the flashcards came from the response cache without an LLM call
+            - batched: Whether the flashcards came from a request shared with other chunks
         """
         validation_summary: dict[str, Any] = {
             "total_attempts": 0,
             "validation_results": [],
             "final_validation_passed": False,
             "fallback_used": False,
+            "cache_hit": False,
+            "batched": False,
             "language_requested": language,
             "content_type": content_type,
         }
 
-        last_flashcards = []
-        last_exception = None
+        # Only flashcards that passed validation are cached, so retries after a failure still reach the LLM
+        cache_key = self._response_cache_key(text, language, content_type) if self.response_cache_enabled else None
+        if cache_key is not None and (cached_flashcards := self._response_cache.get(cache_key)) is not None:
+            logger.debug(f"Reusing {len(cached_flashcards)} cached {language} flashcards for an identical chunk")
+            validation_summary["final_validation_passed"] = True
+            validation_summary["cache_hit"] = True
+            return list(cached_flashcards), validation_summary
 
-        for attempt in range(max_validation_retries + 1):  # +1 for initial attempt
-            validation_summary["total_attempts"] = attempt + 1
+        last_flashcards: list[FlashcardData] = []
+        last_exception: Exception | None = None
 
-            try:
-                logger.debug(f"Language validation attempt {attempt + 1}/{max_validation_retries + 1} for {language}")
+        if self.speculative_retries:
+            flashcards, last_flashcards, last_exception = await self._speculative_generate(
+                text, language, content_type, max_validation_retries + 1, validation_summary, semaphore
+            )
+            if flashcards:
+                self._store_validated_flashcards(cache_key, flashcards)
+                return flashcards, validation_summary
+        else:
+            for attempt in range(max_validation_retries + 1):  # +1 for initial attempt
+                validation_summary["total_attempts"] = attempt + 1
 
-                # Create prompt for this attempt
-                prompt = self._create_flashcard_prompt(text, language=language, content_type=content_type)
+                try:
+                    logger.debug(
+                        f"Language validation attempt {attempt + 1}/{max_validation_retries + 1} for {language}"
+                    )
 
-                # Make API call with retry logic
-                response = await self._make_api_call_with_retry(prompt)
+                    # Create prompt for this attempt
+                    prompt = self._create_flashcard_prompt(text, language=language, content_type=content_type)
 
-                # Parse response into flashcard data
-                flashcards = self._parse_flashcard_response(response)
+                    # Make API call with retry logic
+                    response = await self._limited_api_call(prompt, semaphore)
 
-                if not flashcards:
-                    logger.warning(f"No flashcards generated on attempt {attempt + 1}")
-                    continue
+                    # Parse response into flashcard data
+                    flashcards = self._parse_flashcard_response(response)
 
-                # Validate language
-                is_valid, validation_metrics = self._validate_response_language(flashcards, language)
-                validation_result = {
-                    "attempt": attempt + 1,
-                    "flashcards_generated": len(flashcards),
-                    "validation_passed": is_valid,
-                    "validation_metrics": validation_metrics,
-                }
-                validation_summary["validation_results"].append(validation_result)
+                    if not flashcards:
+                        logger.warning(f"No flashcards generated on attempt {attempt + 1}")
+                        continue
 
-                if is_valid:
-                    validation_summary["final_validation_passed"] = True
-                    logger.info(
-                        f"Language validation passed on attempt {attempt + 1}. "
-                        f"Generated {len(flashcards)} flashcards in {validation_metrics['language_info'].name}"
-                    )
-                    return flashcards, validation_summary
-                else:
-                    logger.warning(
-                        f"Language validation failed on attempt {attempt + 1}. "
-                        f"Expected {language}, success rate: {validation_metrics['success_rate']:.2%}"
-                    )
-                    last_flashcards = flashcards
-
-                    # If this is not the last attempt, try again
-                    if attempt < max_validation_retries:
-                        logger.info("Retrying flashcard generation with adjusted prompt...")
-                        # Add small delay before retry
-                        await asyncio.sleep(1.0)
+                    # Validate language
+                    is_valid, validation_metrics = self._validate_response_language(flashcards, language)
+                    validation_result = {
+                        "attempt": attempt + 1,
+                        "flashcards_generated": len(flashcards),
+                        "validation_passed": is_valid,
+                        "validation_metrics": validation_metrics,
+                    }
+                    validation_summary["validation_results"].append(validation_result)
 
-            except Exception as e:
-                last_exception = e
-                logger.error(f"Error during flashcard generation attempt {attempt + 1}: {e}")
-                validation_result = {
-                    "attempt": attempt + 1,
-                    "flashcards_generated": 0,
-                    "validation_passed": False,
-                    "error": str(e),
-                }
-                validation_summary["validation_results"].append(validation_result)
+                    if is_valid:
+                        validation_summary["final_validation_passed"] = True
+                        logger.info(
+                            f"Language validation passed on attempt {attempt + 1}. "
+                            f"Generated {len(flashcards)} flashcards in {validation_metrics['language_info'].name}"
+                        )
+                        self._store_validated_flashcards(cache_key, flashcards)
+                        return flashcards, validation_summary
+                    else:
+                        logger.warning(
+                            f"Language validation failed on attempt {attempt + 1}. "
+                            f"Expected {language}, success rate: {validation_metrics['success_rate']:.2%}"
+                        )
+                        last_flashcards = flashcards
+
+                        # If this is not the last attempt, try again
+                        if attempt < max_validation_retries:
+                            logger.info("Retrying flashcard generation with adjusted prompt...")
+                            # Add small delay before retry
+                            await _sleep(1.0)
+
+                except Exception as e:
+                    last_exception = e
+                    logger.error(f"Error during flashcard generation attempt {attempt + 1}: {e}")
+                    validation_result = {
+                        "attempt": attempt + 1,
+                        "flashcards_generated": 0,
+                        "validation_passed": False,
+                        "error": str(e),
+                    }
+                    validation_summary["validation_results"].append(validation_result)
 
-                if attempt < max_validation_retries:
-                    await asyncio.sleep(1.0)
+                    if attempt < max_validation_retries:
+                        await _sleep(1.0)
 
         # All validation attempts failed - implement fallback behavior
         logger.warning(
@@ -872,7 +1170,7 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             logger.info("Fallback: Attempting generation in English as last resort")
             try:
                 prompt = self._create_flashcard_prompt(text, language="english", content_type=content_type)
-                response = await self._make_api_call_with_retry(prompt)
+                response = await self._limited_api_call(prompt, semaphore)
                 fallback_flashcards = self._parse_flashcard_response(response)
 
                 if fallback_flashcards:
@@ -893,6 +1191,185 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
         )
         return [], validation_summary
 
+    def _create_batched_prompt(self, chunks: list[str], language: str, content_type: str = "general") -> str:
+        """
+        Create one prompt asking for the flashcards of several chunks, one JSON array per chunk.
+
+        Args:
+            chunks: The text chunks to generate flashcards from, in order
+            language: Target language for flashcards
+            content_type: Type of content ("academic", "technical", "general", "presentation")
+
+        Returns:
+            The formatted prompt string with numbered ===CHUNK n=== sections
+
+        Raises:
+            ValueError: If language or content_type is not supported
+        """
+        sections = "\n\n".join(f"===CHUNK {n}===\n{chunk}" for n, chunk in enumerate(chunks, start=1))
+        prompt = self._create_flashcard_prompt(sections, language=language, content_type=content_type)
+
+        try:
+            lang_key = LanguageConfig.get_language_info(language).prompt_key
+        except LanguageValidationError:
+            lang_key = "english"
+
+        instructions = _BATCH_INSTRUCTIONS.get(lang_key, _BATCH_INSTRUCTIONS["english"]).format(count=len(chunks))
+        text_marker = _TEXT_MARKERS.get(lang_key, "TEXT TO PROCESS:")
+        # The template's marker precedes the sections, so the first occurrence is always the template's own
+        return prompt.replace(text_marker, f"{instructions}\n\n{text_marker}", 1)
+
+    def _parse_batched_response(self, response_text: str, expected_chunks: int) -> list[list[FlashcardData]] | None:
+        """
+        Parse a batched LLM response into one flashcard list per chunk.
+
+        Args:
+            response_text: Raw response from the LLM
+            expected_chunks: Number of chunks the batched prompt carried
+
+        Returns:
+            One list of FlashcardData per chunk in chunk order, or None if the response is not
+            a JSON array holding exactly one array per chunk
+        """
+        try:
+            cleaned_response = self._clean_json_response(response_text)
+            json_match = _JSON_ARRAY_RE.search(cleaned_response)
+            data = _json_loads(json_match.group(0) if json_match else cleaned_response)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse batched JSON response: {e}")
+            return None
+
+        if not isinstance(data, list) or len(data) != expected_chunks or not all(isinstance(i, list) for i in data):
+            logger.warning(f"Batched response does not hold one array per chunk (expected {expected_chunks})")
+            return None
+
+        try:
+            return [self._flashcards_from_items(items) for items in data]
+        except Exception as e:
+            logger.warning(f"Failed to read flashcards from batched response: {e}")
+            return None
+
+    async def _generate_batch_with_language_validation(
+        self,
+        chunks: list[str],
+        language: str,
+        content_type: str = "general",
+        max_validation_retries: int = 2,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[tuple[list[FlashcardData], dict[str, Any]] | BaseException]:
+        """
+        Generate flashcards for several chunks with a single LLM request, validating each chunk separately.
+
+        Chunks whose section is missing, empty or fails language validation are regenerated on their own
+        through _generate_flashcards_with_language_validation, so per-chunk retries and fallbacks still apply.
+        With the response cache enabled, cached chunks are answered without a request and only the misses
+        are batched; every section that passes validation is cached.
+
+        Args:
+            chunks: The text chunks to generate flashcards from, in order
+            language: Target language for flashcards
+            content_type: Type of content ("academic", "technical", "general")
+            max_validation_retries: Maximum number of retries for chunks regenerated on their own
+            semaphore: Limit on in-flight LLM requests, acquired for the batched request and for every request
+                of a regenerated chunk (defaults to a new one sized by max_concurrency)
+
+        Returns:
+            One (flashcards, validation_summary) tuple per chunk, in chunk order, or the exception raised
+            while regenerating that chunk
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: list[tuple[list[FlashcardData], dict[str, Any]] | BaseException | None] = [None] * len(chunks)
+
+        cache_keys = [
+            self._response_cache_key(chunk, language, content_type) if self.response_cache_enabled else None
+            for chunk in chunks
+        ]
+        for index, cache_key in enumerate(cache_keys):
+            if cache_key is not None and (cached_flashcards := self._response_cache.get(cache_key)) is not None:
+                logger.debug(
+                    f"Reusing {len(cached_flashcards)} cached {language} flashcards for batched chunk {index + 1}"
+                )
+                results[index] = (
+                    list(cached_flashcards),
+                    {
+                        "total_attempts": 0,
+                        "validation_results": [],
+                        "final_validation_passed": True,
+                        "fallback_used": False,
+                        "cache_hit": True,
+                        "batched": False,
+                        "language_requested": language,
+                        "content_type": content_type,
+                    },
+                )
+
+        # Only the cache misses share the batched request
+        misses = [index for index, result in enumerate(results) if result is None]
+        sections: list[list[FlashcardData]] = []
+        if misses:
+            try:
+                prompt = self._create_batched_prompt(
+                    [chunks[index] for index in misses], language=language, content_type=content_type
+                )
+                response = await self._limited_api_call(prompt, semaphore)
+                sections = self._parse_batched_response(response, len(misses)) or []
+            except Exception as e:
+                logger.error(f"Batched generation failed for {len(misses)} chunks, processing them one by one: {e}")
+
+        for position, flashcards in enumerate(sections):
+            index = misses[position]
+            if not flashcards:
+                logger.warning(f"No flashcards generated for batched chunk {index + 1}, regenerating it on its own")
+                continue
+
+            is_valid, validation_metrics = self._validate_response_language(flashcards, language)
+            if not is_valid:
+                logger.warning(f"Language validation failed for batched chunk {index + 1}, regenerating it on its own")
+                continue
+
+            self._store_validated_flashcards(cache_keys[index], flashcards)
+            results[index] = (
+                flashcards,
+                {
+                    "total_attempts": 1,
+                    "validation_results": [
+                        {
+                            "attempt": 1,
+                            "flashcards_generated": len(flashcards),
+                            "validation_passed": True,
+                            "validation_metrics": validation_metrics,
+                        }
+                    ],
+                    "final_validation_passed": True,
+                    "fallback_used": False,
+                    "cache_hit": False,
+                    "batched": True,
+                    "language_requested": language,
+                    "content_type": content_type,
+                },
+            )
+
+        # Regenerated chunks take a semaphore slot per request, and a failed one leaves the validated sections intact
+        pending = [index for index, result in enumerate(results) if result is None]
+        regenerated = await asyncio.gather(
+            *(
+                self._generate_flashcards_with_language_validation(
+                    chunks[index],
+                    language=language,
+                    content_type=content_type,
+                    max_validation_retries=max_validation_retries,
+                    semaphore=semaphore,
+                )
+                for index in pending
+            ),
+            return_exceptions=True,
+        )
+        for index, result in zip(pending, regenerated, strict=True):
+            results[index] = result
+
+        return [result for result in results if result is not None]
+
     async def generate_flashcards_from_text(
         self, text: str, language: str | None = None, content_type: str = "general"
     ) -> list[dict[str, str]]:
@@ -948,72 +1425,106 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             "chunk_results": [],
         }
 
-        for i, chunk in enumerate(text_chunks):
+        # Chunks are independent, so their LLM round-trips overlap; the semaphore caps in-flight requests.
+        # Slots are taken per request, so speculative attempts and fallbacks count against the limit too.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def process_chunk(i: int, chunk: str) -> tuple[list[FlashcardData], dict[str, Any]]:
             try:
                 lang_info = LanguageConfig.get_language_info(language)
                 logger.info(f"Processing chunk {i + 1}/{len(text_chunks)} for {lang_info.name} flashcards")
             except LanguageValidationError:
                 logger.info(f"Processing chunk {i + 1}/{len(text_chunks)} for {language} flashcards")
 
-            try:
-                # Use enhanced language validation with retry mechanism
-                chunk_flashcards, validation_summary = await self._generate_flashcards_with_language_validation(
-                    chunk, language=language, content_type=content_type, max_validation_retries=2
-                )
+            # Use enhanced language validation with retry mechanism
+            return await self._generate_flashcards_with_language_validation(
+                chunk, language=language, content_type=content_type, max_validation_retries=2, semaphore=semaphore
+            )
 
-                # Track chunk results
-                chunk_result = {
-                    "chunk_index": i + 1,
-                    "flashcards_generated": len(chunk_flashcards),
-                    "validation_summary": validation_summary,
-                }
-                overall_validation_stats["chunk_results"].append(chunk_result)
-
-                if chunk_flashcards:
-                    overall_validation_stats["successful_chunks"] += 1
-
-                    # Track validation statistics
-                    if not validation_summary["final_validation_passed"]:
-                        overall_validation_stats["validation_failures"] += 1
-
-                    if validation_summary["fallback_used"]:
-                        overall_validation_stats["fallback_used"] += 1
-
-                    # Convert to dictionary format
-                    for flashcard in chunk_flashcards:
-                        all_flashcards.append(
-                            {
-                                "question": flashcard.question,
-                                "answer": flashcard.answer,
-                                "card_type": flashcard.card_type,
-                            }
-                        )
+        async def process_batch(
+            start: int, chunks: list[str]
+        ) -> list[tuple[list[FlashcardData], dict[str, Any]] | BaseException]:
+            logger.info(
+                f"Processing chunks {start + 1}-{start + len(chunks)}/{len(text_chunks)} in one batched request"
+            )
+            return await self._generate_batch_with_language_validation(
+                chunks, language=language, content_type=content_type, max_validation_retries=2, semaphore=semaphore
+            )
 
-                    try:
-                        lang_info = LanguageConfig.get_language_info(language)
-                        logger.info(
-                            f"Generated {len(chunk_flashcards)} {lang_info.name} flashcards from chunk {i + 1} "
-                            f"(validation: {'passed' if validation_summary['final_validation_passed'] else 'failed'}, "
-                            f"attempts: {validation_summary['total_attempts']})"
-                        )
-                    except LanguageValidationError:
-                        logger.info(
-                            f"Generated {len(chunk_flashcards)} {language} flashcards from chunk {i + 1} "
-                            f"(validation: {'passed' if validation_summary['final_validation_passed'] else 'failed'})"
-                        )
+        results: list[tuple[list[FlashcardData], dict[str, Any]] | BaseException]
+        batch_size = self.chunk_batch_size
+        if batch_size > 1 and len(text_chunks) > 1:
+            # Several chunks share one request (LLM_CHUNK_BATCH_SIZE); a failed batch fails all of its chunks
+            starts = range(0, len(text_chunks), batch_size)
+            batches = await asyncio.gather(
+                *(process_batch(start, text_chunks[start : start + batch_size]) for start in starts),
+                return_exceptions=True,
+            )
+            results = []
+            for start, batch in zip(starts, batches, strict=True):
+                if isinstance(batch, BaseException):
+                    results.extend([batch] * len(text_chunks[start : start + batch_size]))
                 else:
-                    overall_validation_stats["failed_chunks"] += 1
-                    logger.warning(f"No flashcards generated for chunk {i + 1}")
-
-                # Add small delay between chunks to be respectful to the API
-                if i < len(text_chunks) - 1:
-                    await asyncio.sleep(0.5)
+                    results.extend(batch)
+        else:
+            results = list(
+                await asyncio.gather(
+                    *(process_chunk(i, chunk) for i, chunk in enumerate(text_chunks)), return_exceptions=True
+                )
+            )
 
-            except Exception as e:
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
                 overall_validation_stats["failed_chunks"] += 1
-                logger.error(f"Failed to process chunk {i + 1}: {e}")
+                logger.error(f"Failed to process chunk {i + 1}: {result}")
                 continue
 
+            chunk_flashcards, validation_summary = result
+
+            # Track chunk results
+            chunk_result = {
+                "chunk_index": i + 1,
+                "flashcards_generated": len(chunk_flashcards),
+                "validation_summary": validation_summary,
+            }
+            overall_validation_stats["chunk_results"].append(chunk_result)
+
+            if chunk_flashcards:
+                overall_validation_stats["successful_chunks"] += 1
+
+                # Track validation statistics
+                if not validation_summary["final_validation_passed"]:
+                    overall_validation_stats["validation_failures"] += 1
+
+                if validation_summary["fallback_used"]:
+                    overall_validation_stats["fallback_used"] += 1
+
+                # Convert to dictionary format
+                for flashcard in chunk_flashcards:
+                    all_flashcards.append(
+                        {
+                            "question": flashcard.question,
+                            "answer": flashcard.answer,
+                            "card_type": flashcard.card_type,
+                        }
+                    )
+
+                try:
+                    lang_info = LanguageConfig.get_language_info(language)
+                    logger.info(
+                        f"Generated {len(chunk_flashcards)} {lang_info.name} flashcards from chunk {i + 1} "
+                        f"(validation: {'passed' if validation_summary['final_validation_passed'] else 'failed'}, "
+                        f"attempts: {validation_summary['total_attempts']})"
+                    )
+                except LanguageValidationError:
+                    logger.info(
+                        f"Generated {len(chunk_flashcards)} {language} flashcards from chunk {i + 1} "
+                        f"(validation: {'passed' if validation_summary['final_validation_passed'] else 'failed'})"
+                    )
+            else:
+                overall_validation_stats["failed_chunks"] += 1
+                logger.warning(f"No flashcards generated for chunk {i + 1}")
+
         # Log comprehensive validation summary
         self._log_validation_summary(language, overall_validation_stats)
 
@@ -1078,8 +1589,9 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
                 "Consider reviewing input text or model configuration."
             )
 
-        # Log detailed chunk results in debug mode
-        logger.debug(f"Detailed chunk results for {language_display}: {validation_stats['chunk_results']}")
+        # Log detailed chunk results in debug mode; the list grows with the chunk count, so it is passed
+        # as a positional arg and only rendered when a debug handler is installed
+        logger.debug("Detailed chunk results for {}: {}", language_display, validation_stats["chunk_results"])
 
     def generate_flashcards_from_text_sync(
         self, text: str, language: str | None = None, content_type: str = "general"
@@ -1109,12 +1621,12 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
         """
         return ModelConfig.validate_model_config(model)
 
-    def get_supported_models(self) -> list[str]:
+    def get_supported_models(self) -> tuple[str, ...]:
         """
-        Get list of supported model identifiers.
+        Get supported model identifiers.
 
         Returns:
-            List of supported model strings
+            Tuple of supported model strings
         """
         return ModelConfig.get_supported_models()
 
@@ -1156,7 +1668,10 @@ SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE:
             LanguageValidationError: If language is not supported
         """
         try:
-            self.language = LanguageConfig.normalize_language(language)
+            normalized = LanguageConfig.normalize_language(language)
+            if normalized == self.language:
+                return  # Already configured; language_info is unchanged
+            self.language = normalized
             self.language_info = LanguageConfig.get_language_info(self.language)
             logger.info(f"Updated LLMClient language to: {self.language_info.name} ({self.language_info.code})")
         except LanguageValidationError as e:
@@ -6,6 +6,14 @@ in different languages (English, French, Italian, German) with support for
 different content types (academic, technical, general).
 """
 
+import functools
+
+# ISO language codes accepted in place of full language names
+_LANGUAGE_CODES = {"en": "english", "fr": "french", "it": "italian", "de": "german"}
+
+# Content types with their own instructions; any other value uses the general template
+_CONTENT_TYPES = frozenset({"academic", "technical", "general"})
+
 
 class PromptTemplates:
     """Manages language-specific prompt templates for flashcard generation."""
@@ -26,14 +34,18 @@ class PromptTemplates:
             ValueError: If language or content_type is not supported
         """
         language = language.lower().strip()
+        language = _LANGUAGE_CODES.get(language, language)
         content_type = content_type.lower().strip()
+        if content_type not in _CONTENT_TYPES:
+            # Unknown types fall back to the general template, so they share its cache entry
+            content_type = "general"
 
-        # Map language codes to full names
-        language_map = {"en": "english", "fr": "french", "it": "italian", "de": "german"}
-
-        if language in language_map:
-            language = language_map[language]
+        return PromptTemplates._get_normalized_template(language, content_type)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_normalized_template(language: str, content_type: str) -> str:
+        """Build the template for a normalized (language, content_type) pair once; ISO codes share the entry."""
         if language == "english":
             return PromptTemplates._get_english_template(content_type)
         elif language == "french":
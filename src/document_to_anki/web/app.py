@@ -196,15 +196,14 @@ async def get_model_configuration() -> ModelConfigResponse:
     try:
         current_model = ModelConfig.get_model_from_env()
         is_valid = ModelConfig.validate_model_config(current_model)
+        supported_models = ModelConfig.get_supported_models()
         message = None
         if not is_valid and current_model not in ModelConfig.SUPPORTED_MODELS:
-            message = (
-                f"Model '{current_model}' is not supported. Supported models: {ModelConfig.get_supported_models()}"
-            )
+            message = f"Model '{current_model}' is not supported. Supported models: {', '.join(supported_models)}"
         return ModelConfigResponse(
             current_model=current_model,
             is_valid=is_valid,
-            supported_models=ModelConfig.get_supported_models(),
+            supported_models=list(supported_models),
             status="valid" if is_valid else "invalid",
             message=message,
         )
@@ -9,6 +9,7 @@ import pytest
 
 from src.document_to_anki.core.document_processor import DocumentProcessingResult, DocumentProcessor
 from src.document_to_anki.core.flashcard_generator import FlashcardGenerator
+from src.document_to_anki.core.llm_client import LLMClient
 from src.document_to_anki.models.flashcard import Flashcard, ProcessingResult
 from src.document_to_anki.web.session_manager import SessionManager
 
@@ -22,13 +23,28 @@ def deterministic_model_env(monkeypatch):
     needs ``GEMINI_API_KEY`` set. CI runs ``make test`` without secrets (the
     fjacquet/ci standard never passes secrets to the test job), so we inject a
     deterministic dummy key here instead of relying on a real one. Tests that
-    exercise the *missing-key* error path use ``patch.dict(..., clear=True)``,
-    which overrides these values, so the negative cases still hold.
+    exercise the *missing-key* error path call ``clear_model_env``, which
+    unsets these values, so the negative cases still hold.
     """
     monkeypatch.setenv("GEMINI_API_KEY", "test-key")
     monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
 
 
+@pytest.fixture
+def clear_model_env(monkeypatch):
+    """Return a callable that unsets the model-selection environment variables.
+
+    Only the keys ``ModelConfig`` reads are removed, so monkeypatch records a
+    handful of deltas instead of snapshotting the whole environment.
+    """
+
+    def clear():
+        for key in ("MODEL", "GEMINI_API_KEY", "OPENAI_API_KEY"):
+            monkeypatch.delenv(key, raising=False)
+
+    return clear
+
+
 @pytest.fixture
 def temp_directory():
     """Create a temporary directory for test files."""
@@ -293,6 +309,22 @@ def mock_llm_client(mocker):
     return mock_instance
 
 
+@pytest.fixture(scope="session")
+def llm_client(session_mocker):
+    """Provide one real LLMClient per session, built against a stubbed ModelConfig.
+
+    ModelConfig is only consulted while constructing the client, so the patch is
+    stopped before the client is handed out and never leaks into other tests.
+    Tests must not mutate the shared client without restoring it.
+    """
+    mock_config = session_mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
+    mock_config.validate_and_get_model.return_value = "gemini/gemini-2.5-flash"
+    mock_config.validate_model_config.return_value = True
+    client = LLMClient()
+    session_mocker.stop(mock_config)
+    return client
+
+
 @pytest.fixture
 def mock_file_operations(mocker):
     """Mock file operations for testing without actual file I/O."""
@@ -366,7 +398,7 @@ def simulate_file_permission_error(mocker):
 
 
 @pytest.fixture
-def simulate_memory_error(mocker):
+def simulate_memory_error():
     """Simulate memory errors for testing resource handling."""
 
     def memory_error_side_effect(*args, **kwargs):
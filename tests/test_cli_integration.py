@@ -6,6 +6,8 @@ Tests the complete CLI workflow from document processing to CSV export.
 
 # pytest-mock provides the mocker fixture
 
+from types import SimpleNamespace
+
 import pytest
 from click.testing import CliRunner
 
@@ -48,14 +50,8 @@ class TestCLIIntegration:
             return_value=mock_flashcards,
         )
         # Mock litellm.completion to prevent real API calls and return proper response structure
-        mock_response = mocker.Mock()
-        mock_response.choices = [mocker.Mock()]
-        mock_response.choices[0].message = mocker.Mock()
-        mock_response.choices[
-            0
-        ].message.content = (
-            '[{"question": "What is the main topic?", "answer": "Programming concepts", "card_type": "qa"}]'
-        )
+        content = '[{"question": "What is the main topic?", "answer": "Programming concepts", "card_type": "qa"}]'
+        mock_response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
         mocker.patch("src.document_to_anki.core.llm_client.litellm.completion", return_value=mock_response)
 
@@ -472,14 +468,8 @@ class TestCLIInteractiveFeatures:
             return_value=mock_flashcards,
         )
         # Mock litellm.completion to prevent real API calls and return proper response structure
-        mock_response = mocker.Mock()
-        mock_response.choices = [mocker.Mock()]
-        mock_response.choices[0].message = mocker.Mock()
-        mock_response.choices[
-            0
-        ].message.content = (
-            '[{"question": "What is the main topic?", "answer": "Programming concepts", "card_type": "qa"}]'
-        )
+        content = '[{"question": "What is the main topic?", "answer": "Programming concepts", "card_type": "qa"}]'
+        mock_response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
         mocker.patch("src.document_to_anki.core.llm_client.litellm.completion", return_value=mock_response)
 
@@ -59,9 +59,9 @@ class TestComprehensiveLanguageValidation:
             assert LanguageConfig.validate_language(input_lang) is True
             assert LanguageConfig.normalize_language(input_lang) == expected_normalized
 
-    def test_whitespace_handling_all_languages(self):
-        """Test whitespace handling for all supported languages."""
-        whitespace_cases = [
+    @pytest.mark.parametrize(
+        "input_with_whitespace,expected_normalized",
+        [
             ("  english  ", "english"),
             ("\tenglish\n", "english"),
             (" \t english \n ", "english"),
@@ -86,11 +86,12 @@ class TestComprehensiveLanguageValidation:
             ("  de  ", "de"),
             ("\tde\n", "de"),
             (" \t de \n ", "de"),
-        ]
-
-        for input_with_whitespace, expected_normalized in whitespace_cases:
-            assert LanguageConfig.validate_language(input_with_whitespace) is True
-            assert LanguageConfig.normalize_language(input_with_whitespace) == expected_normalized
+        ],
+    )
+    def test_whitespace_handling_all_languages(self, input_with_whitespace, expected_normalized):
+        """Test whitespace handling for all supported languages."""
+        assert LanguageConfig.validate_language(input_with_whitespace) is True
+        assert LanguageConfig.normalize_language(input_with_whitespace) == expected_normalized
 
     def test_invalid_language_codes_comprehensive(self):
         """Test comprehensive set of invalid language codes."""
@@ -5,7 +5,7 @@ This module tests the complete integration of language configuration with enviro
 variables, including parsing, validation, and default behavior.
 """
 
-import os
+import re
 import tempfile
 from pathlib import Path
 
@@ -13,13 +13,25 @@ import pytest
 
 from document_to_anki.config import Settings
 
+# Settings variables these tests read; each test starts with all of them unset
+_SETTINGS_ENV_KEYS = ("CARDLANG", "MODEL", "LOG_LEVEL", "MAX_FILE_SIZE_MB", "GEMINI_API_KEY", "OPENAI_API_KEY")
+
+SUPPORTED_CARDLANG_VALUES = ["english", "french", "italian", "german", "en", "fr", "it", "de"]
+
+
+@pytest.fixture(autouse=True)
+def _clean_settings_env(monkeypatch):
+    """Unset the Settings variables under test; monkeypatch restores only these keys afterwards."""
+    for key in _SETTINGS_ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
 
 class TestEnvironmentVariableIntegration:
     """Integration tests for environment variable parsing and defaults."""
 
-    def test_cardlang_environment_variable_parsing(self, mocker):
-        """Test CARDLANG environment variable parsing for all supported languages."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "env_value,expected_normalized",
+        [
             ("english", "english"),
             ("ENGLISH", "english"),
             ("English", "english"),
@@ -44,16 +56,17 @@ class TestEnvironmentVariableIntegration:
             ("de", "de"),
             ("DE", "de"),
             ("De", "de"),
-        ]
-
-        for env_value, expected_normalized in test_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": env_value}, clear=True)
-            settings = Settings(_env_file=None)
-            assert settings.cardlang == expected_normalized
+        ],
+    )
+    def test_cardlang_environment_variable_parsing(self, monkeypatch, env_value, expected_normalized):
+        """Test CARDLANG environment variable parsing for all supported languages."""
+        monkeypatch.setenv("CARDLANG", env_value)
+        settings = Settings(_env_file=None)
+        assert settings.cardlang == expected_normalized
 
-    def test_cardlang_environment_variable_with_whitespace(self, mocker):
-        """Test CARDLANG environment variable parsing with whitespace."""
-        whitespace_cases = [
+    @pytest.mark.parametrize(
+        "env_value,expected_normalized",
+        [
             ("  english  ", "english"),
             ("\tenglish\n", "english"),
             (" \t english \n ", "english"),
@@ -78,16 +91,17 @@ class TestEnvironmentVariableIntegration:
             ("  de  ", "de"),
             ("\tde\n", "de"),
             (" \t de \n ", "de"),
-        ]
-
-        for env_value, expected_normalized in whitespace_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": env_value}, clear=True)
-            settings = Settings(_env_file=None)
-            assert settings.cardlang == expected_normalized
+        ],
+    )
+    def test_cardlang_environment_variable_with_whitespace(self, monkeypatch, env_value, expected_normalized):
+        """Test CARDLANG environment variable parsing with whitespace."""
+        monkeypatch.setenv("CARDLANG", env_value)
+        settings = Settings(_env_file=None)
+        assert settings.cardlang == expected_normalized
 
-    def test_cardlang_environment_variable_invalid_values(self, mocker):
-        """Test CARDLANG environment variable with invalid values."""
-        invalid_values = [
+    @pytest.mark.parametrize(
+        "invalid_value",
+        [
             "spanish",
             "portuguese",
             "chinese",
@@ -100,31 +114,27 @@ class TestEnvironmentVariableIntegration:
             "zh",
             "ja",
             "notlang",
-        ]
-
-        for invalid_value in invalid_values:
-            mocker.patch.dict(os.environ, {"CARDLANG": invalid_value}, clear=True)
-            with pytest.raises(ValueError) as exc_info:
-                Settings(_env_file=None)
-
-            error_msg = str(exc_info.value)
-            assert f"Unsupported language '{invalid_value}'" in error_msg
-            assert "Supported languages:" in error_msg
-
-    def test_cardlang_environment_variable_empty_values(self, mocker):
+        ],
+    )
+    def test_cardlang_environment_variable_invalid_values(self, monkeypatch, invalid_value):
+        """Test CARDLANG environment variable with invalid values."""
+        monkeypatch.setenv("CARDLANG", invalid_value)
+        with pytest.raises(
+            ValueError, match=rf"Unsupported language '{re.escape(invalid_value)}'\. Supported languages:"
+        ):
+            Settings(_env_file=None)
+
+    @pytest.mark.parametrize("empty_value", ["", "   ", "\t", "\n", "\t\n", "  \t  \n  "])
+    def test_cardlang_environment_variable_empty_values(self, monkeypatch, empty_value):
         """Test CARDLANG environment variable with empty values."""
-        empty_values = ["", "   ", "\t", "\n", "\t\n", "  \t  \n  "]
-
-        for empty_value in empty_values:
-            mocker.patch.dict(os.environ, {"CARDLANG": empty_value}, clear=True)
-            settings = Settings(_env_file=None)
-            # Empty values should default to English
-            assert settings.cardlang == "english"
+        monkeypatch.setenv("CARDLANG", empty_value)
+        settings = Settings(_env_file=None)
+        # Empty values should default to English
+        assert settings.cardlang == "english"
 
-    def test_cardlang_environment_variable_not_set(self, mocker):
+    def test_cardlang_environment_variable_not_set(self):
         """Test behavior when CARDLANG environment variable is not set."""
-        # Clear all environment variables
-        mocker.patch.dict(os.environ, {}, clear=True)
+        # _clean_settings_env has already unset CARDLANG
         settings = Settings(_env_file=None)
 
         # Should default to English
@@ -133,7 +143,7 @@ class TestEnvironmentVariableIntegration:
         assert settings.get_language_code() == "en"
         assert settings.get_prompt_key() == "english"
 
-    def test_cardlang_with_env_file_loading(self, mocker):
+    def test_cardlang_with_env_file_loading(self):
         """Test CARDLANG loading from .env file."""
         # Create temporary .env file
         with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as env_file:
@@ -143,9 +153,6 @@ class TestEnvironmentVariableIntegration:
             env_file_path = env_file.name
 
         try:
-            # Clear environment variables
-            mocker.patch.dict(os.environ, {}, clear=True)
-
             # Load settings from .env file
             settings = Settings(_env_file=env_file_path)
 
@@ -161,7 +168,7 @@ class TestEnvironmentVariableIntegration:
             # Clean up
             Path(env_file_path).unlink(missing_ok=True)
 
-    def test_environment_variable_overrides_env_file(self, mocker):
+    def test_environment_variable_overrides_env_file(self, monkeypatch):
         """Test that environment variables override .env file values."""
         # Create temporary .env file with one language
         with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as env_file:
@@ -171,7 +178,7 @@ class TestEnvironmentVariableIntegration:
 
         try:
             # Set environment variable to different language
-            mocker.patch.dict(os.environ, {"CARDLANG": "italian"}, clear=True)
+            monkeypatch.setenv("CARDLANG", "italian")
 
             # Load settings - env var should override .env file
             settings = Settings(_env_file=env_file_path)
@@ -183,7 +190,7 @@ class TestEnvironmentVariableIntegration:
             # Clean up
             Path(env_file_path).unlink(missing_ok=True)
 
-    def test_cardlang_with_other_environment_variables(self, mocker):
+    def test_cardlang_with_other_environment_variables(self, monkeypatch):
         """Test CARDLANG integration with other environment variables."""
         env_vars = {
             "CARDLANG": "german",
@@ -193,7 +200,8 @@ class TestEnvironmentVariableIntegration:
             "GEMINI_API_KEY": "test-api-key",
         }
 
-        mocker.patch.dict(os.environ, env_vars, clear=True)
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
         settings = Settings(_env_file=None)
 
         # Language configuration
@@ -208,9 +216,9 @@ class TestEnvironmentVariableIntegration:
         assert settings.max_file_size_mb == 150
         assert settings.gemini_api_key == "test-api-key"
 
-    def test_cardlang_case_insensitive_environment_parsing(self, mocker):
-        """Test that CARDLANG environment variable parsing is case insensitive."""
-        case_variations = [
+    @pytest.mark.parametrize(
+        "env_value,expected_normalized",
+        [
             ("ENGLISH", "english"),
             ("English", "english"),
             ("eNgLiSh", "english"),
@@ -235,42 +243,35 @@ class TestEnvironmentVariableIntegration:
             ("DE", "de"),
             ("De", "de"),
             ("dE", "de"),
-        ]
-
-        for env_value, expected_normalized in case_variations:
-            mocker.patch.dict(os.environ, {"CARDLANG": env_value}, clear=True)
-            settings = Settings(_env_file=None)
-            assert settings.cardlang == expected_normalized
+        ],
+    )
+    def test_cardlang_case_insensitive_environment_parsing(self, monkeypatch, env_value, expected_normalized):
+        """Test that CARDLANG environment variable parsing is case insensitive."""
+        monkeypatch.setenv("CARDLANG", env_value)
+        settings = Settings(_env_file=None)
+        assert settings.cardlang == expected_normalized
 
-    def test_settings_instantiation_multiple_times(self, mocker):
+    @pytest.mark.parametrize("language", SUPPORTED_CARDLANG_VALUES)
+    def test_settings_instantiation_multiple_times(self, monkeypatch, language):
         """Test that Settings can be instantiated multiple times with different CARDLANG values."""
-        languages = ["english", "french", "italian", "german", "en", "fr", "it", "de"]
-
-        for language in languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": language}, clear=True)
-            settings = Settings(_env_file=None)
+        monkeypatch.setenv("CARDLANG", language)
+        settings = Settings(_env_file=None)
 
-            # Verify language configuration
-            assert settings.cardlang in ["english", "french", "italian", "german", "en", "fr", "it", "de"]
+        # Verify language configuration
+        assert settings.cardlang in SUPPORTED_CARDLANG_VALUES
 
-            # Verify helper methods work
-            lang_info = settings.get_language_info()
-            assert lang_info.name in ["English", "French", "Italian", "German"]
-            assert lang_info.code in ["en", "fr", "it", "de"]
-            assert lang_info.prompt_key in ["english", "french", "italian", "german"]
+        # Verify helper methods work
+        lang_info = settings.get_language_info()
+        assert lang_info.name in ["English", "French", "Italian", "German"]
+        assert lang_info.code in ["en", "fr", "it", "de"]
+        assert lang_info.prompt_key in ["english", "french", "italian", "german"]
 
-    def test_backward_compatibility_default_behavior(self, mocker):
+    def test_backward_compatibility_default_behavior(self, monkeypatch):
         """Test backward compatibility - defaults to English when not configured."""
         # Simulate existing user with no CARDLANG set (pre-language-config version)
-        mocker.patch.dict(
-            os.environ,
-            {
-                "MODEL": "gemini/gemini-2.5-flash",
-                "LOG_LEVEL": "INFO",
-                # No CARDLANG set
-            },
-            clear=True,
-        )
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        # No CARDLANG set
 
         settings = Settings(_env_file=None)
 
@@ -284,10 +285,10 @@ class TestEnvironmentVariableIntegration:
         assert settings.model == "gemini/gemini-2.5-flash"
         assert settings.log_level == "INFO"
 
-    def test_migration_from_hardcoded_french(self, mocker):
+    def test_migration_from_hardcoded_french(self, monkeypatch):
         """Test migration scenario from hardcoded French to configurable system."""
         # Test that users can explicitly set French if they want to maintain previous behavior
-        mocker.patch.dict(os.environ, {"CARDLANG": "french"}, clear=True)
+        monkeypatch.setenv("CARDLANG", "french")
         settings = Settings(_env_file=None)
 
         assert settings.cardlang == "french"
@@ -295,29 +296,27 @@ class TestEnvironmentVariableIntegration:
         assert settings.get_language_name() == "French"
         assert settings.get_prompt_key() == "french"
 
-    def test_error_messages_provide_migration_guidance(self, mocker):
+    @pytest.mark.parametrize("invalid_lang", ["spanish", "portuguese", "chinese"])
+    def test_error_messages_provide_migration_guidance(self, monkeypatch, invalid_lang):
         """Test that error messages provide helpful migration guidance."""
-        invalid_languages = ["spanish", "portuguese", "chinese"]
-
-        for invalid_lang in invalid_languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": invalid_lang}, clear=True)
+        monkeypatch.setenv("CARDLANG", invalid_lang)
 
-            with pytest.raises(ValueError) as exc_info:
-                Settings(_env_file=None)
+        with pytest.raises(ValueError) as exc_info:
+            Settings(_env_file=None)
 
-            error_msg = str(exc_info.value)
+        error_msg = str(exc_info.value)
 
-            # Should mention the invalid language
-            assert invalid_lang in error_msg
+        # Should mention the invalid language
+        assert invalid_lang in error_msg
 
-            # Should provide list of supported languages for migration
-            assert "Supported languages:" in error_msg
-            assert "English" in error_msg
-            assert "French" in error_msg
-            assert "Italian" in error_msg
-            assert "German" in error_msg
+        # Should provide list of supported languages for migration
+        assert "Supported languages:" in error_msg
+        assert "English" in error_msg
+        assert "French" in error_msg
+        assert "Italian" in error_msg
+        assert "German" in error_msg
 
-    def test_env_file_with_invalid_cardlang(self, mocker):
+    def test_env_file_with_invalid_cardlang(self):
         """Test .env file with invalid CARDLANG value."""
         # Create temporary .env file with invalid language
         with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as env_file:
@@ -326,8 +325,6 @@ class TestEnvironmentVariableIntegration:
             env_file_path = env_file.name
 
         try:
-            mocker.patch.dict(os.environ, {}, clear=True)
-
             with pytest.raises(ValueError) as exc_info:
                 Settings(_env_file=env_file_path)
 
@@ -339,7 +336,7 @@ class TestEnvironmentVariableIntegration:
             # Clean up
             Path(env_file_path).unlink(missing_ok=True)
 
-    def test_env_file_with_empty_cardlang(self, mocker):
+    def test_env_file_with_empty_cardlang(self):
         """Test .env file with empty CARDLANG value."""
         # Create temporary .env file with empty language
         with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as env_file:
@@ -348,8 +345,6 @@ class TestEnvironmentVariableIntegration:
             env_file_path = env_file.name
 
         try:
-            mocker.patch.dict(os.environ, {}, clear=True)
-
             settings = Settings(_env_file=env_file_path)
 
             # Empty value should default to English
@@ -360,7 +355,7 @@ class TestEnvironmentVariableIntegration:
             # Clean up
             Path(env_file_path).unlink(missing_ok=True)
 
-    def test_settings_validation_with_complex_environment(self, mocker):
+    def test_settings_validation_with_complex_environment(self, monkeypatch):
         """Test Settings validation with complex environment setup."""
         # Set up complex environment with multiple variables
         complex_env = {
@@ -376,7 +371,8 @@ class TestEnvironmentVariableIntegration:
             "LANG": "en_US.UTF-8",
         }
 
-        mocker.patch.dict(os.environ, complex_env, clear=True)
+        for key, value in complex_env.items():
+            monkeypatch.setenv(key, value)
         settings = Settings(_env_file=None)
 
         # Language should be properly normalized
@@ -390,7 +386,7 @@ class TestEnvironmentVariableIntegration:
         assert settings.max_file_size_mb == 200
         assert settings.gemini_api_key == "test-key-123"
 
-    def test_concurrent_settings_instantiation(self, mocker):
+    def test_concurrent_settings_instantiation(self):
         """Test concurrent Settings instantiation with different CARDLANG values."""
         import concurrent.futures
 
@@ -399,16 +395,14 @@ class TestEnvironmentVariableIntegration:
 
         def create_settings_with_language(language):
             try:
-                # Each thread gets its own environment
-                thread_env = {"CARDLANG": language}
-                mocker.patch.dict(os.environ, thread_env, clear=True)
-                settings = Settings(_env_file=None)
+                # The process environment is shared between threads, so each thread passes its language directly
+                settings = Settings(_env_file=None, CARDLANG=language)
                 return (language, settings.cardlang, settings.get_language_name())
             except Exception as e:
                 errors.append((language, str(e)))
                 return None
 
-        languages = ["english", "french", "italian", "german", "en", "fr", "it", "de"]
+        languages = SUPPORTED_CARDLANG_VALUES
 
         # Test with multiple threads
         with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
@@ -427,12 +421,12 @@ class TestEnvironmentVariableIntegration:
             assert normalized_lang in ["english", "french", "italian", "german", "en", "fr", "it", "de"]
             assert language_name in ["English", "French", "Italian", "German"]
 
-    def test_performance_with_repeated_settings_creation(self, mocker):
+    def test_performance_with_repeated_settings_creation(self, monkeypatch):
         """Test performance with repeated Settings creation."""
         import time
 
         # Test creating Settings multiple times with same language
-        mocker.patch.dict(os.environ, {"CARDLANG": "french"}, clear=True)
+        monkeypatch.setenv("CARDLANG", "french")
 
         start_time = time.time()
         for _ in range(100):
@@ -448,7 +442,7 @@ class TestEnvironmentVariableIntegration:
 
         start_time = time.time()
         for language in languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": language}, clear=True)
+            monkeypatch.setenv("CARDLANG", language)
             settings = Settings(_env_file=None)
             assert settings.cardlang == language
         end_time = time.time()
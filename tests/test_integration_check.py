@@ -9,97 +9,124 @@ This test validates that ModelConfig is properly integrated in:
 - Error handling for invalid models and missing API keys
 """
 
-import os
+from collections.abc import Mapping
 
-# pytest-mock provides the mocker fixture
 import pytest
 
 from src.document_to_anki.config import ConfigurationError, ModelConfig
-from src.document_to_anki.core.flashcard_generator import FlashcardGenerator
-from src.document_to_anki.core.llm_client import LLMClient
+
+MODEL_ENVS = [
+    pytest.param({"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-gemini-key"}, id="gemini"),
+    pytest.param({"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-openai-key"}, id="openai"),
+]
+
+
+@pytest.fixture
+def env_for_model(request, monkeypatch):
+    """Apply a parametrized model environment and return the model it selects."""
+    for key, value in request.param.items():
+        monkeypatch.setenv(key, value)
+    return request.param["MODEL"]
+
+
+@pytest.fixture
+def llm_client_cls():
+    """Import LLMClient lazily so ModelConfig-only tests skip the litellm import chain."""
+    from src.document_to_anki.core.llm_client import LLMClient
+
+    return LLMClient
+
+
+@pytest.fixture
+def flashcard_generator_cls():
+    """Import FlashcardGenerator lazily so ModelConfig-only tests skip the litellm import chain."""
+    from src.document_to_anki.core.flashcard_generator import FlashcardGenerator
+
+    return FlashcardGenerator
 
 
 class TestModelConfigIntegration:
     """Test ModelConfig integration throughout the application."""
 
-    def test_llm_client_uses_model_config_by_default(self, mocker):
+    @pytest.mark.parametrize("env_for_model", MODEL_ENVS, indirect=True)
+    def test_llm_client_uses_model_config_by_default(self, env_for_model, llm_client_cls):
         """Test that LLMClient uses ModelConfig when no model is provided."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
-        client = LLMClient()
-        assert client.get_current_model() == "gemini/gemini-2.5-flash"
+        client = llm_client_cls()
+        assert client.get_current_model() == env_for_model
 
-    def test_llm_client_validates_provided_model(self, mocker):
+    def test_llm_client_validates_provided_model(self, monkeypatch, llm_client_cls):
         """Test that LLMClient validates provided model using ModelConfig."""
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         # Valid model should work
-        client = LLMClient(model="gemini/gemini-2.5-flash")
+        client = llm_client_cls(model="gemini/gemini-2.5-flash")
         assert client.get_current_model() == "gemini/gemini-2.5-flash"
 
         # Invalid model should raise ConfigurationError
         with pytest.raises(ConfigurationError) as exc_info:
-            LLMClient(model="invalid/model")
+            llm_client_cls(model="invalid/model")
         assert "Unsupported model" in str(exc_info.value)
 
-    def test_llm_client_validates_api_key_for_model(self, mocker):
+    def test_llm_client_validates_api_key_for_model(self, clear_model_env, llm_client_cls):
         """Test that LLMClient validates API key for the selected model."""
         # Missing API key should raise ConfigurationError
-        mocker.patch.dict(os.environ, {}, clear=True)
+        clear_model_env()
         with pytest.raises(ConfigurationError) as exc_info:
-            LLMClient(model="gemini/gemini-2.5-flash")
+            llm_client_cls(model="gemini/gemini-2.5-flash")
         assert "Missing API key" in str(exc_info.value)
         assert "GEMINI_API_KEY" in str(exc_info.value)
 
-    def test_flashcard_generator_uses_model_config_llm_client(self, mocker):
+    @pytest.mark.parametrize("env_for_model", MODEL_ENVS, indirect=True)
+    def test_flashcard_generator_uses_model_config_llm_client(self, env_for_model, flashcard_generator_cls):
         """Test that FlashcardGenerator creates LLMClient with ModelConfig."""
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-key"})
-        generator = FlashcardGenerator()
-        assert generator.llm_client.get_current_model() == "openai/gpt-4"
+        generator = flashcard_generator_cls()
+        assert generator.llm_client.get_current_model() == env_for_model
 
-    def test_flashcard_generator_propagates_configuration_errors(self, mocker):
+    def test_flashcard_generator_propagates_configuration_errors(self, monkeypatch, flashcard_generator_cls):
         """Test that FlashcardGenerator propagates ModelConfig errors."""
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         with pytest.raises(ConfigurationError) as exc_info:
-            FlashcardGenerator()
+            flashcard_generator_cls()
         assert "Unsupported model" in str(exc_info.value)
 
-    def test_model_config_environment_variable_precedence(self, mocker):
+    def test_model_config_environment_variable_precedence(self, monkeypatch, clear_model_env):
         """Test that MODEL environment variable takes precedence."""
         # Test default model
-        mocker.patch.dict(os.environ, {}, clear=True)
+        clear_model_env()
         model = ModelConfig.get_model_from_env()
         assert model == ModelConfig.DEFAULT_MODEL
 
         # Test custom model
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4"})
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
         model = ModelConfig.get_model_from_env()
         assert model == "openai/gpt-4"
 
-    def test_model_config_validation_with_different_providers(self, mocker):
+    def test_model_config_validation_with_different_providers(self, monkeypatch, clear_model_env):
         """Test ModelConfig validation with different model providers."""
         # Test Gemini model validation
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         assert ModelConfig.validate_model_config("gemini/gemini-2.5-flash") is True
         assert ModelConfig.validate_model_config("gemini/gemini-2.5-pro") is True
 
         # Test OpenAI model validation
-        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
         assert ModelConfig.validate_model_config("openai/gpt-4") is True
         assert ModelConfig.validate_model_config("openai/gpt-3.5-turbo") is True
 
         # Test missing API keys
-        mocker.patch.dict(os.environ, {}, clear=True)
+        clear_model_env()
         assert ModelConfig.validate_model_config("gemini/gemini-2.5-flash") is False
         assert ModelConfig.validate_model_config("openai/gpt-4") is False
 
-    def test_model_config_validate_and_get_model_success(self, mocker):
+    def test_model_config_validate_and_get_model_success(self, monkeypatch):
         """Test successful model validation and retrieval."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-pro", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-pro")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         model = ModelConfig.validate_and_get_model()
         assert model == "gemini/gemini-2.5-pro"
 
-    def test_model_config_validate_and_get_model_invalid_model(self, mocker):
+    def test_model_config_validate_and_get_model_invalid_model(self, monkeypatch):
         """Test error handling for invalid model."""
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
@@ -107,9 +134,10 @@ class TestModelConfigIntegration:
         assert "Unsupported model 'invalid/model'" in error_msg
         assert "gemini/gemini-2.5-flash" in error_msg  # Should list supported models
 
-    def test_model_config_validate_and_get_model_missing_api_key(self, mocker):
+    def test_model_config_validate_and_get_model_missing_api_key(self, monkeypatch, clear_model_env):
         """Test error handling for missing API key."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash"}, clear=True)
+        clear_model_env()
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
@@ -141,38 +169,39 @@ class TestModelConfigIntegration:
             assert api_key is not None
             assert api_key.endswith("_API_KEY")
 
-    def test_end_to_end_model_configuration_flow(self, mocker):
+    @pytest.mark.parametrize("env_for_model", MODEL_ENVS, indirect=True)
+    def test_end_to_end_model_configuration_flow(self, env_for_model, llm_client_cls, flashcard_generator_cls):
         """Test complete end-to-end model configuration flow."""
-        # Test successful configuration and component initialization
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-openai-key"})
         # Validate model configuration
         model = ModelConfig.validate_and_get_model()
-        assert model == "openai/gpt-4"
+        assert model == env_for_model
 
         # Initialize LLMClient with validated model
-        llm_client = LLMClient()
-        assert llm_client.get_current_model() == "openai/gpt-4"
+        llm_client = llm_client_cls()
+        assert llm_client.get_current_model() == env_for_model
 
         # Initialize FlashcardGenerator with configured LLMClient
-        generator = FlashcardGenerator()
-        assert generator.llm_client.get_current_model() == "openai/gpt-4"
+        generator = flashcard_generator_cls()
+        assert generator.llm_client.get_current_model() == env_for_model
 
-    def test_model_switching_between_providers(self, mocker):
+    def test_model_switching_between_providers(self, monkeypatch, flashcard_generator_cls):
         """Test switching between different model providers."""
         # Start with Gemini
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-gemini-key"})
-        generator1 = FlashcardGenerator()
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-gemini-key")
+        generator1 = flashcard_generator_cls()
         assert generator1.llm_client.get_current_model() == "gemini/gemini-2.5-flash"
 
         # Switch to OpenAI
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-openai-key"})
-        generator2 = FlashcardGenerator()
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+        generator2 = flashcard_generator_cls()
         assert generator2.llm_client.get_current_model() == "openai/gpt-4"
 
-    def test_configuration_error_messages_are_helpful(self, mocker):
+    def test_configuration_error_messages_are_helpful(self, monkeypatch, clear_model_env):
         """Test that configuration error messages provide helpful guidance."""
         # Test unsupported model error
-        mocker.patch.dict(os.environ, {"MODEL": "unsupported/model"})
+        monkeypatch.setenv("MODEL", "unsupported/model")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
@@ -181,7 +210,8 @@ class TestModelConfigIntegration:
         assert "gemini/gemini-2.5-flash" in error_msg  # Should suggest valid models
 
         # Test missing API key error
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash"}, clear=True)
+        clear_model_env()
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
@@ -189,12 +219,10 @@ class TestModelConfigIntegration:
         assert "Missing API key" in error_msg
         assert "GEMINI_API_KEY" in error_msg  # Should specify required key
 
-    def test_default_model_fallback(self, mocker):
+    def test_default_model_fallback(self, monkeypatch, clear_model_env):
         """Test that default model is used when MODEL env var is not set."""
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}, clear=True)
-        # Remove MODEL env var if it exists
-        if "MODEL" in os.environ:
-            del os.environ["MODEL"]
+        clear_model_env()
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
 
         model = ModelConfig.validate_and_get_model()
         assert model == ModelConfig.DEFAULT_MODEL
@@ -206,7 +234,7 @@ class TestModelConfigIntegration:
         assert ModelConfig.DEFAULT_MODEL in ModelConfig.SUPPORTED_MODELS
 
         # Test SUPPORTED_MODELS structure
-        assert isinstance(ModelConfig.SUPPORTED_MODELS, dict)
+        assert isinstance(ModelConfig.SUPPORTED_MODELS, Mapping)
         assert len(ModelConfig.SUPPORTED_MODELS) > 0
 
         # Test all models follow expected format
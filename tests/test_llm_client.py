@@ -2,26 +2,95 @@
 Tests for the LLM client module.
 """
 
-# pytest-mock provides the mocker fixture
+import asyncio
+import re
+from types import SimpleNamespace
 
+# pytest-mock provides the mocker fixture
 import pytest
+from loguru import logger
 
-from src.document_to_anki.config import ConfigurationError
+from src.document_to_anki.config import ConfigurationError, ModelConfig
 from src.document_to_anki.core.llm_client import FlashcardData, LLMClient
 
+# Keep this module on one xdist worker so the module-scoped litellm patch is installed once
+pytestmark = pytest.mark.xdist_group(name="llm_client")
+
+# Canned LLM responses shared by the parsing and generation tests
+SINGLE_QA_JSON_RESPONSE = """[
+    {
+        "question": "What is Python?",
+        "answer": "A programming language",
+        "card_type": "qa"
+    }
+]"""
+
+QA_PATTERN_RESPONSE = """
+Q: What is Python?
+A: A programming language
+
+Q: Who created Python?
+A: Guido van Rossum
+"""
+
+QUESTION_ANSWER_PATTERN_RESPONSE = """
+Question: What is Python?
+Answer: A programming language
+
+Question: Who created Python?
+Answer: Guido van Rossum
+"""
+
+NUMBERED_PATTERN_RESPONSE = """
+1. What is Python? - A programming language
+2. Who created Python? - Guido van Rossum
+"""
+
+# Text longer than max_tokens * 4 characters for the chunking tests (~20,000 characters)
+LONG_TEST_TEXT = "This is a sentence. " * 1000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_litellm(module_mocker):
+    """Patch litellm.completion once for the whole module so no test reaches a real provider."""
+    return module_mocker.patch("litellm.completion")
+
+
+async def _skip_sleep(delay, result=None):
+    """Stand-in for the client's backoff sleep that returns immediately."""
+    return result
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_sleep():
+    """Skip the retry backoff delays for the whole module so tests never wait on the wall clock."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.document_to_anki.core.llm_client._sleep", _skip_sleep)
+        yield
+
+
+@pytest.fixture
+def mock_completion(_patch_litellm):
+    """Hand the shared litellm.completion mock to a test with its previous configuration cleared."""
+    _patch_litellm.reset_mock(return_value=True, side_effect=True)
+    return _patch_litellm
+
+
+@pytest.fixture
+def fast_retry_client(llm_client, monkeypatch):
+    """Shared LLMClient with zero retry backoff; monkeypatch restores it after the test."""
+    monkeypatch.setattr(llm_client, "base_delay", 0.0)
+    return llm_client
+
+
+def make_response(content: str) -> SimpleNamespace:
+    """Build a litellm completion response; only ``choices[0].message.content`` is ever read."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
 
 class TestLLMClient:
     """Test cases for LLMClient class."""
 
-    @pytest.fixture(autouse=True)
-    def setup_client(self, mocker):
-        """Set up test fixtures."""
-        # Mock ModelConfig to avoid environment dependencies
-        mock_config = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
-        mock_config.validate_and_get_model.return_value = "gemini/gemini-2.5-flash"
-        mock_config.validate_model_config.return_value = True
-        self.client = LLMClient()
-
     def test_init(self, mocker):
         """Test LLMClient initialization."""
         mock_config = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
@@ -39,25 +108,24 @@ class TestLLMClient:
         client = LLMClient()
         assert client.model == "openai/gpt-4"
 
-    def test_init_invalid_model(self, mocker):
-        """Test LLMClient initialization with invalid model."""
-        mock_config = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
-        mock_config.validate_model_config.return_value = False
-        mock_config.SUPPORTED_MODELS = {"gemini/gemini-2.5-flash": "GEMINI_API_KEY"}
-        mock_config.get_supported_models.return_value = ["gemini/gemini-2.5-flash"]
-
-        with pytest.raises(ConfigurationError, match="Unsupported model"):
-            LLMClient(model="invalid/model")
-
-    def test_init_missing_api_key(self, mocker):
-        """Test LLMClient initialization with missing API key."""
-        mock_config = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
-        mock_config.validate_model_config.return_value = False
-        mock_config.SUPPORTED_MODELS = {"gemini/gemini-2.5-flash": "GEMINI_API_KEY"}
-        mock_config.get_required_api_key.return_value = "GEMINI_API_KEY"
-
-        with pytest.raises(ConfigurationError, match="Missing API key"):
-            LLMClient(model="gemini/gemini-2.5-flash")
+    @pytest.mark.parametrize(
+        "model,expected_match",
+        [
+            pytest.param("invalid/model", "Unsupported model", id="invalid-model"),
+            pytest.param("gemini/gemini-2.5-flash", "Missing API key", id="missing-api-key"),
+        ],
+    )
+    def test_init_error_paths(self, monkeypatch, clear_model_env, model, expected_match):
+        """Test that an explicit invalid model or missing API key fails exactly like the MODEL path."""
+        clear_model_env()
+        monkeypatch.setenv("MODEL", model)
+        with pytest.raises(ConfigurationError, match=expected_match) as from_env:
+            ModelConfig.validate_and_get_model()
+
+        with pytest.raises(ConfigurationError) as explicit:
+            LLMClient(model=model)
+
+        assert str(explicit.value) == str(from_env.value)
 
     def test_validate_model_and_api_key(self, mocker):
         """Test model and API key validation."""
@@ -90,37 +158,35 @@ class TestLLMClient:
 
         assert client.get_current_model() == "openai/gpt-4"
 
-    def test_chunk_text_for_processing_short_text(self):
+    def test_chunk_text_for_processing_short_text(self, llm_client):
         """Test text chunking with short text."""
         text = "This is a short text."
-        chunks = self.client.chunk_text_for_processing(text)
+        chunks = llm_client.chunk_text_for_processing(text)
         assert len(chunks) == 1
         assert chunks[0] == text
 
-    def test_chunk_text_for_processing_long_text(self):
+    def test_chunk_text_for_processing_long_text(self, llm_client):
         """Test text chunking with long text."""
-        # Create a text longer than max_tokens * 4 characters
-        long_text = "This is a sentence. " * 1000  # ~20,000 characters
-        chunks = self.client.chunk_text_for_processing(long_text, max_tokens=1000)
+        chunks = llm_client.chunk_text_for_processing(LONG_TEST_TEXT, max_tokens=1000)
 
         assert len(chunks) > 1
         for chunk in chunks:
             assert len(chunk) <= 4000  # max_tokens * 4
 
-    def test_chunk_text_for_processing_paragraphs(self):
+    def test_chunk_text_for_processing_paragraphs(self, llm_client):
         """Test text chunking respects paragraph boundaries."""
         text = "Paragraph 1.\n\nParagraph 2.\n\nParagraph 3."
-        chunks = self.client.chunk_text_for_processing(text, max_tokens=10)
+        chunks = llm_client.chunk_text_for_processing(text, max_tokens=10)
 
         # Should split by paragraphs
         assert len(chunks) >= 1
         for chunk in chunks:
             assert chunk.strip()
 
-    def test_create_flashcard_prompt(self):
+    def test_create_flashcard_prompt(self, llm_client):
         """Test flashcard prompt creation."""
         text = "Python is a programming language."
-        prompt = self.client._create_flashcard_prompt(text, language="english")
+        prompt = llm_client._create_flashcard_prompt(text, language="english")
 
         assert "Python is a programming language." in prompt
         assert "JSON array" in prompt
@@ -128,9 +194,11 @@ class TestLLMClient:
         assert "answer" in prompt
         assert "card_type" in prompt
 
-    def test_parse_flashcard_response_valid_json(self):
-        """Test parsing valid JSON response."""
-        response = """[
+    @pytest.mark.parametrize(
+        "response,expected_types",
+        [
+            pytest.param(
+                """[
             {
                 "question": "What is Python?",
                 "answer": "A programming language",
@@ -141,34 +209,22 @@ class TestLLMClient:
                 "answer": "programming language",
                 "card_type": "cloze"
             }
-        ]"""
-
-        flashcards = self.client._parse_flashcard_response(response)
-
-        assert len(flashcards) == 2
-        assert flashcards[0].question == "What is Python?"
-        assert flashcards[0].answer == "A programming language"
-        assert flashcards[0].card_type == "qa"
-        assert flashcards[1].card_type == "cloze"
-
-    def test_parse_flashcard_response_invalid_json(self):
-        """Test parsing invalid JSON response with fallback."""
-        response = """
-        Q: What is Python?
-        A: A programming language
-        
-        Q: Who created Python?
-        A: Guido van Rossum
-        """
-
-        flashcards = self.client._parse_flashcard_response(response)
-
-        assert len(flashcards) == 2
+        ]""",
+                ["qa", "cloze"],
+                id="valid-json",
+            ),
+            pytest.param(QA_PATTERN_RESPONSE, ["qa", "qa"], id="invalid-json-fallback"),
+        ],
+    )
+    def test_parse_flashcard_response(self, llm_client, response, expected_types):
+        """Test parsing valid JSON responses and falling back for invalid JSON."""
+        flashcards = llm_client._parse_flashcard_response(response)
+
+        assert [card.card_type for card in flashcards] == expected_types
         assert flashcards[0].question == "What is Python?"
         assert flashcards[0].answer == "A programming language"
-        assert flashcards[0].card_type == "qa"
 
-    def test_parse_flashcard_response_missing_fields(self):
+    def test_parse_flashcard_response_missing_fields(self, llm_client):
         """Test parsing response with missing required fields."""
         response = """[
             {
@@ -182,13 +238,13 @@ class TestLLMClient:
             }
         ]"""
 
-        flashcards = self.client._parse_flashcard_response(response)
+        flashcards = llm_client._parse_flashcard_response(response)
 
         # Should skip the invalid one and keep the valid one
         assert len(flashcards) == 1
         assert flashcards[0].question == "Valid question"
 
-    def test_parse_flashcard_response_invalid_card_type(self):
+    def test_parse_flashcard_response_invalid_card_type(self, llm_client):
         """Test parsing response with invalid card_type."""
         response = """[
             {
@@ -198,156 +254,325 @@ class TestLLMClient:
             }
         ]"""
 
-        flashcards = self.client._parse_flashcard_response(response)
+        flashcards = llm_client._parse_flashcard_response(response)
 
         assert len(flashcards) == 1
         assert flashcards[0].card_type == "qa"  # Should default to "qa"
 
-    def test_fallback_parse_qa_pattern(self):
-        """Test fallback parser with Q: A: pattern."""
-        response = """
-        Q: What is Python?
-        A: A programming language
-        
-        Q: Who created Python?
-        A: Guido van Rossum
-        """
-
-        flashcards = self.client._fallback_parse(response)
-
-        assert len(flashcards) == 2
-        assert flashcards[0].question == "What is Python?"
-        assert flashcards[0].answer == "A programming language"
-        assert flashcards[1].question == "Who created Python?"
-        assert flashcards[1].answer == "Guido van Rossum"
-
-    def test_fallback_parse_question_answer_pattern(self):
-        """Test fallback parser with Question: Answer: pattern."""
-        response = """
-        Question: What is Python?
-        Answer: A programming language
-        
-        Question: Who created Python?
-        Answer: Guido van Rossum
-        """
-
-        flashcards = self.client._fallback_parse(response)
-
-        assert len(flashcards) == 2
-        assert flashcards[0].question == "What is Python?"
-        assert flashcards[0].answer == "A programming language"
-
-    def test_fallback_parse_numbered_pattern(self):
-        """Test fallback parser with numbered pattern."""
-        response = """
-        1. What is Python? - A programming language
-        2. Who created Python? - Guido van Rossum
-        """
-
-        flashcards = self.client._fallback_parse(response)
-
-        assert len(flashcards) == 2
-        assert flashcards[0].question == "What is Python?"
-        assert flashcards[0].answer == "A programming language"
+    @pytest.mark.parametrize(
+        "response",
+        [
+            pytest.param(QA_PATTERN_RESPONSE, id="qa"),
+            pytest.param(QUESTION_ANSWER_PATTERN_RESPONSE, id="question-answer"),
+            pytest.param(NUMBERED_PATTERN_RESPONSE, id="numbered"),
+        ],
+    )
+    def test_fallback_parse_patterns(self, llm_client, response):
+        """Test fallback parser with Q:/A:, Question:/Answer: and numbered patterns."""
+        flashcards = llm_client._fallback_parse(response)
+
+        assert [(card.question, card.answer) for card in flashcards] == [
+            ("What is Python?", "A programming language"),
+            ("Who created Python?", "Guido van Rossum"),
+        ]
 
     @pytest.mark.asyncio
-    async def test_make_api_call_with_retry_success(self, mocker):
+    async def test_make_api_call_with_retry_success(self, llm_client, mock_completion):
         """Test successful API call."""
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = "Test response"
-
-        mocker.patch("litellm.completion", return_value=mock_response)
-        result = await self.client._make_api_call_with_retry("test prompt")
+        mock_completion.return_value = make_response("Test response")
+        result = await llm_client._make_api_call_with_retry("test prompt")
         assert result == "Test response"
 
     @pytest.mark.asyncio
-    async def test_make_api_call_with_retry_failure(self, mocker):
+    async def test_make_api_call_with_retry_failure(self, fast_retry_client, mock_completion, monkeypatch):
         """Test API call with all retries failing."""
-        mocker.patch("litellm.completion", side_effect=Exception("API Error"))
-        with pytest.raises(Exception, match="Failed to get response from LLM"):
-            await self.client._make_api_call_with_retry("test prompt")
+        monkeypatch.setattr(fast_retry_client, "max_retries", 1)
+        mock_completion.side_effect = Exception("API Error")
+        with pytest.raises(Exception, match="Failed to get response from LLM after 1 attempts"):
+            await fast_retry_client._make_api_call_with_retry("test prompt")
+        assert mock_completion.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_make_api_call_with_retry_eventual_success(self, mocker):
+    async def test_make_api_call_with_retry_eventual_success(self, fast_retry_client, mock_completion):
         """Test API call succeeding after initial failures."""
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = "Success response"
-
         # Fail twice, then succeed
-        side_effects = [Exception("Error 1"), Exception("Error 2"), mock_response]
+        side_effects = [Exception("Error 1"), Exception("Error 2"), make_response("Success response")]
 
-        mocker.patch("litellm.completion", side_effect=side_effects)
-        result = await self.client._make_api_call_with_retry("test prompt")
+        mock_completion.side_effect = side_effects
+        result = await fast_retry_client._make_api_call_with_retry("test prompt")
         assert result == "Success response"
+        assert mock_completion.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_generate_flashcards_from_text_empty(self):
+    async def test_generate_flashcards_from_text_empty(self, llm_client):
         """Test generating flashcards from empty text."""
-        result = await self.client.generate_flashcards_from_text("")
+        result = await llm_client.generate_flashcards_from_text("")
         assert result == []
 
-        result = await self.client.generate_flashcards_from_text("   ")
+        result = await llm_client.generate_flashcards_from_text("   ")
         assert result == []
 
-    @pytest.mark.asyncio
-    async def test_generate_flashcards_from_text_success(self, mocker):
-        """Test successful flashcard generation."""
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = """[
-            {
-                "question": "What is Python?",
-                "answer": "A programming language",
-                "card_type": "qa"
-            }
-        ]"""
-
-        mocker.patch("litellm.completion", return_value=mock_response)
-        result = await self.client.generate_flashcards_from_text(
-            "Python is a programming language.", language="english"
-        )
+    @pytest.mark.parametrize(
+        "generate",
+        [
+            pytest.param(
+                lambda client, text: asyncio.run(client.generate_flashcards_from_text(text, language="english")),
+                id="async",
+            ),
+            pytest.param(
+                lambda client, text: client.generate_flashcards_from_text_sync(text, language="english"),
+                id="sync",
+            ),
+        ],
+    )
+    def test_generate_flashcards_from_text_success(self, llm_client, mock_completion, generate):
+        """Test successful flashcard generation through the async API and its sync wrapper."""
+        mock_completion.return_value = make_response(SINGLE_QA_JSON_RESPONSE)
+        result = generate(llm_client, "Python is a programming language.")
 
         assert len(result) == 1
         assert result[0]["question"] == "What is Python?"
         assert result[0]["answer"] == "A programming language"
         assert result[0]["card_type"] == "qa"
 
-    def test_generate_flashcards_from_text_sync(self, mocker):
-        """Test synchronous wrapper for flashcard generation."""
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = """[
-            {
-                "question": "What is Python?",
-                "answer": "A programming language",
-                "card_type": "qa"
-            }
-        ]"""
+    @pytest.mark.asyncio
+    async def test_generate_flashcards_from_text_processes_chunks_concurrently(self, llm_client, monkeypatch):
+        """Test that chunks are generated concurrently and merged back in chunk order, skipping failed chunks."""
+        chunks = ["alpha", "beta", "gamma"]
+        monkeypatch.setattr(llm_client, "chunk_text_for_processing", lambda text: chunks)
+        # Every chunk must be in flight at once for the barrier to release
+        barrier = asyncio.Barrier(len(chunks))
 
-        mocker.patch("litellm.completion", return_value=mock_response)
-        result = self.client.generate_flashcards_from_text_sync("Python is a programming language.", language="english")
+        async def fake_generate(chunk, language, content_type, max_validation_retries, semaphore=None):
+            await barrier.wait()
+            if chunk == "beta":
+                raise RuntimeError("chunk failed")
+            summary = {"final_validation_passed": True, "fallback_used": False, "total_attempts": 1}
+            return [FlashcardData(question=chunk, answer=chunk.upper(), card_type="qa")], summary
 
-        assert len(result) == 1
-        assert result[0]["question"] == "What is Python?"
-        assert result[0]["answer"] == "A programming language"
-        assert result[0]["card_type"] == "qa"
+        monkeypatch.setattr(llm_client, "_generate_flashcards_with_language_validation", fake_generate)
+
+        result = await asyncio.wait_for(llm_client.generate_flashcards_from_text("text", language="english"), 5)
+
+        assert [card["question"] for card in result] == ["alpha", "gamma"]
+
+    @pytest.mark.asyncio
+    async def test_shared_client_keeps_concurrent_calls_independent(self, llm_client, monkeypatch):
+        """Test that interleaved calls in different languages on one client keep their own results and summaries."""
+        barrier = asyncio.Barrier(2)
+        french_response = (
+            '[{"question": "Quelle est la capitale de la France?", "answer": "C\'est Paris.", "card_type": "qa"}]'
+        )
+
+        async def fake_api_call(prompt):
+            await barrier.wait()
+            return french_response if "FRANÇAIS" in prompt.upper() else SINGLE_QA_JSON_RESPONSE
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+
+        generate = llm_client._generate_flashcards_with_language_validation
+        (english, english_summary), (french, french_summary) = await asyncio.wait_for(
+            asyncio.gather(generate("Python text", "english"), generate("Texte Python", "french")), 5
+        )
+
+        assert english[0].question == "What is Python?"
+        assert french[0].question.startswith("Quelle")
+        assert english_summary["language_requested"] == "english"
+        assert french_summary["language_requested"] == "french"
+        assert english_summary["final_validation_passed"] and french_summary["final_validation_passed"]
+
+    @pytest.mark.asyncio
+    async def test_speculative_generation_keeps_first_valid_attempt(self, llm_client, monkeypatch):
+        """Test that speculative attempts run in parallel and the first valid one wins, cancelling the rest."""
+        monkeypatch.setattr(llm_client, "speculative_retries", True)
+        release = asyncio.Event()
+        responses = iter(["invalid", "valid"])
+        stalled = []
+
+        async def fake_api_call(prompt):
+            response = next(responses, None)
+            if response is None:
+                # The third attempt never answers and must be cancelled once another attempt passes
+                stalled.append(asyncio.current_task())
+                await release.wait()
+            return f'[{{"question": "{response}", "answer": "A", "card_type": "qa"}}]'
+
+        def fake_validate(flashcards, language):
+            return flashcards[0].question == "valid", {"success_rate": 0.0, "language_info": llm_client.language_info}
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+        monkeypatch.setattr(llm_client, "_validate_response_language", fake_validate)
+
+        flashcards, summary = await asyncio.wait_for(
+            llm_client._generate_flashcards_with_language_validation("text", "english", max_validation_retries=2), 5
+        )
+
+        assert [card.question for card in flashcards] == ["valid"]
+        assert summary["total_attempts"] == 3
+        assert summary["final_validation_passed"] is True
+        assert [result["validation_passed"] for result in summary["validation_results"]] == [False, True]
+        assert len(stalled) == 1 and stalled[0].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_speculative_attempts_share_the_concurrency_limit(self, llm_client, monkeypatch):
+        """Test that every speculative attempt takes its own semaphore slot instead of sharing its chunk's."""
+        monkeypatch.setattr(llm_client, "speculative_retries", True)
+        monkeypatch.setattr(llm_client, "max_concurrency", 2)
+        monkeypatch.setattr(llm_client, "chunk_text_for_processing", lambda text: ["one", "two", "three"])
+        in_flight = peak = 0
+
+        async def fake_api_call(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0)
+                return "[]"
+            finally:
+                in_flight -= 1
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+
+        await asyncio.wait_for(llm_client.generate_flashcards_from_text("ignored", language="english"), 5)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_response_cache_reuses_validated_flashcards(self, llm_client, monkeypatch):
+        """Test that an identical chunk reuses cached validated flashcards instead of calling the LLM again."""
+        monkeypatch.setattr(llm_client, "response_cache_enabled", True)
+        monkeypatch.setattr(llm_client, "_response_cache", {})
+        prompts = []
+
+        async def fake_api_call(prompt):
+            prompts.append(prompt)
+            return SINGLE_QA_JSON_RESPONSE
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+
+        generate = llm_client._generate_flashcards_with_language_validation
+        first, first_summary = await generate("Python text", "english")
+        second, second_summary = await generate("Python text", "english")
+        await generate("Other text", "english")
+
+        assert len(prompts) == 2
+        assert second == first
+        assert first_summary["cache_hit"] is False
+        assert second_summary["cache_hit"] is True
+        assert second_summary["final_validation_passed"] is True
+
+    @pytest.mark.asyncio
+    async def test_batched_generation_falls_back_per_chunk(self, llm_client, monkeypatch):
+        """Test that batched chunks share one request and empty sections are regenerated on their own."""
+        monkeypatch.setattr(llm_client, "chunk_batch_size", 3)
+        monkeypatch.setattr(llm_client, "chunk_text_for_processing", lambda text: ["one", "two", "three"])
+        prompts = []
+
+        async def fake_api_call(prompt):
+            prompts.append(prompt)
+            if "===CHUNK 1===" in prompt:
+                return f"[{SINGLE_QA_JSON_RESPONSE}, [], {SINGLE_QA_JSON_RESPONSE}]"
+            return SINGLE_QA_JSON_RESPONSE
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+
+        flashcards = await llm_client.generate_flashcards_from_text("ignored", language="english")
+
+        assert len(flashcards) == 3
+        assert len(prompts) == 2
+        assert "===CHUNK 3===\nthree" in prompts[0]
+        assert "===CHUNK" not in prompts[1]
+        assert "two" in prompts[1]
+
+    @pytest.mark.asyncio
+    async def test_batched_generation_uses_response_cache(self, llm_client, monkeypatch):
+        """Test that batched chunks are served from the response cache and only the misses are batched."""
+        monkeypatch.setattr(llm_client, "chunk_batch_size", 3)
+        monkeypatch.setattr(llm_client, "response_cache_enabled", True)
+        monkeypatch.setattr(llm_client, "_response_cache", {})
+        chunks = ["one", "two", "three"]
+        monkeypatch.setattr(llm_client, "chunk_text_for_processing", lambda text: chunks)
+        prompts = []
+
+        async def fake_api_call(prompt):
+            prompts.append(prompt)
+            return "[" + ", ".join([SINGLE_QA_JSON_RESPONSE] * len(re.findall(r"===CHUNK \d+===", prompt))) + "]"
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+
+        await llm_client.generate_flashcards_from_text("ignored", language="english")
+        chunks[:] = ["one", "four", "three"]
+        flashcards = await llm_client.generate_flashcards_from_text("ignored", language="english")
+
+        assert len(flashcards) == 3
+        assert len(prompts) == 2
+        assert "===CHUNK 1===\nfour" in prompts[1]
+        assert "===CHUNK 2===" not in prompts[1]
+
+    @pytest.mark.asyncio
+    async def test_batched_regeneration_respects_concurrency_and_keeps_partial_results(self, llm_client, monkeypatch):
+        """Test that regenerated chunks each take a semaphore slot and one failure keeps the other chunks' cards."""
+        monkeypatch.setattr(llm_client, "chunk_batch_size", 4)
+        monkeypatch.setattr(llm_client, "max_concurrency", 1)
+        monkeypatch.setattr(llm_client, "chunk_text_for_processing", lambda text: ["one", "two", "three", "four"])
+        in_flight = peak = 0
+
+        async def fake_api_call(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0)
+                if "===CHUNK 1===" in prompt:
+                    return f"[{SINGLE_QA_JSON_RESPONSE}, [], [], []]"
+                return SINGLE_QA_JSON_RESPONSE
+            finally:
+                in_flight -= 1
+
+        regenerate = llm_client._generate_flashcards_with_language_validation
+
+        async def failing_regenerate(chunk, **kwargs):
+            if chunk == "three":
+                raise RuntimeError("regeneration failed")
+            return await regenerate(chunk, **kwargs)
+
+        monkeypatch.setattr(llm_client, "_make_api_call_with_retry", fake_api_call)
+        monkeypatch.setattr(llm_client, "_generate_flashcards_with_language_validation", failing_regenerate)
+
+        flashcards = await llm_client.generate_flashcards_from_text("ignored", language="english")
+
+        assert peak == 1
+        # Chunk 1 validated in the batch, chunks 2 and 4 were regenerated; chunk 3's failure drops only its cards
+        assert len(flashcards) == 3
+
+    def test_log_validation_summary_reports_chunk_counts(self, llm_client):
+        """Test that the validation summary reports chunk counts and success rates in one message."""
+        stats = {
+            "total_chunks": 4,
+            "successful_chunks": 3,
+            "failed_chunks": 1,
+            "validation_failures": 0,
+            "fallback_used": 0,
+            "chunk_results": [{"chunk": 1, "flashcards_generated": 2}],
+        }
+        messages = []
+        handler_id = logger.add(messages.append, level="INFO", format="{message}")
+        try:
+            llm_client._log_validation_summary("english", stats)
+        finally:
+            logger.remove(handler_id)
+
+        summary = messages[0]
+        assert "Total chunks processed: 4" in summary
+        assert "Successful chunks: 3/4 (75.0%)" in summary
+        # Per-chunk details are debug-only and never reach an INFO handler
+        assert not any("Detailed chunk results" in message for message in messages)
 
 
 class TestPresentationProcessing:
     """Test cases for presentation-specific processing in LLMClient."""
 
-    @pytest.fixture(autouse=True)
-    def setup_client(self, mocker):
-        """Set up test fixtures."""
-        # Mock ModelConfig to avoid environment dependencies
-        mock_config = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
-        mock_config.validate_and_get_model.return_value = "gemini/gemini-2.5-flash"
-        mock_config.validate_model_config.return_value = True
-        self.client = LLMClient()
-
-    def test_detect_content_type_presentation_slide_markers(self):
+    def test_detect_content_type_presentation_slide_markers(self, llm_client):
         """Test detection of presentation content with slide markers."""
         presentation_text = """
         === Slide 1 ===
@@ -361,10 +586,10 @@ class TestPresentationProcessing:
         • Interpreted
         """
 
-        result = self.client._detect_content_type(presentation_text, "general")
+        result = llm_client._detect_content_type(presentation_text, "general")
         assert result == "presentation"
 
-    def test_detect_content_type_presentation_bullet_points(self):
+    def test_detect_content_type_presentation_bullet_points(self, llm_client):
         """Test detection of presentation content with bullet points."""
         presentation_text = """
         Python Programming
@@ -377,10 +602,10 @@ class TestPresentationProcessing:
         3. Advanced features
         """
 
-        result = self.client._detect_content_type(presentation_text, "general")
+        result = llm_client._detect_content_type(presentation_text, "general")
         assert result == "presentation"
 
-    def test_detect_content_type_regular_text(self):
+    def test_detect_content_type_regular_text(self, llm_client):
         """Test that regular text is not detected as presentation."""
         regular_text = """
         Python is a high-level programming language. It was created by Guido van Rossum
@@ -388,61 +613,61 @@ class TestPresentationProcessing:
         with its notable use of significant whitespace.
         """
 
-        result = self.client._detect_content_type(regular_text, "general")
+        result = llm_client._detect_content_type(regular_text, "general")
         assert result == "general"
 
-    def test_detect_content_type_explicit_presentation(self):
+    def test_detect_content_type_explicit_presentation(self, llm_client):
         """Test that explicit presentation type is respected."""
         regular_text = "This is just regular text without presentation markers."
 
-        result = self.client._detect_content_type(regular_text, "presentation")
+        result = llm_client._detect_content_type(regular_text, "presentation")
         assert result == "presentation"
 
-    def test_get_presentation_instructions_english(self):
+    def test_get_presentation_instructions_english(self, llm_client):
         """Test getting presentation instructions in English."""
-        instructions = self.client._get_presentation_instructions("english")
+        instructions = llm_client._get_presentation_instructions("english")
 
         assert "SPECIAL INSTRUCTIONS FOR PRESENTATION CONTENT" in instructions
         assert "slide titles" in instructions.lower()
         assert "bullet points" in instructions.lower()
         assert "logical flow" in instructions.lower()
 
-    def test_get_presentation_instructions_french(self):
+    def test_get_presentation_instructions_french(self, llm_client):
         """Test getting presentation instructions in French."""
-        instructions = self.client._get_presentation_instructions("french")
+        instructions = llm_client._get_presentation_instructions("french")
 
         assert "INSTRUCTIONS SPÉCIALES POUR LE CONTENU DE PRÉSENTATION" in instructions
         assert "diapositives" in instructions.lower()
         assert "puces" in instructions.lower()
         assert "flux logique" in instructions.lower()
 
-    def test_get_presentation_instructions_italian(self):
+    def test_get_presentation_instructions_italian(self, llm_client):
         """Test getting presentation instructions in Italian."""
-        instructions = self.client._get_presentation_instructions("italian")
+        instructions = llm_client._get_presentation_instructions("italian")
 
         assert "ISTRUZIONI SPECIALI PER IL CONTENUTO DELLE PRESENTAZIONI" in instructions
         assert "diapositive" in instructions.lower()
         assert "punti elenco" in instructions.lower()
         assert "flusso logico" in instructions.lower()
 
-    def test_get_presentation_instructions_german(self):
+    def test_get_presentation_instructions_german(self, llm_client):
         """Test getting presentation instructions in German."""
-        instructions = self.client._get_presentation_instructions("german")
+        instructions = llm_client._get_presentation_instructions("german")
 
         assert "SPEZIELLE ANWEISUNGEN FÜR PRÄSENTATIONSINHALTE" in instructions
         assert "folien" in instructions.lower()
         assert "aufzählungspunkte" in instructions.lower()
         assert "logischen fluss" in instructions.lower()
 
-    def test_get_presentation_instructions_unsupported_language(self):
+    def test_get_presentation_instructions_unsupported_language(self, llm_client):
         """Test that unsupported languages fall back to English."""
-        instructions = self.client._get_presentation_instructions("unsupported")
+        instructions = llm_client._get_presentation_instructions("unsupported")
 
         # Should fall back to English
         assert "SPECIAL INSTRUCTIONS FOR PRESENTATION CONTENT" in instructions
         assert "slide titles" in instructions.lower()
 
-    def test_create_flashcard_prompt_with_presentation_detection(self):
+    def test_create_flashcard_prompt_with_presentation_detection(self, llm_client):
         """Test prompt creation with automatic presentation detection."""
         presentation_text = """
         === Slide 1 ===
@@ -456,7 +681,7 @@ class TestPresentationProcessing:
         • Parameters and return values
         """
 
-        prompt = self.client._create_flashcard_prompt(presentation_text, language="english")
+        prompt = llm_client._create_flashcard_prompt(presentation_text, language="english")
 
         # Should contain both the base template and presentation instructions
         assert "Python Basics" in prompt
@@ -464,17 +689,17 @@ class TestPresentationProcessing:
         assert "slide titles" in prompt.lower()
         assert "bullet points" in prompt.lower()
 
-    def test_create_flashcard_prompt_explicit_presentation_type(self):
+    def test_create_flashcard_prompt_explicit_presentation_type(self, llm_client):
         """Test prompt creation with explicit presentation content type."""
         regular_text = "This is regular text about Python programming concepts."
 
-        prompt = self.client._create_flashcard_prompt(regular_text, language="english", content_type="presentation")
+        prompt = llm_client._create_flashcard_prompt(regular_text, language="english", content_type="presentation")
 
         # Should include presentation instructions even for regular text
         assert "SPECIAL INSTRUCTIONS FOR PRESENTATION CONTENT" in prompt
         assert "slide titles" in prompt.lower()
 
-    def test_create_flashcard_prompt_presentation_french(self):
+    def test_create_flashcard_prompt_presentation_french(self, llm_client):
         """Test presentation prompt creation in French."""
         presentation_text = """
         === Slide 1 ===
@@ -483,7 +708,7 @@ class TestPresentationProcessing:
         • Facile à apprendre
         """
 
-        prompt = self.client._create_flashcard_prompt(presentation_text, language="french")
+        prompt = llm_client._create_flashcard_prompt(presentation_text, language="french")
 
         assert "Introduction à Python" in prompt
         # Check for the actual French presentation instructions text
@@ -491,7 +716,7 @@ class TestPresentationProcessing:
         assert "diapositives" in prompt.lower()
 
     @pytest.mark.asyncio
-    async def test_generate_flashcards_presentation_content(self, mocker):
+    async def test_generate_flashcards_presentation_content(self, llm_client, mock_completion):
         """Test flashcard generation from presentation content."""
         presentation_text = """
         === Slide 1 ===
@@ -508,9 +733,7 @@ class TestPresentationProcessing:
         """
 
         # Mock the LLM response
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = """[
+        response_content = """[
             {
                 "question": "What type of programming language is Python according to Slide 1?",
                 "answer": "High-level language",
@@ -528,9 +751,9 @@ class TestPresentationProcessing:
             }
         ]"""
 
-        mocker.patch("litellm.completion", return_value=mock_response)
+        mock_completion.return_value = make_response(response_content)
 
-        result = await self.client.generate_flashcards_from_text(presentation_text, language="english")
+        result = await llm_client.generate_flashcards_from_text(presentation_text, language="english")
 
         assert len(result) == 3
         assert "Slide 1" in result[0]["question"]
@@ -539,7 +762,7 @@ class TestPresentationProcessing:
         assert "{{c1::high-level}}" in result[1]["question"]
 
     @pytest.mark.asyncio
-    async def test_generate_flashcards_presentation_multilingual(self, mocker):
+    async def test_generate_flashcards_presentation_multilingual(self, llm_client, mock_completion):
         """Test presentation flashcard generation in multiple languages."""
         presentation_text = """
         === Slide 1 ===
@@ -549,9 +772,7 @@ class TestPresentationProcessing:
         """
 
         # Mock French response
-        mock_response = mocker.MagicMock()
-        mock_response.choices = [mocker.MagicMock()]
-        mock_response.choices[0].message.content = """[
+        response_content = """[
             {
                 "question": "Quel type de langage est Python selon la diapositive 1 ?",
                 "answer": "Langage de haut niveau",
@@ -564,26 +785,26 @@ class TestPresentationProcessing:
             }
         ]"""
 
-        mocker.patch("litellm.completion", return_value=mock_response)
+        mock_completion.return_value = make_response(response_content)
 
-        result = await self.client.generate_flashcards_from_text(presentation_text, language="french")
+        result = await llm_client.generate_flashcards_from_text(presentation_text, language="french")
 
         assert len(result) == 2
         assert "diapositive" in result[0]["question"].lower()
         assert result[0]["answer"] == "Langage de haut niveau"
         assert "{{c1::de haut niveau}}" in result[1]["question"]
 
-    def test_create_flashcard_prompt_invalid_content_type(self):
+    def test_create_flashcard_prompt_invalid_content_type(self, llm_client):
         """Test prompt creation with invalid content type."""
         text = "Sample text"
 
         # Should not raise error for "presentation" even though it's not in PromptTemplates
-        prompt = self.client._create_flashcard_prompt(text, content_type="presentation")
+        prompt = llm_client._create_flashcard_prompt(text, content_type="presentation")
         assert "SPECIAL INSTRUCTIONS FOR PRESENTATION CONTENT" in prompt
 
         # Should raise error for truly invalid content type
         with pytest.raises(ValueError, match="Invalid parameters"):
-            self.client._create_flashcard_prompt(text, content_type="invalid_type")
+            llm_client._create_flashcard_prompt(text, content_type="invalid_type")
 
 
 class TestFlashcardData:
@@ -596,3 +817,13 @@ class TestFlashcardData:
         assert flashcard.question == "What is Python?"
         assert flashcard.answer == "A programming language"
         assert flashcard.card_type == "qa"
+
+    def test_flashcard_data_is_immutable_and_slotted(self):
+        """Test that FlashcardData is frozen, hashable and carries no per-instance __dict__."""
+        flashcard = FlashcardData(question="What is Python?", answer="A programming language", card_type="qa")
+
+        with pytest.raises(AttributeError):
+            flashcard.question = "Changed"  # type: ignore[misc]
+
+        assert not hasattr(flashcard, "__dict__")
+        assert hash(flashcard) == hash(FlashcardData("What is Python?", "A programming language", "qa"))
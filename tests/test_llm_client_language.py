@@ -5,433 +5,619 @@ Tests the LLMClient class language support, prompt generation,
 and language validation features using proper pytest-mock patterns.
 """
 
+import copy
+import functools
+import json
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
 import pytest
 
-from src.document_to_anki.config import LanguageInfo, LanguageValidationError
+from src.document_to_anki import config
+from src.document_to_anki.config import LanguageConfig, LanguageInfo, LanguageValidationError
+from src.document_to_anki.core import llm_client
 from src.document_to_anki.core.llm_client import FlashcardData, LLMClient
 
+# Canned flashcards keyed by scenario, and the JSON response bodies serialized from them once at import
+_CARDS: Mapping[str, list[dict[str, str]]] = MappingProxyType(
+    {
+        "de_capital": [{"question": "Was ist die Hauptstadt?", "answer": "Berlin", "card_type": "qa"}],
+        "fr_capital": [{"question": "Quelle est la capitale?", "answer": "Paris", "card_type": "qa"}],
+        "it_ai": [
+            {
+                "question": "Che cos'è l'intelligenza artificiale?",
+                "answer": "È una tecnologia molto avanzata che utilizza algoritmi",
+                "card_type": "qa",
+            }
+        ],
+        "en_paris": [
+            {"question": "What is the capital of France?", "answer": "The capital is Paris", "card_type": "qa"}
+        ],
+    }
+)
+_RESPONSES: Mapping[str, str] = MappingProxyType(
+    {key: json.dumps(cards, ensure_ascii=False) for key, cards in _CARDS.items()}
+)
+
+
+# Opening line that identifies the language of each prompt template
+LANG_MARKERS: Mapping[str, str] = MappingProxyType(
+    {
+        "english": "You are an expert educator",
+        "french": "Vous êtes un expert",
+        "italian": "Sei un esperto",
+        "german": "Sie sind ein Experte",
+    }
+)
+_LANG_MARKER_RE = re.compile("|".join(map(re.escape, LANG_MARKERS.values())))
+_LANGUAGE_BY_MARKER: Mapping[str, str] = MappingProxyType({marker: lang for lang, marker in LANG_MARKERS.items()})
+
+
+def assert_lang(prompt: str, language: str) -> None:
+    """Assert that a prompt was built from the given language's template."""
+    assert LANG_MARKERS[language] in prompt, f"expected a {language} prompt"
+
+
+# language -> (content_type, substrings expected in the assembled prompt template)
+LANG_PROMPT_CASES: Mapping[str, tuple[str, list[str]]] = MappingProxyType(
+    {
+        "english": ("general", [LANG_MARKERS["english"], "IN ENGLISH"]),
+        "french": ("academic", [LANG_MARKERS["french"], "EN FRANÇAIS", "vocabulaire académique"]),
+        "italian": ("technical", [LANG_MARKERS["italian"], "IN ITALIANO", "terminologia tecnica"]),
+        "german": ("general", [LANG_MARKERS["german"], "AUF DEUTSCH"]),
+    }
+)
+
+# Sample flashcards for response language validation, built once; tuples so no test can mutate them
+ENGLISH_CARDS = (
+    FlashcardData(question="What is the capital?", answer="It is London", card_type="qa"),
+    FlashcardData(question="How are you?", answer="I am fine", card_type="qa"),
+)
+FRENCH_CARDS = (
+    FlashcardData(question="Quelle est la capitale?", answer="C'est Paris", card_type="qa"),
+    FlashcardData(question="Comment allez-vous?", answer="Je vais bien", card_type="qa"),
+)
+
+# (client language, flashcards, expected language, expected validity, expected language name)
+LANG_VALIDATION_CASES = [
+    pytest.param("english", ENGLISH_CARDS, "english", True, "English", id="english"),
+    pytest.param("french", FRENCH_CARDS, "french", True, "French", id="french"),
+    # English flashcards when French is expected
+    pytest.param("english", ENGLISH_CARDS[:1], "french", False, "French", id="mismatch"),
+]
+
+
+# Language resolution matrix for generate_flashcards_from_text:
+# (client language, settings.cardlang or None if settings are unavailable, explicit language, content type,
+#  canned response key, substring expected in the prompt sent to the model)
+RESOLUTION_CASES = [
+    pytest.param(
+        "german", "english", "german", "general", "de_capital", LANG_MARKERS["german"], id="explicit_language"
+    ),
+    pytest.param(
+        "english",
+        "english",
+        "french",
+        "general",
+        "fr_capital",
+        LANG_MARKERS["french"],
+        id="explicit_overrides_instance",
+    ),
+    pytest.param(
+        "english", "german", "french", "general", "fr_capital", LANG_MARKERS["french"], id="explicit_overrides_settings"
+    ),
+    pytest.param("italian", "italian", "italian", "technical", "it_ai", "terminologia tecnica", id="content_type"),
+    pytest.param("english", "english", None, "general", "en_paris", LANG_MARKERS["english"], id="settings_default"),
+    pytest.param("english", "italian", None, "general", "it_ai", LANG_MARKERS["italian"], id="settings_language"),
+    pytest.param(
+        "german", None, None, "general", "de_capital", LANG_MARKERS["german"], id="settings_fallback_to_instance"
+    ),
+]
+
+
+class _UnavailableSettings:
+    """Settings stand-in whose cardlang cannot be read, forcing the instance-language fallback."""
+
+    @property
+    def cardlang(self) -> str:
+        raise RuntimeError("settings unavailable")
+
 
-class TestLLMClientLanguage:
-    """Test cases for LLM client language functionality."""
+class _Msg(NamedTuple):
+    content: str
 
-    @pytest.fixture
-    def mock_litellm_completion(self, mocker):
-        """Mock litellm.completion for testing with proper response structure."""
-        return mocker.patch("src.document_to_anki.core.llm_client.litellm.completion")
 
-    @pytest.fixture
-    def mock_model_config(self, mocker):
-        """Mock ModelConfig for testing."""
-        mock = mocker.patch("src.document_to_anki.core.llm_client.ModelConfig")
-        mock.validate_and_get_model.return_value = "gemini/gemini-2.5-flash"
-        mock.validate_model_config.return_value = True
-        return mock
+class _Choice(NamedTuple):
+    message: _Msg
 
-    def _create_mock_response(self, content: str, mocker):
-        """Create a properly structured mock response that matches litellm API."""
-        mock_response = mocker.Mock()
-        mock_response.choices = [mocker.Mock()]
-        mock_response.choices[0].message = mocker.Mock()
-        mock_response.choices[0].message.content = content
-        return mock_response
 
-    # Initialization Tests
-    def test_init_with_language_parameter(self, mock_litellm_completion, mock_model_config):
-        """Test LLMClient initialization with language parameter."""
-        client = LLMClient(language="french")
+class _Resp(NamedTuple):
+    choices: list[_Choice]
 
-        assert client.language == "french"
-        assert client.model == "gemini/gemini-2.5-flash"
-        assert client.language_info.name == "French"
-        assert client.language_info.code == "fr"
 
-    def test_init_with_default_language(self, mock_litellm_completion, mock_model_config):
-        """Test LLMClient initialization with default language."""
-        client = LLMClient()
+@functools.cache
+def _resp(content: str) -> _Resp:
+    """Build a litellm completion response; LLMClient only reads ``choices[0].message.content``."""
+    return _Resp(choices=[_Choice(message=_Msg(content=content))])
 
-        assert client.language == "english"
-        assert client.language_info.name == "English"
-        assert client.language_info.code == "en"
 
-    def test_init_language_normalization(self, mock_litellm_completion, mock_model_config):
-        """Test that language is normalized during initialization."""
-        client = LLMClient(language="  FRENCH  ")
+@pytest.fixture(scope="module")
+def mock_model_config():
+    """Pin the default model once for the module; clients only read it during construction."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.document_to_anki.core.llm_client.ModelConfig.validate_and_get_model",
+            staticmethod(lambda: "gemini/gemini-2.5-flash"),
+        )
+        yield
+
 
-        assert client.language == "french"
-        assert client.language_info.name == "French"
+@pytest.fixture(scope="module")
+def client_cache(mock_model_config):
+    """Factory returning one memoized LLMClient per language, shared read-only by the tests in this module."""
+
+    @functools.cache
+    def make_client(language: str) -> LLMClient:
+        return LLMClient(language=language)
+
+    return make_client
+
+
+@pytest.fixture(scope="module", params=list(LANG_PROMPT_CASES))
+def lang_client(request, client_cache):
+    """The cached client for each supported language in turn."""
+    return client_cache(request.param)
 
-    def test_init_with_iso_language_code(self, mock_litellm_completion, mock_model_config):
-        """Test LLMClient initialization with ISO language codes."""
-        client = LLMClient(language="de")
 
-        assert client.language == "de"  # Normalized to ISO code
-        assert client.language_info.name == "German"
-        assert client.language_info.code == "de"
+@pytest.fixture
+def english_client(client_cache):
+    """Per-test copy of the English client for tests that call set_language."""
+    return copy.copy(client_cache("english"))
+
 
-    def test_init_with_invalid_language(self, mock_litellm_completion, mock_model_config):
-        """Test LLMClient initialization with invalid language raises error."""
-        with pytest.raises(LanguageValidationError, match="Unsupported language 'spanish'"):
-            LLMClient(language="spanish")
+_DEFAULT_RESPONSE = _resp("[]")
 
-    def test_init_with_empty_language(self, mock_litellm_completion, mock_model_config):
-        """Test LLMClient initialization with empty language defaults to English."""
-        client = LLMClient(language="")
 
-        assert client.language == "english"
-        assert client.language_info.name == "English"
+def _stub_completion(**kwargs: Any) -> _Resp:
+    """Stand-in for litellm.completion that answers every call with an empty card list."""
+    return _DEFAULT_RESPONSE
 
-    # Language Management Tests
-    def test_get_current_language(self, mock_litellm_completion, mock_model_config):
-        """Test getting current language configuration."""
-        client = LLMClient(language="italian")
 
-        assert client.get_current_language() == "italian"
+@pytest.fixture(scope="module", autouse=True)
+def _patch_litellm():
+    """Install the completion stub once for the whole module so no test reaches a real provider."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.document_to_anki.core.llm_client.litellm.completion", _stub_completion)
+        yield
 
-    def test_get_language_info(self, mock_litellm_completion, mock_model_config):
-        """Test getting detailed language information."""
-        client = LLMClient(language="german")
 
-        lang_info = client.get_language_info()
-        assert isinstance(lang_info, LanguageInfo)
-        assert lang_info.name == "German"
-        assert lang_info.code == "de"
-        assert lang_info.prompt_key == "german"
+class _CannedLLM:
+    """Answers each prompt with the canned cards for the language its template is written in."""
 
-    def test_set_language_valid(self, mock_litellm_completion, mock_model_config):
-        """Test setting a valid language."""
-        client = LLMClient(language="english")
+    _RESPONSE_BY_LANGUAGE = {"german": "de_capital", "french": "fr_capital", "italian": "it_ai", "english": "en_paris"}
 
-        client.set_language("italian")
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
 
-        assert client.language == "italian"
-        assert client.language_info.name == "Italian"
-        assert client.language_info.code == "it"
+    @property
+    def last_prompt(self) -> str:
+        return self.prompts[-1]
 
-    def test_set_language_invalid(self, mock_litellm_completion, mock_model_config):
-        """Test setting an invalid language raises error."""
-        client = LLMClient(language="english")
+    def respond(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        match = _LANG_MARKER_RE.search(prompt)
+        if match is None:
+            return "[]"
+        return _RESPONSES[self._RESPONSE_BY_LANGUAGE[_LANGUAGE_BY_MARKER[match.group()]]]
 
-        with pytest.raises(LanguageValidationError, match="Unsupported language 'spanish'"):
-            client.set_language("spanish")
 
-        # Original language should be preserved
-        assert client.language == "english"
+@pytest.fixture(scope="module")
+def _canned_llm_installed():
+    """Route every LLMClient API call in this module to one shared canned responder."""
+    canned = _CannedLLM()
 
-    def test_set_language_with_normalization(self, mock_litellm_completion, mock_model_config):
-        """Test setting language with normalization."""
-        client = LLMClient(language="english")
+    async def _fake_api_call(client: LLMClient, prompt: str, **kwargs: Any) -> str:
+        return canned.respond(prompt)
 
-        client.set_language("  FR  ")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(LLMClient, "_make_api_call_with_retry", _fake_api_call)
+        yield canned
 
-        assert client.language == "fr"  # Normalized to ISO code
-        assert client.language_info.name == "French"
 
-    # Prompt Template Tests
-    def test_get_prompt_template_english(self, mock_litellm_completion, mock_model_config):
-        """Test getting English prompt template."""
-        client = LLMClient(language="english")
+@pytest.fixture
+def llm_canned(_canned_llm_installed):
+    """Hand the shared canned responder to a test with its prompt log cleared."""
+    _canned_llm_installed.prompts.clear()
+    return _canned_llm_installed
 
-        template = client.get_prompt_template("english", "general")
 
-        assert "You are an expert educator" in template
-        assert "IN ENGLISH" in template
-        assert "{text}" in template
+@pytest.fixture
+def bypass_lang_validation(mocker):
+    """Accept every response without running the language heuristics, for tests that only exercise prompting."""
+    return mocker.patch.object(
+        LLMClient,
+        "_validate_response_language",
+        return_value=(
+            True,
+            {"language_info": LanguageInfo(code="en", name="English", prompt_key="english"), "sample_size": 1},
+        ),
+    )
 
-    def test_get_prompt_template_french(self, mock_litellm_completion, mock_model_config):
-        """Test getting French prompt template."""
-        client = LLMClient(language="french")
 
-        template = client.get_prompt_template("french", "academic")
+# Initialization Tests
+@pytest.mark.parametrize(
+    "language,expected_language,expected_name,expected_code",
+    [
+        ("french", "french", "French", "fr"),
+        ("  FRENCH  ", "french", "French", "fr"),  # normalized
+        ("de", "de", "German", "de"),  # ISO code kept as given
+    ],
+    ids=["explicit", "normalized", "iso_code"],
+)
+def test_init_language(mock_model_config, language, expected_language, expected_name, expected_code):
+    """Test LLMClient initialization resolves the requested language."""
+    client = LLMClient(language=language)
 
-        assert "Vous êtes un expert" in template
-        assert "EN FRANÇAIS" in template
-        assert "vocabulaire académique" in template
-        assert "{text}" in template
+    assert client.language == expected_language
+    assert client.model == "gemini/gemini-2.5-flash"
+    assert client.language_info.name == expected_name
+    assert client.language_info.code == expected_code
 
-    def test_get_prompt_template_italian(self, mock_litellm_completion, mock_model_config):
-        """Test getting Italian prompt template."""
-        client = LLMClient(language="italian")
 
-        template = client.get_prompt_template("italian", "technical")
+@pytest.mark.parametrize("ctor_arg", [None, ""], ids=["omitted", "empty"])
+def test_init_defaults_to_english(mock_model_config, client_cache, ctor_arg):
+    """Test that a client built without a language matches the shared English client."""
+    client = LLMClient() if ctor_arg is None else LLMClient(language=ctor_arg)
+    english = client_cache("english")
 
-        assert "Sei un esperto" in template
-        assert "IN ITALIANO" in template
-        assert "terminologia tecnica" in template
-        assert "{text}" in template
+    assert client.language == english.language == "english"
+    assert client.model == english.model
+    assert client.language_info is english.language_info
 
-    def test_get_prompt_template_german(self, mock_litellm_completion, mock_model_config):
-        """Test getting German prompt template."""
-        client = LLMClient(language="german")
 
-        template = client.get_prompt_template("german", "general")
+def test_init_with_invalid_language(mock_model_config):
+    """Test LLMClient initialization with invalid language raises error."""
+    with pytest.raises(LanguageValidationError) as exc_info:
+        LLMClient(language="spanish")
 
-        assert "Sie sind ein Experte" in template
-        assert "AUF DEUTSCH" in template
-        assert "{text}" in template
+    assert "Unsupported language 'spanish'" in str(exc_info.value)
 
-    def test_get_prompt_template_invalid_language(self, mock_litellm_completion, mock_model_config):
-        """Test that invalid language raises ValueError."""
-        client = LLMClient()
 
-        with pytest.raises(ValueError, match="Unsupported language"):
-            client.get_prompt_template("spanish", "general")
+def test_init_shares_interned_language_info(mock_model_config):
+    """Test that clients built from any alias of a language share its single LanguageInfo."""
+    by_name = LLMClient(language="french")
+    by_code = LLMClient(language="FR")
 
-    # Prompt Creation Tests
-    def test_create_flashcard_prompt_uses_instance_language(self, mock_litellm_completion, mock_model_config):
-        """Test that _create_flashcard_prompt uses instance language when none specified."""
-        client = LLMClient(language="italian")
+    assert by_code.language_info is by_name.language_info
+    assert by_name.language_info is LanguageConfig.get_language_info("fr")
 
-        prompt = client._create_flashcard_prompt("Test text")
 
-        assert "Sei un esperto" in prompt
-        assert "Test text" in prompt
+# Language Management Tests
+def test_get_current_language(client_cache):
+    """Test getting current language configuration."""
+    client = client_cache("italian")
 
-    def test_create_flashcard_prompt_overrides_language(self, mock_litellm_completion, mock_model_config):
-        """Test that _create_flashcard_prompt can override instance language."""
-        client = LLMClient(language="english")
+    assert client.get_current_language() == "italian"
 
-        prompt = client._create_flashcard_prompt("Test text", language="german")
 
-        assert "Sie sind ein Experte" in prompt
-        assert "Test text" in prompt
+def test_get_language_info(client_cache):
+    """Test getting detailed language information."""
+    client = client_cache("german")
 
-    def test_create_flashcard_prompt_with_content_type(self, mock_litellm_completion, mock_model_config):
-        """Test _create_flashcard_prompt with different content types."""
-        client = LLMClient(language="french")
+    lang_info = client.get_language_info()
+    assert isinstance(lang_info, LanguageInfo)
+    assert lang_info.name == "German"
+    assert lang_info.code == "de"
+    assert lang_info.prompt_key == "german"
 
-        academic_prompt = client._create_flashcard_prompt("Test text", content_type="academic")
-        technical_prompt = client._create_flashcard_prompt("Test text", content_type="technical")
 
-        assert "vocabulaire académique" in academic_prompt
-        assert "terminologie technique" in technical_prompt
+def test_set_language_valid(english_client):
+    """Test setting a valid language."""
+    client = english_client
 
-    def test_create_flashcard_prompt_invalid_parameters(self, mock_litellm_completion, mock_model_config):
-        """Test that invalid parameters raise ValueError."""
-        client = LLMClient()
+    client.set_language("italian")
 
-        with pytest.raises(ValueError, match="Invalid parameters"):
-            client._create_flashcard_prompt("Test text", language="spanish")
+    assert client.language == "italian"
+    assert client.language_info.name == "Italian"
+    assert client.language_info.code == "it"
 
-        with pytest.raises(ValueError, match="Invalid parameters"):
-            client._create_flashcard_prompt("Test text", content_type="invalid")
 
-    # Language Validation Tests
-    def test_validate_response_language_english(self, mock_litellm_completion, mock_model_config):
-        """Test language validation for English flashcards."""
-        client = LLMClient(language="english")
+def test_set_language_invalid(english_client):
+    """Test setting an invalid language raises error."""
+    client = english_client
 
-        english_flashcards = [
-            FlashcardData(question="What is the capital?", answer="It is London", card_type="qa"),
-            FlashcardData(question="How are you?", answer="I am fine", card_type="qa"),
-        ]
+    with pytest.raises(LanguageValidationError) as exc_info:
+        client.set_language("spanish")
 
-        is_valid, metrics = client._validate_response_language(english_flashcards, "english")
+    assert "Unsupported language 'spanish'" in str(exc_info.value)
 
-        assert is_valid
-        assert metrics["language_info"].name == "English"
+    # Original language should be preserved
+    assert client.language == "english"
 
-    def test_validate_response_language_french(self, mock_litellm_completion, mock_model_config):
-        """Test language validation for French flashcards."""
-        client = LLMClient(language="french")
 
-        french_flashcards = [
-            FlashcardData(question="Quelle est la capitale?", answer="C'est Paris", card_type="qa"),
-            FlashcardData(question="Comment allez-vous?", answer="Je vais bien", card_type="qa"),
-        ]
+def test_set_language_with_normalization(english_client):
+    """Test setting language with normalization."""
+    client = english_client
 
-        is_valid, metrics = client._validate_response_language(french_flashcards, "french")
+    client.set_language("  FR  ")
 
-        assert is_valid
-        assert metrics["language_info"].name == "French"
+    assert client.language == "fr"  # Normalized to ISO code
+    assert client.language_info.name == "French"
 
-    def test_validate_response_language_mismatch(self, mock_litellm_completion, mock_model_config):
-        """Test language validation with language mismatch."""
-        client = LLMClient(language="english")
 
-        # English flashcards when French is expected
-        english_flashcards = [
-            FlashcardData(question="What is the capital?", answer="It is London", card_type="qa"),
-        ]
+def test_set_language_same_language_is_noop(english_client, mocker):
+    """Test that re-setting the current language skips re-resolving its info."""
+    client = english_client
+    language_info = client.language_info
+    spy = mocker.spy(LanguageConfig, "get_language_info")
 
-        is_valid, metrics = client._validate_response_language(english_flashcards, "french")
+    client.set_language("  ENGLISH  ")
 
-        assert not is_valid
-        assert metrics["language_info"].name == "French"
+    assert client.language == "english"
+    assert client.language_info is language_info
+    spy.assert_not_called()
 
-    def test_validate_response_language_empty_list(self, mock_litellm_completion, mock_model_config):
-        """Test language validation with empty flashcard list."""
-        client = LLMClient()
 
-        is_valid, metrics = client._validate_response_language([], "english")
+# Prompt Template Tests
+def test_get_prompt_template(lang_client):
+    """Test getting the prompt template for each supported language."""
+    language = lang_client.language
+    content_type, needles = LANG_PROMPT_CASES[language]
+    template = lang_client.get_prompt_template(language, content_type)
 
-        assert is_valid
-        assert metrics["sample_size"] == 0
+    missing = [needle for needle in (*needles, "{text}") if needle not in template]
+    assert not missing, missing
 
-    # Async Flashcard Generation Tests
-    @pytest.mark.asyncio
-    async def test_generate_flashcards_uses_instance_language(self, mock_litellm_completion, mock_model_config, mocker):
-        """Test that generate_flashcards_from_text uses instance language when no language specified."""
-        client = LLMClient(language="german")
 
-        # Create proper mock response that matches litellm API structure
-        mock_response_content = """[
-            {
-                "question": "Was ist die Hauptstadt?",
-                "answer": "Berlin",
-                "card_type": "qa"
-            }
-        ]"""
+def test_get_prompt_template_is_cached(client_cache):
+    """Test that repeated template lookups reuse the same assembled string."""
+    template = client_cache("french").get_prompt_template("french", "academic")
 
-        mock_response = self._create_mock_response(mock_response_content, mocker)
-        mock_litellm_completion.return_value = mock_response
+    assert client_cache("english").get_prompt_template("french", "academic") is template
 
-        # Call with explicit language parameter to use instance language
-        result = await client.generate_flashcards_from_text("Test text", language="german")
 
-        # Verify the result
-        assert len(result) == 1
-        assert result[0]["question"] == "Was ist die Hauptstadt?"
-        assert result[0]["answer"] == "Berlin"
+def test_get_prompt_template_invalid_language(client_cache):
+    """Test that invalid language raises ValueError."""
+    client = client_cache("english")
 
-        # Check that litellm.completion was called with German prompt
-        mock_litellm_completion.assert_called_once()
-        call_args = mock_litellm_completion.call_args[1]  # Get keyword arguments
-        prompt = call_args["messages"][0]["content"]
-        assert "Sie sind ein Experte" in prompt
+    with pytest.raises(ValueError) as exc_info:
+        client.get_prompt_template("spanish", "general")
 
-    @pytest.mark.asyncio
-    async def test_generate_flashcards_overrides_language(self, mock_litellm_completion, mock_model_config, mocker):
-        """Test that generate_flashcards_from_text can override instance language."""
-        client = LLMClient(language="english")
+    assert "Unsupported language" in str(exc_info.value)
 
-        # Create proper mock response that matches litellm API structure
-        mock_response_content = """[
-            {
-                "question": "Quelle est la capitale?",
-                "answer": "Paris",
-                "card_type": "qa"
-            }
-        ]"""
 
-        mock_response = self._create_mock_response(mock_response_content, mocker)
-        mock_litellm_completion.return_value = mock_response
+# Prompt Creation Tests
+def test_create_flashcard_prompt_uses_instance_language(client_cache):
+    """Test that _create_flashcard_prompt uses instance language when none specified."""
+    client = client_cache("italian")
 
-        result = await client.generate_flashcards_from_text("Test text", language="french")
+    prompt = client._create_flashcard_prompt("Test text")
 
-        # Verify the result
-        assert len(result) == 1
-        assert result[0]["question"] == "Quelle est la capitale?"
-        assert result[0]["answer"] == "Paris"
+    assert_lang(prompt, "italian")
+    assert "Test text" in prompt
 
-        # Check that litellm.completion was called with French prompt
-        mock_litellm_completion.assert_called_once()
-        call_args = mock_litellm_completion.call_args[1]  # Get keyword arguments
-        prompt = call_args["messages"][0]["content"]
-        assert "Vous êtes un expert" in prompt
 
-    @pytest.mark.asyncio
-    async def test_generate_flashcards_with_content_type(self, mock_litellm_completion, mock_model_config, mocker):
-        """Test generate_flashcards_from_text with different content types."""
-        client = LLMClient(language="italian")
+def test_create_flashcard_prompt_overrides_language(client_cache):
+    """Test that _create_flashcard_prompt can override instance language."""
+    client = client_cache("english")
 
-        # Create Italian content that will pass language validation
-        mock_response_content = """[
-            {
-                "question": "Che cos'è l'intelligenza artificiale?",
-                "answer": "È una tecnologia molto avanzata che utilizza algoritmi",
-                "card_type": "qa"
-            }
-        ]"""
+    prompt = client._create_flashcard_prompt("Test text", language="german")
 
-        mock_response = self._create_mock_response(mock_response_content, mocker)
-        mock_litellm_completion.return_value = mock_response
+    assert_lang(prompt, "german")
+    assert "Test text" in prompt
 
-        # Explicitly specify language to override any Settings configuration
-        result = await client.generate_flashcards_from_text("Test text", language="italian", content_type="technical")
 
-        # Verify the result
-        assert len(result) == 1
-        assert result[0]["question"] == "Che cos'è l'intelligenza artificiale?"
+def test_create_flashcard_prompt_with_content_type(client_cache):
+    """Test _create_flashcard_prompt with different content types."""
+    client = client_cache("french")
 
-        # Check that litellm.completion was called (may be multiple times due to language validation)
-        assert mock_litellm_completion.call_count >= 1
+    academic_prompt = client._create_flashcard_prompt("Test text", content_type="academic")
+    technical_prompt = client._create_flashcard_prompt("Test text", content_type="technical")
 
-        # Check that technical prompt was used in the first call
-        first_call_args = mock_litellm_completion.call_args_list[0][1]
-        prompt = first_call_args["messages"][0]["content"]
-        assert "terminologia tecnica" in prompt
+    assert "vocabulaire académique" in academic_prompt
+    assert "terminologie technique" in technical_prompt
 
-    @pytest.mark.asyncio
-    async def test_generate_flashcards_with_language_validation_success(
-        self, mock_litellm_completion, mock_model_config, mocker
-    ):
-        """Test successful flashcard generation with language validation."""
-        client = LLMClient(language="english")
 
-        mock_response_content = """[
-            {
-                "question": "What is the capital of France?",
-                "answer": "The capital is Paris",
-                "card_type": "qa"
-            }
-        ]"""
-
-        mock_response = self._create_mock_response(mock_response_content, mocker)
-        mock_litellm_completion.return_value = mock_response
-
-        result = await client.generate_flashcards_from_text("Test text about France")
-
-        # Verify successful generation
-        assert len(result) == 1
-        assert result[0]["question"] == "What is the capital of France?"
-        assert result[0]["answer"] == "The capital is Paris"
-
-    # @pytest.mark.asyncio
-    # async def test_generate_flashcards_with_language_validation_retry(
-    #     self, mock_litellm_completion, mock_model_config, mocker
-    # ):
-    #     """Test flashcard generation with language validation retry mechanism."""
-    #     client = LLMClient(language="french")
-
-    #     # First response in wrong language, second in correct language
-    #     responses = [
-    #         [{"question": "What is AI?", "answer": "Artificial Intelligence", "card_type": "qa"}],  # English
-    #         [{"question": "Qu'est-ce que l'IA?", "answer": "Intelligence Artificielle", "card_type": "qa"}],  # French
-    #     ]
-    #     mock_responses = [self._create_mock_response(json.dumps(resp), mocker) for resp in responses]
-    #     mock_litellm_completion.side_effect = mock_responses
-
-    #     result = await client.generate_flashcards_from_text("Test text")
-
-    #     expected = [
-    #         {
-    #             "question": "Qu'est-ce que l'IA?",
-    #             "answer": "Intelligence Artificielle",
-    #             "card_type": "qa",
-    #         }
-    #     ]
-    #     assert result == expected
-    #     # One retry due to initial language mismatch
-    #     assert mock_litellm_completion.call_count == 2
-
-    # Synchronous Wrapper Test
-    def test_generate_flashcards_from_text_sync(self, mock_litellm_completion, mock_model_config, mocker):
-        """Test synchronous wrapper for generate_flashcards_from_text."""
-        client = LLMClient(language="english")
-
-        mock_response_content = """[
-            {
-                "question": "What is Python?",
-                "answer": "A programming language",
-                "card_type": "qa"
-            }
-        ]"""
+def test_create_flashcard_prompt_substitutes_text_into_template(client_cache):
+    """Test that the prompt is exactly the template with the text in place of its placeholder."""
+    client = client_cache("french")
+
+    prompt = client._create_flashcard_prompt("Texte {brut} à traiter", content_type="technical")
+
+    assert prompt == client.get_prompt_template("french", "technical").replace("{text}", "Texte {brut} à traiter")
+
+
+def test_create_flashcard_prompt_invalid_parameters(client_cache):
+    """Test that invalid parameters raise ValueError."""
+    client = client_cache("english")
+
+    with pytest.raises(ValueError) as exc_info:
+        client._create_flashcard_prompt("Test text", language="spanish")
+
+    assert "Invalid parameters" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        client._create_flashcard_prompt("Test text", content_type="invalid")
+
+    assert "Invalid parameters" in str(exc_info.value)
+
+
+# Language Validation Tests
+# Grouped onto one xdist worker so they all reuse that worker's cached clients
+@pytest.mark.xdist_group(name="validate_response")
+@pytest.mark.parametrize(
+    "client_language,flashcards,expected_language,expected_valid,expected_name", LANG_VALIDATION_CASES
+)
+def test_validate_response_language(
+    client_cache, client_language, flashcards, expected_language, expected_valid, expected_name
+):
+    """Test language validation of generated flashcards against the expected language."""
+    client = client_cache(client_language)
+
+    is_valid, metrics = client._validate_response_language(flashcards, expected_language)
+
+    assert is_valid is expected_valid
+    assert metrics["language_info"].name == expected_name
+
+
+@pytest.mark.xdist_group(name="validate_response")
+def test_validate_response_language_empty_list(client_cache):
+    """Test language validation with empty flashcard list."""
+    client = client_cache("english")
+
+    is_valid, metrics = client._validate_response_language([], "english")
+
+    assert is_valid
+    assert metrics["sample_size"] == 0
+    assert metrics["validation_method"] == "empty_list"
+    assert metrics["language_info"] is None
+
 
-        mock_response = self._create_mock_response(mock_response_content, mocker)
-        mock_litellm_completion.return_value = mock_response
+@pytest.mark.xdist_group(name="validate_response")
+def test_validate_response_language_reuses_cached_scan(client_cache):
+    """Test that validating identical flashcards again reuses the cached pattern scan."""
+    client = client_cache("english")
+    flashcards = [FlashcardData("Which cached question is this?", "The one that was asked before.", "qa")]
+    first_valid, first_metrics = client._validate_response_language(flashcards, "english")
+    hits = llm_client._count_pattern_matches.cache_info().hits
 
-        result = client.generate_flashcards_from_text_sync("Python is a programming language.", language="english")
+    is_valid, metrics = client._validate_response_language(list(flashcards), "english")
 
-        assert len(result) == 1
-        assert result[0]["question"] == "What is Python?"
-        assert result[0]["answer"] == "A programming language"
+    assert llm_client._count_pattern_matches.cache_info().hits == hits + 1
+    assert is_valid is first_valid
+    assert metrics == first_metrics
+    assert metrics is not first_metrics
+
+
+def test_validate_response_language_fails_fast_on_foreign_script(client_cache, mocker):
+    """Test that flashcards in another script fail before the pattern sweep, while loanwords do not trip it."""
+    client = client_cache("english")
+    pattern_scan = mocker.spy(llm_client, "_count_pattern_matches")
+    cyrillic = [FlashcardData("Что такое столица Франции?", "Столица Франции это Париж", "qa")]
+
+    is_valid, metrics = client._validate_response_language(cyrillic, "english")
+
+    assert is_valid is False
+    assert metrics["validation_method"] == "script_mismatch"
+    assert metrics["foreign_letter_ratio"] == 1.0
+    pattern_scan.assert_not_called()
+
+    loanword = [FlashcardData("What is a café in Zürich?", "It is a place where they serve coffee", "qa")]
+    is_valid, metrics = client._validate_response_language(loanword, "english")
+
+    assert is_valid is True
+    assert metrics["validation_method"] == "pattern_matching"
+
+
+@pytest.mark.parametrize(
+    "sample",
+    [
+        pytest.param(
+            (
+                ("What is the capital?", "It is Paris and it has the Louvre."),
+                ("Zzz?", "Qqq."),
+                ("Who wrote this", "They did"),
+            ),
+            id="ascii",
+        ),
+        # "İ" lowercases to two code points, so offsets must come from the lowercased cards
+        pytest.param((("İ" * 20 + " what is the", "of"), ("zzz", "zzz")), id="lowercase-grows"),
+    ],
+)
+def test_count_pattern_matches_attributes_joined_scan_to_each_card(sample):
+    """Test that scanning the joined sample counts each pattern once per card that contains it."""
+    patterns = llm_client._LANGUAGE_PATTERNS["english"]
+    expected = tuple(
+        sum(1 for pattern in patterns if pattern.search(f"{question} {answer}".lower())) for question, answer in sample
+    )
+
+    assert llm_client._count_pattern_matches(sample, "english") == expected
+    assert expected[0] > 0
+    assert expected[1] == 0
+
+
+# Async Flashcard Generation Tests
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_language,settings_language,call_language,content_type,response_key,prompt_needle", RESOLUTION_CASES
+)
+async def test_generate_flashcards_language(
+    client_cache,
+    llm_canned,
+    bypass_lang_validation,
+    monkeypatch,
+    client_language,
+    settings_language,
+    call_language,
+    content_type,
+    response_key,
+    prompt_needle,
+):
+    """Test that generate_flashcards_from_text prompts and parses in the requested language."""
+    if settings_language is None:
+        monkeypatch.setattr(config, "settings", _UnavailableSettings())
+    else:
+        monkeypatch.setattr(config.settings, "cardlang", settings_language)
+    client = client_cache(client_language)
+
+    result = await client.generate_flashcards_from_text("Test text", language=call_language, content_type=content_type)
+
+    assert len(result) == 1
+    expected = _CARDS[response_key]
+    assert result[0]["question"] == expected[0]["question"]
+    assert result[0]["answer"] == expected[0]["answer"]
+
+    # Language validation is bypassed, so there are no retries
+    assert len(llm_canned.prompts) == 1
+    bypass_lang_validation.assert_called_once()
+    assert prompt_needle in llm_canned.last_prompt
+
+
+# Validation retry/fallback matrix: canned responses in call order, requested language, retries, expected outcome
+VALIDATION_MATRIX_CASES = [
+    pytest.param(
+        ["en_paris"], "english", 2, {"attempts": 1, "fallback": False, "cards": "en_paris"}, id="first-attempt-valid"
+    ),
+    pytest.param(
+        ["en_paris", "fr_capital"], "french", 2, {"attempts": 2, "fallback": False, "cards": "fr_capital"}, id="retry"
+    ),
+    pytest.param(
+        ["en_paris", "en_paris"], "french", 1, {"attempts": 2, "fallback": True, "cards": "en_paris"}, id="fallback"
+    ),
+    pytest.param(
+        [None, None, "en_paris"],
+        "french",
+        1,
+        {"attempts": 2, "fallback": True, "cards": "en_paris", "fallback_language": "english"},
+        id="english-fallback",
+    ),
+    pytest.param([None, None], "english", 1, {"attempts": 2, "fallback": True, "cards": None}, id="complete-failure"),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("responses,language,retries,expected", VALIDATION_MATRIX_CASES)
+async def test_language_validation_retry_matrix(client_cache, mocker, responses, language, retries, expected):
+    """Test validation retries and fallbacks against canned responses (None answers with no flashcards)."""
+    client = client_cache(language)
+    mocker.patch("src.document_to_anki.core.llm_client._sleep", new_callable=mocker.AsyncMock)
+    mock_api = mocker.patch.object(
+        client,
+        "_make_api_call_with_retry",
+        new_callable=mocker.AsyncMock,
+        side_effect=iter([_RESPONSES[key] if key else "[]" for key in responses]),
+    )
+
+    flashcards, summary = await client._generate_flashcards_with_language_validation(
+        "Test text", language, max_validation_retries=retries
+    )
+
+    expected_cards = _CARDS[expected["cards"]] if expected["cards"] else []
+    assert flashcards == [FlashcardData(**card) for card in expected_cards]
+    assert mock_api.await_count == len(responses)
+    assert summary["total_attempts"] == expected["attempts"]
+    assert summary["fallback_used"] is expected["fallback"]
+    assert summary["final_validation_passed"] is not expected["fallback"]
+    assert summary.get("fallback_language") == expected.get("fallback_language")
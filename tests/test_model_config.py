@@ -1,8 +1,7 @@
 """Tests for ModelConfig class."""
 
-import os
+from collections.abc import Mapping
 
-# pytest-mock provides the mocker fixture
 import pytest
 
 from src.document_to_anki.config import ConfigurationError, ModelConfig
@@ -11,15 +10,15 @@ from src.document_to_anki.config import ConfigurationError, ModelConfig
 class TestModelConfig:
     """Test cases for ModelConfig class."""
 
-    def test_get_model_from_env_with_env_var(self, mocker):
+    def test_get_model_from_env_with_env_var(self, monkeypatch):
         """Test getting model from environment variable."""
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4"})
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
         model = ModelConfig.get_model_from_env()
         assert model == "openai/gpt-4"
 
-    def test_get_model_from_env_default(self, mocker):
+    def test_get_model_from_env_default(self, clear_model_env):
         """Test getting default model when env var not set."""
-        mocker.patch.dict(os.environ, {}, clear=True)
+        clear_model_env()
         model = ModelConfig.get_model_from_env()
         assert model == ModelConfig.DEFAULT_MODEL
         assert model == "gemini/gemini-2.5-flash"
@@ -43,15 +42,23 @@ class TestModelConfig:
         assert set(models) == set(expected_models)
         assert len(models) == 11
 
-    def test_validate_model_config_valid_with_api_key(self, mocker):
+    def test_get_supported_models_returns_shared_tuple(self):
+        """Test that supported models are returned as the same immutable tuple on every call."""
+        models = ModelConfig.get_supported_models()
+
+        assert isinstance(models, tuple)
+        assert ModelConfig.get_supported_models() is models
+        assert models == tuple(ModelConfig.SUPPORTED_MODELS)
+
+    def test_validate_model_config_valid_with_api_key(self, monkeypatch):
         """Test validation with valid model and API key."""
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         result = ModelConfig.validate_model_config("gemini/gemini-2.5-flash")
         assert result is True
 
-    def test_validate_model_config_valid_without_api_key(self, mocker):
+    def test_validate_model_config_valid_without_api_key(self, clear_model_env):
         """Test validation with valid model but missing API key."""
-        mocker.patch.dict(os.environ, {}, clear=True)
+        clear_model_env()
         result = ModelConfig.validate_model_config("gemini/gemini-2.5-flash")
         assert result is False
 
@@ -75,15 +82,16 @@ class TestModelConfig:
         api_key = ModelConfig.get_required_api_key("invalid/model")
         assert api_key is None
 
-    def test_validate_and_get_model_success(self, mocker):
+    def test_validate_and_get_model_success(self, monkeypatch):
         """Test successful model validation and retrieval."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         model = ModelConfig.validate_and_get_model()
         assert model == "gemini/gemini-2.5-flash"
 
-    def test_validate_and_get_model_unsupported_model(self, mocker):
+    def test_validate_and_get_model_unsupported_model(self, monkeypatch):
         """Test validation failure with unsupported model."""
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
@@ -92,35 +100,65 @@ class TestModelConfig:
         assert "gemini/gemini-2.5-flash" in error_msg
         assert "openai/gpt-4" in error_msg
 
-    def test_validate_and_get_model_missing_api_key(self, mocker):
+    def test_validate_and_get_model_missing_api_key(self, monkeypatch, clear_model_env):
         """Test validation failure with missing API key."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash"}, clear=True)
+        clear_model_env()
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
         with pytest.raises(ConfigurationError) as exc_info:
             ModelConfig.validate_and_get_model()
 
         error_msg = str(exc_info.value)
         assert "Missing API key for model 'gemini/gemini-2.5-flash'" in error_msg
         assert "GEMINI_API_KEY" in error_msg
+        # Other models sharing the key are listed from the reverse index
+        assert "gemini/gemini-2.5-pro" in error_msg
+        assert "openai/gpt-4" not in error_msg
 
-    def test_validate_and_get_model_default_with_api_key(self, mocker):
+    def test_validate_and_get_model_default_with_api_key(self, monkeypatch, clear_model_env):
         """Test validation with default model and API key."""
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}, clear=True)
-        # Clear MODEL env var to use default
-        if "MODEL" in os.environ:
-            del os.environ["MODEL"]
+        clear_model_env()
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
 
         model = ModelConfig.validate_and_get_model()
         assert model == "gemini/gemini-2.5-flash"
 
-    def test_openai_model_validation(self, mocker):
+    def test_openai_model_validation(self, monkeypatch):
         """Test validation for OpenAI models."""
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-openai-key"})
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
         model = ModelConfig.validate_and_get_model()
         assert model == "openai/gpt-4"
 
+    def test_validate_and_get_model_cache_tracks_env_changes(self, monkeypatch):
+        """Test that cached model resolution still reflects environment changes."""
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+        assert ModelConfig.validate_and_get_model() == "openai/gpt-4"
+        assert ModelConfig.validate_and_get_model() == "openai/gpt-4"
+
+        monkeypatch.delenv("OPENAI_API_KEY")
+        with pytest.raises(ConfigurationError, match="OPENAI_API_KEY"):
+            ModelConfig.validate_and_get_model()
+
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        assert ModelConfig.validate_and_get_model() == "gemini/gemini-2.5-flash"
+
+    def test_validate_and_get_model_ignores_unrelated_api_keys(self, monkeypatch):
+        """Test that API keys no supported model uses do not change the cached resolution."""
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
+        ModelConfig.validate_and_get_model()
+        misses = ModelConfig._resolve.cache_info().misses
+
+        monkeypatch.setenv("UNRELATED_API_KEY", "other-key")
+
+        assert ModelConfig.validate_and_get_model() == "openai/gpt-4"
+        assert ModelConfig._resolve.cache_info().misses == misses
+
     def test_supported_models_constant(self):
         """Test that SUPPORTED_MODELS constant has expected structure."""
-        assert isinstance(ModelConfig.SUPPORTED_MODELS, dict)
+        assert isinstance(ModelConfig.SUPPORTED_MODELS, Mapping)
 
         # Check that all values are valid environment variable names
         for model, api_key in ModelConfig.SUPPORTED_MODELS.items():
@@ -5,10 +5,61 @@ Tests the PromptTemplates class to ensure proper generation of language-specific
 prompt templates for different content types and languages.
 """
 
+import re
+
 import pytest
 
 from src.document_to_anki.core.prompt_templates import PromptTemplates
 
+# Template grid swept by the per-template tests; pytest builds the cross product from stacked parametrize marks
+LANGS = ["english", "french", "italian", "german"]
+TYPES = ["academic", "technical", "general"]
+LANGUAGE_ALIASES = [*LANGS, "en", "fr", "it", "de"]
+
+
+def _any_of(*keywords: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile an alternation matching any of the keywords, so one search replaces a scan per keyword."""
+    return re.compile("|".join(map(re.escape, keywords)), flags)
+
+
+# Phrases of which at least one must name the target language in each language's templates
+LANGUAGE_SPEC_RE = {
+    "english": _any_of("IN ENGLISH", "English"),
+    "french": _any_of("EN FRANÇAIS", "français"),
+    "italian": _any_of("IN ITALIANO", "italiano"),
+    "german": _any_of("AUF DEUTSCH", "Deutsch"),
+}
+
+# JSON formatting elements every template must contain
+REQUIRED_ELEMENTS = ["question", "answer", "card_type", "{text}", "JSON"]
+
+# Grammar and vocabulary keywords of which at least one must appear in each language's general template
+GRAMMAR_RE = {
+    "english": _any_of("grammar", "vocabulary"),
+    "french": _any_of("grammaire", "vocabulaire", "accords"),
+    "italian": _any_of("grammatica", "vocabolario", "accordi"),
+    "german": _any_of("Grammatik", "Vokabular", "Kongruenz"),
+}
+
+# Words for "example" in the supported languages, in any case
+EXAMPLE_RE = _any_of("EXAMPLE", "EXEMPLE", "ESEMPIO", "BEISPIEL", flags=re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def all_templates():
+    """Every (language name or ISO code, content_type) template, built once for the session."""
+    return {
+        (lang, content_type): PromptTemplates.get_template(lang, content_type)
+        for lang in LANGUAGE_ALIASES
+        for content_type in TYPES
+    }
+
+
+@pytest.fixture(scope="session")
+def templates_with_example(all_templates):
+    """Languages whose general template names an example, scanned once for the session."""
+    return frozenset(lang for lang in LANGS if EXAMPLE_RE.search(all_templates[lang, "general"]))
+
 
 class TestPromptTemplates:
     """Test cases for the PromptTemplates class."""
@@ -29,15 +80,11 @@ class TestPromptTemplates:
         assert supported == expected
         assert len(supported) == 3
 
-    def test_validate_template_parameters_valid(self):
-        """Test validation with valid parameters."""
-        # Test all language variations
-        languages = ["english", "french", "italian", "german", "en", "fr", "it", "de"]
-        content_types = ["academic", "technical", "general"]
-
-        for lang in languages:
-            for content_type in content_types:
-                assert PromptTemplates.validate_template_parameters(lang, content_type)
+    @pytest.mark.parametrize("lang", LANGUAGE_ALIASES)
+    @pytest.mark.parametrize("content_type", TYPES)
+    def test_validate_template_parameters_valid(self, lang, content_type):
+        """Test validation with valid parameters, for every language name and code."""
+        assert PromptTemplates.validate_template_parameters(lang, content_type)
 
     def test_validate_template_parameters_invalid_language(self):
         """Test validation with invalid language."""
@@ -59,9 +106,9 @@ class TestPromptTemplates:
         assert PromptTemplates.validate_template_parameters("French", "Academic")
         assert PromptTemplates.validate_template_parameters("italian", "TECHNICAL")
 
-    def test_get_template_english_general(self):
+    def test_get_template_english_general(self, all_templates):
         """Test English general template generation."""
-        template = PromptTemplates.get_template("english", "general")
+        template = all_templates["english", "general"]
 
         # Check for key English template elements
         assert "You are an expert educator" in template
@@ -72,9 +119,9 @@ class TestPromptTemplates:
         assert "{text}" in template
         assert "Use clear and accessible English" in template
 
-    def test_get_template_english_academic(self):
+    def test_get_template_english_academic(self, all_templates):
         """Test English academic template generation."""
-        template = PromptTemplates.get_template("english", "academic")
+        template = all_templates["english", "academic"]
 
         # Check for academic-specific content
         assert "academic vocabulary" in template
@@ -82,9 +129,9 @@ class TestPromptTemplates:
         assert "conceptual understanding" in template
         assert "theoretical frameworks" in template
 
-    def test_get_template_english_technical(self):
+    def test_get_template_english_technical(self, all_templates):
         """Test English technical template generation."""
-        template = PromptTemplates.get_template("english", "technical")
+        template = all_templates["english", "technical"]
 
         # Check for technical-specific content
         assert "technical terminology" in template
@@ -92,9 +139,9 @@ class TestPromptTemplates:
         assert "cause-and-effect" in template
         assert "technical accuracy" in template
 
-    def test_get_template_french_general(self):
+    def test_get_template_french_general(self, all_templates):
         """Test French general template generation."""
-        template = PromptTemplates.get_template("french", "general")
+        template = all_templates["french", "general"]
 
         # Check for key French template elements
         assert "Vous êtes un expert" in template
@@ -106,9 +153,9 @@ class TestPromptTemplates:
         assert "français accessible et clair" in template
         assert "EN FRANÇAIS" in template
 
-    def test_get_template_french_academic(self):
+    def test_get_template_french_academic(self, all_templates):
         """Test French academic template generation."""
-        template = PromptTemplates.get_template("french", "academic")
+        template = all_templates["french", "academic"]
 
         # Check for French academic-specific content
         assert "vocabulaire académique" in template
@@ -116,9 +163,9 @@ class TestPromptTemplates:
         assert "compréhension conceptuelle" in template
         assert "cadres théoriques" in template
 
-    def test_get_template_italian_general(self):
+    def test_get_template_italian_general(self, all_templates):
         """Test Italian general template generation."""
-        template = PromptTemplates.get_template("italian", "general")
+        template = all_templates["italian", "general"]
 
         # Check for key Italian template elements
         assert "Sei un esperto" in template
@@ -130,9 +177,9 @@ class TestPromptTemplates:
         assert "italiano accessibile e chiaro" in template
         assert "IN ITALIANO" in template
 
-    def test_get_template_italian_technical(self):
+    def test_get_template_italian_technical(self, all_templates):
         """Test Italian technical template generation."""
-        template = PromptTemplates.get_template("italian", "technical")
+        template = all_templates["italian", "technical"]
 
         # Check for Italian technical-specific content
         assert "terminologia tecnica italiana" in template
@@ -140,9 +187,9 @@ class TestPromptTemplates:
         assert "causa-effetto" in template
         assert "precisione tecnica" in template
 
-    def test_get_template_german_general(self):
+    def test_get_template_german_general(self, all_templates):
         """Test German general template generation."""
-        template = PromptTemplates.get_template("german", "general")
+        template = all_templates["german", "general"]
 
         # Check for key German template elements
         assert "Sie sind ein Experte" in template
@@ -154,9 +201,9 @@ class TestPromptTemplates:
         assert "zugängliches und klares Deutsch" in template
         assert "AUF DEUTSCH" in template
 
-    def test_get_template_german_academic(self):
+    def test_get_template_german_academic(self, all_templates):
         """Test German academic template generation."""
-        template = PromptTemplates.get_template("german", "academic")
+        template = all_templates["german", "academic"]
 
         # Check for German academic-specific content
         assert "akademisches Vokabular" in template
@@ -164,24 +211,18 @@ class TestPromptTemplates:
         assert "konzeptuelle Verständnis" in template
         assert "theoretische Rahmen" in template
 
-    def test_get_template_with_language_codes(self):
-        """Test template generation with ISO language codes."""
-        # Test that language codes work the same as full names
-        en_template = PromptTemplates.get_template("en", "general")
-        english_template = PromptTemplates.get_template("english", "general")
-        assert en_template == english_template
+    @pytest.mark.parametrize("code,lang", [("en", "english"), ("fr", "french"), ("it", "italian"), ("de", "german")])
+    @pytest.mark.parametrize("content_type", TYPES)
+    def test_get_template_with_language_codes(self, all_templates, code, lang, content_type):
+        """Test that ISO language codes resolve to the same template as full names."""
+        assert all_templates[code, content_type] is all_templates[lang, content_type]
 
-        fr_template = PromptTemplates.get_template("fr", "general")
-        french_template = PromptTemplates.get_template("french", "general")
-        assert fr_template == french_template
-
-        it_template = PromptTemplates.get_template("it", "general")
-        italian_template = PromptTemplates.get_template("italian", "general")
-        assert it_template == italian_template
+    def test_get_template_shares_cached_template_across_aliases(self):
+        """Test that ISO codes and mixed-case names resolve to the same cached template object."""
+        template = PromptTemplates.get_template("french", "academic")
 
-        de_template = PromptTemplates.get_template("de", "general")
-        german_template = PromptTemplates.get_template("german", "general")
-        assert de_template == german_template
+        assert PromptTemplates.get_template("fr", "academic") is template
+        assert PromptTemplates.get_template(" French ", "ACADEMIC") is template
 
     def test_get_template_case_insensitive(self):
         """Test that template generation is case insensitive."""
@@ -189,83 +230,56 @@ class TestPromptTemplates:
         template2 = PromptTemplates.get_template("english", "general")
         template3 = PromptTemplates.get_template("English", "General")
 
-        assert template1 == template2 == template3
+        assert template1 is template2 is template3
 
     def test_get_template_invalid_language(self):
         """Test that invalid language raises ValueError."""
         with pytest.raises(ValueError, match="Unsupported language"):
             PromptTemplates.get_template("spanish", "general")
 
-    def test_get_template_invalid_content_type(self):
+    def test_get_template_invalid_content_type(self, all_templates):
         """Test that invalid content type defaults to general."""
         # The current implementation should handle invalid content types gracefully
         template = PromptTemplates.get_template("english", "invalid_type")
-        general_template = PromptTemplates.get_template("english", "general")
+        general_template = all_templates["english", "general"]
 
-        # Should fall back to general template
-        assert template == general_template
+        # Should fall back to the cached general template
+        assert template is general_template
 
-    def test_all_templates_contain_required_elements(self):
+    @pytest.mark.parametrize("lang", LANGS)
+    @pytest.mark.parametrize("content_type", TYPES)
+    @pytest.mark.parametrize("element", REQUIRED_ELEMENTS)
+    def test_all_templates_contain_required_elements(self, all_templates, lang, content_type, element):
         """Test that all templates contain required JSON formatting elements."""
-        languages = ["english", "french", "italian", "german"]
-        content_types = ["academic", "technical", "general"]
-
-        required_elements = ["question", "answer", "card_type", "{text}", "JSON"]
+        assert element in all_templates[lang, content_type], f"Missing '{element}' in {lang} {content_type} template"
 
-        for lang in languages:
-            for content_type in content_types:
-                template = PromptTemplates.get_template(lang, content_type)
-
-                for element in required_elements:
-                    assert element in template, f"Missing '{element}' in {lang} {content_type} template"
-
-    def test_all_templates_specify_target_language(self):
+    @pytest.mark.parametrize("lang", LANGS)
+    @pytest.mark.parametrize("content_type", TYPES)
+    def test_all_templates_specify_target_language(self, all_templates, lang, content_type):
         """Test that all templates clearly specify the target language."""
-        language_specifications = {
-            "english": ["IN ENGLISH", "English"],
-            "french": ["EN FRANÇAIS", "français"],
-            "italian": ["IN ITALIANO", "italiano"],
-            "german": ["AUF DEUTSCH", "Deutsch"],
-        }
-
-        content_types = ["academic", "technical", "general"]
+        template = all_templates[lang, content_type]
 
-        for lang, specs in language_specifications.items():
-            for content_type in content_types:
-                template = PromptTemplates.get_template(lang, content_type)
+        # Check that at least one language specification is present
+        assert LANGUAGE_SPEC_RE[lang].search(template), (
+            f"No language specification found in {lang} {content_type} template"
+        )
 
-                # Check that at least one language specification is present
-                found_spec = any(spec in template for spec in specs)
-                assert found_spec, f"No language specification found in {lang} {content_type} template"
-
-    def test_templates_have_proper_grammar_instructions(self):
+    @pytest.mark.parametrize("lang", LANGS)
+    def test_templates_have_proper_grammar_instructions(self, all_templates, lang):
         """Test that templates include proper grammar and vocabulary instructions."""
-        grammar_keywords = {
-            "english": ["grammar", "vocabulary"],
-            "french": ["grammaire", "vocabulaire", "accords"],
-            "italian": ["grammatica", "vocabolario", "accordi"],
-            "german": ["Grammatik", "Vokabular", "Kongruenz"],
-        }
-
-        for lang, keywords in grammar_keywords.items():
-            template = PromptTemplates.get_template(lang, "general")
+        template = all_templates[lang, "general"]
 
-            # Check that at least one grammar-related keyword is present
-            found_keyword = any(keyword in template for keyword in keywords)
-            assert found_keyword, f"No grammar instructions found in {lang} template"
+        # Check that at least one grammar-related keyword is present
+        assert GRAMMAR_RE[lang].search(template), f"No grammar instructions found in {lang} template"
 
-    def test_templates_include_examples(self):
+    @pytest.mark.parametrize("lang", LANGS)
+    def test_templates_include_examples(self, all_templates, templates_with_example, lang):
         """Test that all templates include example JSON output."""
-        languages = ["english", "french", "italian", "german"]
-
-        for lang in languages:
-            template = PromptTemplates.get_template(lang, "general")
+        template = all_templates[lang, "general"]
 
-            # Check for example structure (different languages use different words for "example")
-            example_keywords = ["EXAMPLE", "EXEMPLE", "ESEMPIO", "BEISPIEL"]
-            has_example = any(keyword in template.upper() for keyword in example_keywords)
-            assert has_example, f"No example keyword found in {lang} template"
+        # Check for example structure (different languages use different words for "example")
+        assert lang in templates_with_example, f"No example keyword found in {lang} template"
 
-            assert '"question":' in template
-            assert '"answer":' in template
-            assert '"card_type":' in template
+        assert '"question":' in template
+        assert '"answer":' in template
+        assert '"card_type":' in template
@@ -1,200 +1,151 @@
 """Tests for Settings class language configuration."""
 
-import os
+import re
 
-# pytest-mock provides the mocker fixture
 import pytest
 
 from document_to_anki.config import LanguageInfo, Settings
 
+# Every supported language name and ISO code
+LANGUAGE_ALIASES = ["english", "en", "french", "fr", "italian", "it", "german", "de"]
+
+# Raw CARDLANG value -> normalized cardlang, covering case variations of names and codes and surrounding whitespace
+NORMALIZATION_CASES = [
+    ("ENGLISH", "english"),
+    ("English", "english"),
+    ("eNgLiSh", "english"),
+    ("FRENCH", "french"),
+    ("French", "french"),
+    ("fReNcH", "french"),
+    ("ITALIAN", "italian"),
+    ("german", "german"),
+    ("EN", "en"),
+    ("eN", "en"),
+    ("Fr", "fr"),
+    ("fR", "fr"),
+    ("IT", "it"),
+    ("de", "de"),
+    ("  english  ", "english"),
+    ("\tenglish\n", "english"),
+    (" french ", "french"),
+    ("\tFR\n", "fr"),
+    ("\tit\t", "it"),
+    ("  de  ", "de"),
+]
+
+# CARDLANG value (None leaves it unset) -> (language name, language code, prompt key)
+LANGUAGE_HELPER_CASES = [
+    pytest.param(None, "English", "en", "english", id="default"),
+    pytest.param("french", "French", "fr", "french", id="french"),
+    pytest.param("fr", "French", "fr", "french", id="fr"),
+    pytest.param("italian", "Italian", "it", "italian", id="italian"),
+    pytest.param("it", "Italian", "it", "italian", id="it"),
+    pytest.param("german", "German", "de", "german", id="german"),
+    pytest.param("de", "German", "de", "german", id="de"),
+    pytest.param("english", "English", "en", "english", id="english"),
+    pytest.param("en", "English", "en", "english", id="en"),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_dotenv():
+    """Stop every Settings built in this module from reading the project's .env file."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Settings, "model_config", {**Settings.model_config, "env_file": None})
+        yield
+
+
+@pytest.fixture
+def settings_factory(monkeypatch):
+    """Return a callable building Settings from a CARDLANG value.
+
+    ``None`` leaves CARDLANG unset; monkeypatch only records the CARDLANG delta.
+    """
+
+    def make(cardlang: str | None = None) -> Settings:
+        if cardlang is None:
+            monkeypatch.delenv("CARDLANG", raising=False)
+        else:
+            monkeypatch.setenv("CARDLANG", cardlang)
+        return Settings()
+
+    return make
+
 
 class TestSettingsLanguage:
     """Test cases for Settings class language configuration."""
 
-    def test_cardlang_field_default(self, mocker):
+    def test_cardlang_field_default(self, settings_factory):
         """Test that cardlang field defaults to English."""
-        mocker.patch.dict(os.environ, {}, clear=True)
-        # Create Settings without loading from .env file
-        settings = Settings(_env_file=None)
+        settings = settings_factory()
         assert settings.cardlang == "english"
 
-    def test_cardlang_field_from_env_var(self, mocker):
+    def test_cardlang_ignores_dotenv_file(self, settings_factory, tmp_path, monkeypatch):
+        """Test that the module fixture keeps a .env file in the working directory from being read."""
+        (tmp_path / ".env").write_text("CARDLANG=french\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        assert settings_factory(None).cardlang == "english"
+
+    def test_cardlang_field_from_env_var(self, settings_factory):
         """Test cardlang field loading from CARDLANG environment variable."""
-        mocker.patch.dict(os.environ, {"CARDLANG": "french"})
-        settings = Settings()
+        settings = settings_factory("french")
         assert settings.cardlang == "french"
 
-    def test_cardlang_field_normalization(self, mocker):
-        """Test that cardlang field normalizes input values."""
-        test_cases = [
-            ("ENGLISH", "english"),
-            ("French", "french"),
-            ("ITALIAN", "italian"),
-            ("german", "german"),
-            ("EN", "en"),
-            ("Fr", "fr"),
-            ("IT", "it"),
-            ("de", "de"),
-            ("  english  ", "english"),
-            ("\tFR\n", "fr"),
-        ]
-
-        for input_value, expected_normalized in test_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": input_value})
-            settings = Settings()
-            assert settings.cardlang == expected_normalized
-
-    def test_cardlang_field_validation_valid_languages(self, mocker):
-        """Test cardlang field validation with valid languages."""
-        valid_languages = ["english", "en", "french", "fr", "italian", "it", "german", "de"]
+    @pytest.mark.parametrize("input_value,expected_normalized", NORMALIZATION_CASES)
+    def test_cardlang_field_normalization(self, settings_factory, input_value, expected_normalized):
+        """Test that cardlang field normalizes case and surrounding whitespace."""
+        settings = settings_factory(input_value)
+        assert settings.cardlang == expected_normalized
 
-        for lang in valid_languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": lang})
-            # Should not raise any exceptions
-            settings = Settings()
-            assert settings.cardlang in ["english", "en", "french", "fr", "italian", "it", "german", "de"]
+    @pytest.mark.parametrize("lang", LANGUAGE_ALIASES)
+    def test_cardlang_field_validation_valid_languages(self, settings_factory, lang):
+        """Test cardlang field validation with valid languages."""
+        # Should not raise any exceptions
+        settings = settings_factory(lang)
+        assert settings.cardlang in LANGUAGE_ALIASES
 
-    def test_cardlang_field_validation_invalid_languages(self, mocker):
+    @pytest.mark.parametrize("lang", ["spanish", "zh", "invalid", "123", "portuguese"])
+    def test_cardlang_field_validation_invalid_languages(self, settings_factory, lang):
         """Test cardlang field validation with invalid languages."""
-        invalid_languages = ["spanish", "zh", "invalid", "123", "portuguese"]
-
-        for lang in invalid_languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": lang})
-            with pytest.raises(ValueError) as exc_info:
-                Settings()
+        with pytest.raises(ValueError, match=rf"Unsupported language '{re.escape(lang)}'\. Supported languages:"):
+            settings_factory(lang)
 
-            error_msg = str(exc_info.value)
-            assert f"Unsupported language '{lang}'" in error_msg
-            assert "Supported languages:" in error_msg
-
-    def test_cardlang_field_empty_value_fallback(self, mocker):
+    @pytest.mark.parametrize("empty_value", ["", "   ", "\t\n"])
+    def test_cardlang_field_empty_value_fallback(self, settings_factory, empty_value):
         """Test cardlang field fallback to English when empty."""
-        empty_values = ["", "   ", "\t\n"]
-
-        for empty_value in empty_values:
-            mocker.patch.dict(os.environ, {"CARDLANG": empty_value})
-            settings = Settings()
-            assert settings.cardlang == "english"
+        settings = settings_factory(empty_value)
+        assert settings.cardlang == "english"
 
-    def test_cardlang_field_missing_env_var(self, mocker):
+    def test_cardlang_field_missing_env_var(self, settings_factory):
         """Test cardlang field when CARDLANG environment variable is not set."""
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
+        settings = settings_factory(None)
         assert settings.cardlang == "english"
 
-    def test_get_language_info_method(self, mocker):
+    @pytest.mark.parametrize("cardlang,expected_name,expected_code,expected_prompt_key", LANGUAGE_HELPER_CASES)
+    def test_get_language_info_method(
+        self, settings_factory, cardlang, expected_name, expected_code, expected_prompt_key
+    ):
         """Test get_language_info helper method."""
-        # Test with English (default)
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
-        info = settings.get_language_info()
+        info = settings_factory(cardlang).get_language_info()
 
         assert isinstance(info, LanguageInfo)
-        assert info.code == "en"
-        assert info.name == "English"
-        assert info.prompt_key == "english"
-
-        # Test with French
-        mocker.patch.dict(os.environ, {"CARDLANG": "french"})
-        pass
-        settings = Settings()
-        info = settings.get_language_info()
-
-        assert info.code == "fr"
-        assert info.name == "French"
-        assert info.prompt_key == "french"
-
-        # Test with Italian ISO code
-        mocker.patch.dict(os.environ, {"CARDLANG": "it"})
-        pass
-        settings = Settings()
-        info = settings.get_language_info()
-
-        assert info.code == "it"
-        assert info.name == "Italian"
-        assert info.prompt_key == "italian"
-
-    def test_get_language_name_method(self, mocker):
-        """Test get_language_name helper method."""
-        # Test with default English
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
-        assert settings.get_language_name() == "English"
-
-        # Test with different languages
-        test_cases = [
-            ("french", "French"),
-            ("fr", "French"),
-            ("italian", "Italian"),
-            ("it", "Italian"),
-            ("german", "German"),
-            ("de", "German"),
-            ("english", "English"),
-            ("en", "English"),
-        ]
-
-        for cardlang_value, expected_name in test_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": cardlang_value})
-            pass
-            settings = Settings()
-            assert settings.get_language_name() == expected_name
-
-    def test_get_language_code_method(self, mocker):
-        """Test get_language_code helper method."""
-        # Test with default English
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
-        assert settings.get_language_code() == "en"
-
-        # Test with different languages
-        test_cases = [
-            ("french", "fr"),
-            ("fr", "fr"),
-            ("italian", "it"),
-            ("it", "it"),
-            ("german", "de"),
-            ("de", "de"),
-            ("english", "en"),
-            ("en", "en"),
-        ]
-
-        for cardlang_value, expected_code in test_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": cardlang_value})
-            pass
-            settings = Settings()
-            assert settings.get_language_code() == expected_code
-
-    def test_get_prompt_key_method(self, mocker):
-        """Test get_prompt_key helper method."""
-        # Test with default English
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
-        assert settings.get_prompt_key() == "english"
-
-        # Test with different languages
-        test_cases = [
-            ("french", "french"),
-            ("fr", "french"),
-            ("italian", "italian"),
-            ("it", "italian"),
-            ("german", "german"),
-            ("de", "german"),
-            ("english", "english"),
-            ("en", "english"),
-        ]
-
-        for cardlang_value, expected_prompt_key in test_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": cardlang_value})
-            pass
-            settings = Settings()
-            assert settings.get_prompt_key() == expected_prompt_key
-
-    def test_language_configuration_integration_with_other_settings(self, mocker):
+        assert info.code == expected_code
+        assert info.name == expected_name
+        assert info.prompt_key == expected_prompt_key
+
+    @pytest.mark.parametrize("cardlang,expected_name,expected_code,expected_prompt_key", LANGUAGE_HELPER_CASES)
+    def test_language_helper_methods(
+        self, settings_factory, cardlang, expected_name, expected_code, expected_prompt_key
+    ):
+        """Test the get_language_name, get_language_code and get_prompt_key helper methods."""
+        settings = settings_factory(cardlang)
+
+        assert settings.get_language_name() == expected_name
+        assert settings.get_language_code() == expected_code
+        assert settings.get_prompt_key() == expected_prompt_key
+
+    def test_language_configuration_integration_with_other_settings(self, monkeypatch):
         """Test that language configuration works alongside other settings."""
         env_vars = {
             "CARDLANG": "german",
@@ -203,8 +154,8 @@ class TestSettingsLanguage:
             "MAX_FILE_SIZE_MB": "100",
         }
 
-        mocker.patch.dict(os.environ, env_vars)
-        pass
+        for key, value in env_vars.items():
+            monkeypatch.setenv(key, value)
         settings = Settings()
 
         # Test language configuration
@@ -217,77 +168,23 @@ class TestSettingsLanguage:
         assert settings.log_level == "DEBUG"
         assert settings.max_file_size_mb == 100
 
-    def test_settings_language_methods_consistency(self, mocker):
+    @pytest.mark.parametrize("lang", LANGUAGE_ALIASES)
+    def test_settings_language_methods_consistency(self, settings_factory, lang):
         """Test that all language helper methods are consistent."""
-        test_languages = ["english", "french", "italian", "german", "en", "fr", "it", "de"]
-
-        for lang in test_languages:
-            mocker.patch.dict(os.environ, {"CARDLANG": lang})
-            pass
-            settings = Settings()
-
-            # Get information through different methods
-            info = settings.get_language_info()
-            name = settings.get_language_name()
-            code = settings.get_language_code()
-            prompt_key = settings.get_prompt_key()
-
-            # Verify consistency
-            assert info.name == name
-            assert info.code == code
-            assert info.prompt_key == prompt_key
-
-    def test_cardlang_field_case_insensitive(self, mocker):
-        """Test that cardlang field is case insensitive."""
-        case_variations = [
-            "ENGLISH",
-            "English",
-            "english",
-            "eNgLiSh",
-            "FRENCH",
-            "French",
-            "french",
-            "fReNcH",
-            "EN",
-            "En",
-            "en",
-            "eN",
-            "FR",
-            "Fr",
-            "fr",
-            "fR",
-        ]
-
-        for lang_variation in case_variations:
-            mocker.patch.dict(os.environ, {"CARDLANG": lang_variation})
-            pass
-            # Should not raise any exceptions
-            settings = Settings()
-            assert settings.cardlang.lower() in ["english", "french", "en", "fr"]
-
-    def test_cardlang_field_whitespace_handling(self, mocker):
-        """Test that cardlang field handles whitespace properly."""
-        whitespace_cases = [
-            "  english  ",
-            "\tenglish\n",
-            " french ",
-            "\tit\t",
-            "  de  ",
-        ]
-
-        for lang_with_whitespace in whitespace_cases:
-            mocker.patch.dict(os.environ, {"CARDLANG": lang_with_whitespace})
-            pass
-            settings = Settings()
-            # Should normalize to clean value
-            assert settings.cardlang == lang_with_whitespace.strip().lower()
-
-    def test_backward_compatibility_default_behavior(self, mocker):
+        settings = settings_factory(lang)
+
+        # Get information through different methods
+        info = settings.get_language_info()
+
+        # Verify consistency
+        assert info.name == settings.get_language_name()
+        assert info.code == settings.get_language_code()
+        assert info.prompt_key == settings.get_prompt_key()
+
+    def test_backward_compatibility_default_behavior(self, settings_factory):
         """Test backward compatibility - defaults to English when not configured."""
         # Simulate existing user with no CARDLANG set
-        mocker.patch.dict(os.environ, {}, clear=True)
-        pass
-        settings = Settings(_env_file=None)
+        settings = settings_factory(None)
 
         # Should default to English (not French as was hardcoded before)
         assert settings.cardlang == "english"
@@ -295,12 +192,10 @@ class TestSettingsLanguage:
         assert settings.get_language_name() == "English"
         assert settings.get_prompt_key() == "english"
 
-    def test_migration_guidance_in_error_messages(self, mocker):
+    def test_migration_guidance_in_error_messages(self, settings_factory):
         """Test that error messages provide helpful migration guidance."""
-        mocker.patch.dict(os.environ, {"CARDLANG": "spanish"})
-        pass
         with pytest.raises(ValueError) as exc_info:
-            Settings()
+            settings_factory("spanish")
 
         error_msg = str(exc_info.value)
         # Should mention supported languages for migration guidance
@@ -310,27 +205,27 @@ class TestSettingsLanguage:
         assert "Italian" in error_msg
         assert "German" in error_msg
 
-    def test_settings_instantiation_with_language_config(self, mocker):
-        """Test Settings instantiation with various language configurations."""
-        # Test that Settings can be instantiated multiple times with different configs
-        configs = [
+    @pytest.mark.parametrize(
+        "cardlang,expected_code,expected_name",
+        [
             ("english", "en", "English"),
             ("fr", "fr", "French"),
             ("ITALIAN", "it", "Italian"),
             ("de", "de", "German"),
-        ]
-
-        for cardlang, expected_code, expected_name in configs:
-            mocker.patch.dict(os.environ, {"CARDLANG": cardlang})
-            pass
-            settings = Settings()
-
-            assert settings.get_language_code() == expected_code
-            assert settings.get_language_name() == expected_name
-
-            # Test that settings object is properly configured
-            assert hasattr(settings, "cardlang")
-            assert hasattr(settings, "get_language_info")
-            assert hasattr(settings, "get_language_name")
-            assert hasattr(settings, "get_language_code")
-            assert hasattr(settings, "get_prompt_key")
+        ],
+    )
+    def test_settings_instantiation_with_language_config(
+        self, settings_factory, cardlang, expected_code, expected_name
+    ):
+        """Test Settings instantiation with various language configurations."""
+        settings = settings_factory(cardlang)
+
+        assert settings.get_language_code() == expected_code
+        assert settings.get_language_name() == expected_name
+
+        # Test that settings object is properly configured
+        assert hasattr(settings, "cardlang")
+        assert hasattr(settings, "get_language_info")
+        assert hasattr(settings, "get_language_name")
+        assert hasattr(settings, "get_language_code")
+        assert hasattr(settings, "get_prompt_key")
@@ -5,9 +5,6 @@ This test validates that both CLI and web interfaces properly validate
 model configuration on startup and provide helpful error messages.
 """
 
-import os
-
-# pytest-mock provides the mocker fixture
 import pytest
 from click.testing import CliRunner
 
@@ -18,49 +15,52 @@ from src.document_to_anki.config import ConfigurationError
 class TestStartupValidation:
     """Test startup validation for CLI and web interfaces."""
 
-    def test_cli_startup_validation_success(self, mocker):
+    def test_cli_startup_validation_success(self, monkeypatch):
         """Test successful CLI startup with valid model configuration."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         runner = CliRunner()
         result = runner.invoke(main, ["--help"])
         assert result.exit_code == 0
         assert "Document to Anki CLI" in result.output
 
-    def test_cli_startup_validation_invalid_model(self, mocker):
+    def test_cli_startup_validation_invalid_model(self, monkeypatch):
         """Test CLI startup failure with invalid model."""
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         runner = CliRunner()
         result = runner.invoke(main, ["convert", "--help"])
         # CLI should fail during context initialization
         assert result.exit_code != 0
         assert "Model Configuration Error" in result.output
 
-    def test_cli_startup_validation_missing_api_key(self, mocker):
+    def test_cli_startup_validation_missing_api_key(self, monkeypatch, clear_model_env):
         """Test CLI startup failure with missing API key."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash"}, clear=True)
+        clear_model_env()
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
         runner = CliRunner()
         result = runner.invoke(main, ["convert", "--help"])
         # CLI should fail during context initialization
         assert result.exit_code != 0
         assert "Model Configuration Error" in result.output
 
-    def test_cli_error_messages_are_helpful(self, mocker):
+    def test_cli_error_messages_are_helpful(self, monkeypatch):
         """Test that CLI provides helpful error messages for configuration issues."""
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         runner = CliRunner()
         result = runner.invoke(main, ["convert", "nonexistent.pdf"])
 
         # Should contain helpful error information
         assert "Model Configuration Error" in result.output or result.exit_code != 0
 
-    def test_web_app_startup_validation_in_lifespan(self, mocker):
+    def test_web_app_startup_validation_in_lifespan(self, monkeypatch):
         """Test that web app validates model configuration in lifespan function."""
         from fastapi import FastAPI
 
         from src.document_to_anki.web.app import lifespan
 
         # Test successful validation
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         app = FastAPI()
         # This should not raise an exception
         try:
@@ -75,14 +75,14 @@ class TestStartupValidation:
             # If there's an exception, it shouldn't be a ConfigurationError
             assert not isinstance(e, ConfigurationError)
 
-    def test_web_app_startup_validation_failure(self, mocker):
+    def test_web_app_startup_validation_failure(self, monkeypatch):
         """Test that web app fails startup with invalid model configuration."""
         from fastapi import FastAPI
 
         from src.document_to_anki.web.app import lifespan
 
         # Test validation failure
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
         app = FastAPI()
 
         with pytest.raises(ConfigurationError):
@@ -94,14 +94,15 @@ class TestStartupValidation:
 
             asyncio.run(test_lifespan())
 
-    def test_model_configuration_endpoint_validation(self, mocker):
+    def test_model_configuration_endpoint_validation(self, monkeypatch):
         """Test that model configuration endpoint properly validates current config."""
         import asyncio
 
         from src.document_to_anki.web.app import get_model_configuration
 
         # Test valid configuration
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
 
         async def test_valid_config():
             response = await get_model_configuration()
@@ -112,7 +113,7 @@ class TestStartupValidation:
         asyncio.run(test_valid_config())
 
         # Test invalid configuration
-        mocker.patch.dict(os.environ, {"MODEL": "invalid/model"})
+        monkeypatch.setenv("MODEL", "invalid/model")
 
         async def test_invalid_config():
             response = await get_model_configuration()
@@ -122,34 +123,35 @@ class TestStartupValidation:
 
         asyncio.run(test_invalid_config())
 
-    def test_configuration_validation_with_different_providers(self, mocker):
+    def test_configuration_validation_with_different_providers(self, monkeypatch):
         """Test startup validation with different model providers."""
         # Test Gemini provider
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-pro", "GEMINI_API_KEY": "test-gemini-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-pro")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-gemini-key")
         runner = CliRunner()
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
 
         # Test OpenAI provider
-        mocker.patch.dict(os.environ, {"MODEL": "openai/gpt-4", "OPENAI_API_KEY": "test-openai-key"})
+        monkeypatch.setenv("MODEL", "openai/gpt-4")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-openai-key")
         runner = CliRunner()
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
 
-    def test_default_model_validation_on_startup(self, mocker):
+    def test_default_model_validation_on_startup(self, monkeypatch, clear_model_env):
         """Test that default model is properly validated on startup."""
-        mocker.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}, clear=True)
         # Remove MODEL env var to use default
-        if "MODEL" in os.environ:
-            del os.environ["MODEL"]
+        clear_model_env()
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
 
         runner = CliRunner()
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
 
-    def test_startup_validation_error_recovery_guidance(self, mocker):
+    def test_startup_validation_error_recovery_guidance(self, monkeypatch):
         """Test that startup validation provides recovery guidance."""
-        mocker.patch.dict(os.environ, {"MODEL": "unsupported/model"})
+        monkeypatch.setenv("MODEL", "unsupported/model")
         runner = CliRunner()
         result = runner.invoke(main, ["convert", "test.pdf"])
 
@@ -159,9 +161,10 @@ class TestStartupValidation:
         assert result.exit_code != 0  # Should fail
         # Could check for specific guidance text if needed
 
-    def test_verbose_mode_shows_model_information(self, mocker):
+    def test_verbose_mode_shows_model_information(self, monkeypatch):
         """Test that verbose mode shows model configuration information."""
-        mocker.patch.dict(os.environ, {"MODEL": "gemini/gemini-2.5-flash", "GEMINI_API_KEY": "test-key"})
+        monkeypatch.setenv("MODEL", "gemini/gemini-2.5-flash")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
         runner = CliRunner()
         result = runner.invoke(main, ["--verbose", "--version"])
         assert result.exit_code == 0